@@ -5,14 +5,18 @@ import os
 import typing
 
 
+def check(ret: typing.Any, expected: int | str) -> typing.Any:
+    if ret != expected:
+        raise ValueError(f"{expected=!r} but got {ret=!r} instead")
+    else:
+        return ret
+
+
 def expects(expected: int | str):
     def decorator(f):
         @functools.wraps(f)
         def inner(*args, **kwargs):
-            if (ret := f(*args, **kwargs)) != expected:
-                raise ValueError(f"{expected=!r} but got {ret=!r} instead")
-            else:
-                return ret
+            return check(ret=f(*args, **kwargs), expected=expected)
 
         inner.__expected = expected
         return inner
@@ -20,6 +24,10 @@ def expects(expected: int | str):
     return decorator
 
 
+def get_expected(f) -> int | str | None:
+    return getattr(f, "__expected", None)
+
+
 DO_SLOW_TASKS_ENVVAR = "DO_SLOW_TASKS"
 
 
@@ -28,12 +36,18 @@ def skip_slow(f):
         return f
     else:
 
+        @functools.wraps(f)
         def inner(*args, **kwargs) -> str:
             return f.__expected
 
+        inner.__skipped = True
         return inner
 
 
+def is_skipped(f) -> bool:
+    return getattr(f, "__skipped", False)
+
+
 def count(it: collections.abc.Iterable[typing.Any]) -> int:
     count = 0
     for _ in it:
@@ -1,42 +1,630 @@
+from __future__ import annotations
 import argparse
 import collections.abc
-import importlib
+import contextlib
+import dataclasses
+import functools
+import heapq
+import json
 import os
+import sys
 import pathlib
-import types
+import typing
 
 import aoc2024
+import aoc2024.backend
+import aoc2024.inputcache
+import aoc2024.results
+import aoc2024.runner
 
+# Modules that only one mode needs are imported where that mode runs, so
+# plain runs do not pay for them
+if typing.TYPE_CHECKING:
+    import aoc2024.bench
+    import aoc2024.scheduler
 
-def iter_day_module() -> collections.abc.Iterator[tuple[int, types.ModuleType]]:
+
+# Defaults for those modes' flags, kept here so parsing them imports nothing
+PATH_TO_HISTORY = ".aoc2024/bench.json"
+BENCH_THRESHOLD = 0.1
+# Sub-millisecond parts jitter by more than any threshold
+BENCH_MIN_SECONDS = 0.001
+PROFILE_DIRECTORY = ".aoc2024/profiles"
+PROFILE_TOP = 15
+SAMPLE_DIRECTORY = ".aoc2024/samples"
+SAMPLE_TOP = 15
+MEMORY_TOP = 5
+MATRIX_REPEAT = 3
+MATRIX_SWITCH_INTERVALS = "0.0005,0.05"
+TRACE_FORMATS = ("frames", "events")
+SCALE_FACTORS = "1,2,4,8"
+SERVER_ADDRESS = ".aoc2024/server.sock"
+
+
+Reporter = collections.abc.Callable[
+    [aoc2024.runner.Outcome], collections.abc.Iterable[str]
+]
+
+
+def iter_day_module_name() -> collections.abc.Iterator[tuple[int, str]]:
+    # Only look at file names; modules are imported by whoever runs their parts
     for path in pathlib.Path(__file__).parent.glob("day*.py"):
         name = path.with_suffix("").name
         _, _, day = name.partition("day")
-        yield int(day), importlib.import_module(name=f"aoc2024.{name:s}")
+        yield int(day), f"aoc2024.{name:s}"
+
+
+def report_import(
+    outcome: aoc2024.runner.Outcome,
+) -> collections.abc.Iterator[str]:
+    if outcome.import_seconds:
+        yield f"  import {1e3 * outcome.import_seconds:.3f}ms"
+
+
+# Parts that ran out of budget are neither passes nor wrong answers, so they
+# get an exit status of their own
+EXIT_FAILURE = 1
+EXIT_TIMED_OUT = 3
+
+
+def get_exit_status(failures: int, timeouts: int) -> int:
+    if failures:
+        return EXIT_FAILURE
+    elif timeouts:
+        return EXIT_TIMED_OUT
+    else:
+        return 0
+
+
+def print_outcomes(
+    outcomes: collections.abc.Iterable[aoc2024.runner.Outcome],
+    reporters: collections.abc.Sequence[Reporter],
+) -> tuple[int, int]:
+    failures, timeouts, day = 0, 0, None
+    for outcome in outcomes:
+        if outcome.part.day != day:
+            day = outcome.part.day
+            print(f"> Day {day:d}")
+        if outcome.skipped:
+            print(f"- {outcome.part.name:s} skipped")
+            continue
+        elif outcome.timed_out:
+            timeouts += 1
+            print(f"? {outcome.part.name:s} timed out")
+            continue
+        elif outcome.error is None:
+            print(outcome.answer)
+        else:
+            failures += 1
+            print(f"! {outcome.part.name:s} {outcome.error:s}")
+        for reporter in reporters:
+            for line in reporter(outcome):
+                print(line)
+    return failures, timeouts
+
+
+def print_comparison(
+    parts: collections.abc.Iterable[aoc2024.runner.Part],
+    executor: str,
+    jobs: int,
+    label_to_options: dict[str, aoc2024.runner.Options],
+) -> int:
+    # Runs the parts under both options, interleaved, and compares the second
+    # to the first: same answer, and how much faster
+    parts = list(parts)
+    (label, options), (other_label, other_options) = label_to_options.items()
+    failures, day = 0, None
+    for outcome, other in zip(
+        aoc2024.runner.iter_outcome(
+            parts=parts, executor=executor, jobs=jobs, options=options
+        ),
+        aoc2024.runner.iter_outcome(
+            parts=parts, executor=executor, jobs=jobs, options=other_options
+        ),
+        strict=True,
+    ):
+        if outcome.part.day != day:
+            day = outcome.part.day
+            print(f"> Day {day:d}")
+        if (
+            outcome.error is None
+            and other.error is None
+            and (outcome.answer == other.answer)
+        ):
+            print(
+                f"= {outcome.part.name:s} {outcome.answer}"
+                f" {label:s}={min(outcome.timings):.3f}s"
+                f" {other_label:s}={min(other.timings):.3f}s"
+                f" speedup={min(outcome.timings) / min(other.timings):.2f}x"
+            )
+        else:
+            failures += 1
+            print(
+                f"! {outcome.part.name:s}"
+                f" {label:s}={outcome.error or outcome.answer}"
+                f" {other_label:s}={other.error or other.answer}"
+            )
+    return failures
+
+
+def report_metrics(
+    outcome: aoc2024.runner.Outcome,
+) -> collections.abc.Iterator[str]:
+    if outcome.timings:
+        yield (
+            f"  {1e3 * min(outcome.timings):.3f}ms "
+            + " ".join(
+                f"{name:s}={value:d}" for name, value in sorted(outcome.metrics.items())
+            )
+        ).rstrip()
+
+
+def report_stats(
+    outcome: aoc2024.runner.Outcome,
+) -> collections.abc.Iterator[str]:
+    if outcome.stats:
+        yield "  " + " ".join(
+            f"{name:s}={value:d}" for name, value in sorted(outcome.stats.items())
+        )
+
+
+def report_profile(
+    outcome: aoc2024.runner.Outcome, directory: str, top: int
+) -> collections.abc.Iterator[str]:
+    import aoc2024.profiling
+
+    if outcome.error is None:
+        yield from aoc2024.profiling.iter_top(
+            directory=directory, key=outcome.part.key, top=top
+        )
+
+
+def report_sample(
+    outcome: aoc2024.runner.Outcome, directory: str, top: int
+) -> collections.abc.Iterator[str]:
+    import aoc2024.sampling
+
+    if outcome.error is None:
+        yield from aoc2024.sampling.iter_top(
+            directory=directory, key=outcome.part.key, top=top
+        )
+
+
+def report_memory(
+    outcome: aoc2024.runner.Outcome,
+) -> collections.abc.Iterator[str]:
+    if outcome.memory is not None:
+        yield f"  memory {outcome.memory}"
+        for site in outcome.memory.sites:
+            yield f"    {site}"
+
+
+def get_startup_seconds() -> float:
+    # What importing this module, so everything a run loads before its first
+    # part, costs a fresh interpreter
+    import subprocess
+
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import aoc2024.__main__"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+    for line in stderr.splitlines():
+        _, _, cumulative, name = line.replace(":", "|", 1).split("|")
+        if name.strip() == "aoc2024.__main__":
+            return 1e-6 * int(cumulative)
+    raise RuntimeError(f"no import time for aoc2024.__main__ in {stderr!r}")
+
+
+def get_bench(args: argparse.Namespace) -> aoc2024.bench.Bench:
+    import aoc2024.bench
+
+    return aoc2024.bench.Bench.from_path_to_history(
+        path_to_history=args.bench_history,
+        threshold=args.bench_threshold,
+        min_seconds=args.bench_min_seconds,
+        slow=os.environ.get(aoc2024.DO_SLOW_TASKS_ENVVAR) == "1",
+    )
+
+
+def get_schedule(
+    args: argparse.Namespace, parts: list[aoc2024.runner.Part], jobs: int
+) -> aoc2024.scheduler.Schedule:
+    import aoc2024.scheduler
+
+    return aoc2024.scheduler.Schedule.from_key_to_seconds(
+        parts=parts,
+        key_to_seconds=aoc2024.scheduler.get_key_to_seconds(
+            path_to_history=args.bench_history
+        ),
+        jobs=jobs,
+        target=args.target_seconds,
+        untimed=aoc2024.scheduler.DEFAULT_UNTIMED_SECONDS,
+    )
+
+
+def print_records(
+    outcomes: collections.abc.Iterable[aoc2024.runner.Outcome], f: typing.TextIO
+) -> tuple[int, int]:
+    import aoc2024.batch
 
+    failures = timeouts = 0
+    for outcome in outcomes:
+        failures += outcome.error is not None
+        timeouts += outcome.timed_out
+        print(json.dumps(aoc2024.batch.get_record(outcome=outcome)), file=f)
+    return failures, timeouts
 
-def run_module(day: int, module: types.ModuleType) -> None:
-    print(f"> Day {day:d}")
-    path_to_input = str(pathlib.Path(__file__).parent / f"input{day:02d}.txt")
-    for task in (module.part_one, module.part_two):
-        print(task(path_to_input=path_to_input))
+
+def run_matrix(args: argparse.Namespace, parts: list[aoc2024.runner.Part]) -> int:
+    import aoc2024.matrix
+
+    # Every config runs in its own interpreters, one part at a time
+    matrix = aoc2024.matrix.Matrix(
+        configs=aoc2024.matrix.get_configs(
+            switch_intervals=map(float, args.matrix_switch_intervals.split(","))
+        )
+    )
+    matrix.run(
+        days=sorted({part.day for part in parts}),
+        repeat=args.matrix_repeat,
+        budget=args.budget,
+    )
+    for line in matrix.iter_report():
+        print(line)
+    return 0
+
+
+def run_parity(
+    args: argparse.Namespace,
+    parts: list[aoc2024.runner.Part],
+    jobs: int,
+    options: aoc2024.runner.Options,
+) -> int:
+    # Only days with vectorized kernels can disagree
+    failures = print_comparison(
+        parts=[
+            part for part in parts if part.day in aoc2024.backend.get_vectorized_days()
+        ],
+        executor=args.executor,
+        jobs=jobs,
+        label_to_options={
+            backend: dataclasses.replace(options, backend=backend)
+            for backend in aoc2024.backend.BACKENDS
+        },
+    )
+    return get_exit_status(failures=failures, timeouts=0)
+
+
+def run_speedup(
+    args: argparse.Namespace,
+    parts: list[aoc2024.runner.Part],
+    jobs: int,
+    options: aoc2024.runner.Options,
+) -> int:
+    import aoc2024.parallel
+
+    # Only days that call pmap can get faster
+    failures = print_comparison(
+        parts=[
+            part for part in parts if part.day in aoc2024.parallel.get_parallel_days()
+        ],
+        executor=args.executor,
+        jobs=jobs,
+        label_to_options={
+            "serial": dataclasses.replace(options, workers=1),
+            f"workers{options.workers:d}": options,
+        },
+    )
+    return get_exit_status(failures=failures, timeouts=0)
+
+
+def run_inputs(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+    days: collections.abc.Collection[int],
+    jobs: int,
+    options: aoc2024.runner.Options,
+) -> int:
+    import aoc2024.batch
+
+    if not (
+        parts := aoc2024.batch.get_parts(
+            directory=args.inputs, days=args.day or days, default_days=args.day
+        )
+    ):
+        parser.error(
+            f"no inputs under {args.inputs:s}: name them inputNN*.txt, put"
+            " them under dayNN/ or pass --day"
+        )
+    with (
+        open(file=args.inputs_output, mode="w")
+        if args.inputs_output != "-"
+        else contextlib.nullcontext(sys.stdout)
+    ) as f:
+        failures, timeouts = print_records(
+            outcomes=aoc2024.runner.iter_outcome(
+                parts=parts, executor=args.executor, jobs=jobs, options=options
+            ),
+            f=f,
+        )
+    return get_exit_status(failures=failures, timeouts=timeouts)
+
+
+def run_scale(
+    args: argparse.Namespace,
+    parts: list[aoc2024.runner.Part],
+    jobs: int,
+    options: aoc2024.runner.Options,
+) -> int:
+    import tempfile
+
+    import aoc2024.scaling
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(args.scale_dir or directory)
+        path.mkdir(parents=True, exist_ok=True)
+        part_to_factor = aoc2024.scaling.write_parts(
+            days=sorted({part.day for part in parts}),
+            directory=path,
+            factors=list(map(float, args.scale_factors.split(","))),
+            seed=args.scale_seed,
+        )
+        for line in aoc2024.scaling.iter_report(
+            outcomes=aoc2024.runner.iter_outcome(
+                parts=part_to_factor,
+                executor=args.executor,
+                jobs=jobs,
+                options=options,
+            ),
+            part_to_factor=part_to_factor,
+        ):
+            print(line)
+    return 0
+
+
+def serve(address: str) -> int:
+    import aoc2024.server
+
+    # Flags that change what runs (slow tasks, the input cache) are the
+    # server's; clients that differ are refused
+    aoc2024.server.Server(address=address).serve_forever()
+    return 0
+
+
+def iter_served(
+    address: str,
+    parts: list[aoc2024.runner.Part],
+    options: aoc2024.runner.Options,
+) -> collections.abc.Iterator[aoc2024.runner.Outcome]:
+    import aoc2024.server
+
+    yield from aoc2024.server.iter_outcome(
+        address=address, parts=parts, options=options
+    )
 
 
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--do-slow-tasks", action="store_true")
     parser.add_argument("--day", action="append", default=[], type=int)
+    parser.add_argument("--jobs", default=1, type=int)
+    parser.add_argument(
+        "--executor", choices=aoc2024.runner.EXECUTORS, default="process"
+    )
+    parser.add_argument("--bench", action="store_true")
+    parser.add_argument("--bench-warmup", default=1, type=int)
+    parser.add_argument("--bench-repeat", default=5, type=int)
+    parser.add_argument("--bench-history", default=PATH_TO_HISTORY)
+    parser.add_argument("--bench-threshold", default=BENCH_THRESHOLD, type=float)
+    parser.add_argument("--bench-min-seconds", default=BENCH_MIN_SECONDS, type=float)
+    parser.add_argument("--startup", action="store_true")
+    parser.add_argument(
+        "--input-cache", const=aoc2024.inputcache.DEFAULT_DIRECTORY, nargs="?"
+    )
+    parser.add_argument(
+        "--input-cache-max-bytes",
+        default=aoc2024.inputcache.DEFAULT_MAX_BYTES,
+        type=int,
+    )
+    parser.add_argument("--profile", const=PROFILE_DIRECTORY, nargs="?")
+    parser.add_argument("--profile-top", default=PROFILE_TOP, type=int)
+    parser.add_argument("--sample", const=SAMPLE_DIRECTORY, nargs="?")
+    parser.add_argument(
+        "--sample-interval",
+        default=aoc2024.runner.DEFAULT_SAMPLE_INTERVAL_SECONDS,
+        type=float,
+    )
+    parser.add_argument("--sample-top", default=SAMPLE_TOP, type=int)
+    parser.add_argument("--memory", const=MEMORY_TOP, nargs="?", type=int)
+    parser.add_argument("--max-rss-mb", type=float)
+    parser.add_argument("--metrics", action="store_true")
+    parser.add_argument("--keep-caches", action="store_true")
+    parser.add_argument("--gc", choices=aoc2024.runner.GC_MODES)
+    parser.add_argument("--switch-interval", type=float)
+    parser.add_argument("--matrix", action="store_true")
+    parser.add_argument("--matrix-repeat", default=MATRIX_REPEAT, type=int)
+    parser.add_argument("--matrix-switch-intervals", default=MATRIX_SWITCH_INTERVALS)
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--trace", const="-", nargs="?")
+    parser.add_argument("--trace-format", choices=TRACE_FORMATS, default="frames")
+    parser.add_argument("--budget", type=float)
+    parser.add_argument("--schedule", action="store_true")
+    parser.add_argument("--target-seconds", type=float)
+    parser.add_argument("--scale", action="store_true")
+    parser.add_argument("--scale-dir")
+    parser.add_argument("--scale-factors", default=SCALE_FACTORS)
+    parser.add_argument("--scale-seed", default=0, type=int)
+    parser.add_argument("--inputs")
+    parser.add_argument("--inputs-output", default="-")
+    parser.add_argument("--backend", choices=aoc2024.backend.BACKENDS)
+    parser.add_argument("--parity", action="store_true")
+    parser.add_argument("--workers", default=1, type=int)
+    parser.add_argument("--speedup", action="store_true")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--results", default=aoc2024.results.DEFAULT_PATH_TO_STORE)
+    parser.add_argument("--serve", const=SERVER_ADDRESS, nargs="?")
+    parser.add_argument("--server", const=SERVER_ADDRESS, nargs="?")
     args = parser.parse_args()
 
-    if args.do_slow_tasks:
+    # Budgets, schedules and targets decide what is too slow, instead of
+    # skip_slow; and --speedup is pointless on the stubs it would otherwise time
+    if (
+        args.do_slow_tasks
+        or args.budget is not None
+        or args.schedule
+        or args.target_seconds is not None
+        or args.speedup
+    ):
         os.environ[aoc2024.DO_SLOW_TASKS_ENVVAR] = "1"
-    day_to_module = dict(iter_day_module())
-    for day in sorted(args.day or day_to_module):
-        run_module(
-            day=day,
-            module=day_to_module[day],
+    if args.input_cache:
+        os.environ[aoc2024.inputcache.INPUT_CACHE_ENVVAR] = args.input_cache
+        os.environ[aoc2024.inputcache.INPUT_CACHE_MAX_BYTES_ENVVAR] = str(
+            args.input_cache_max_bytes
         )
-    return 0
+    if args.serve:
+        return serve(address=args.serve)
+    day_to_module_name = dict(iter_day_module_name())
+    if unknown := set(args.day) - set(day_to_module_name):
+        parser.error(f"unknown days: {sorted(unknown)}")
+    parts = [
+        aoc2024.runner.Part(day=day, name=name)
+        for day in sorted(args.day or day_to_module_name)
+        for name in aoc2024.runner.PART_NAMES
+    ]
+    reporters: list[Reporter] = [report_stats]
+    if args.startup:
+        print(f"> Startup {1e3 * get_startup_seconds():.3f}ms")
+        reporters.append(report_import)
+    if args.bench:
+        bench = get_bench(args=args)
+        reporters.append(bench)
+    if args.profile:
+        reporters.append(
+            functools.partial(
+                report_profile, directory=args.profile, top=args.profile_top
+            )
+        )
+    if args.sample:
+        reporters.append(
+            functools.partial(report_sample, directory=args.sample, top=args.sample_top)
+        )
+    if args.memory is not None or args.max_rss_mb is not None:
+        reporters.append(report_memory)
+    if args.metrics:
+        reporters.append(report_metrics)
+    options = aoc2024.runner.Options(
+        backend=args.backend,
+        budget=args.budget,
+        gc=args.gc,
+        keep_caches=args.keep_caches,
+        max_rss=(
+            int(args.max_rss_mb * 1024 * 1024) if args.max_rss_mb is not None else None
+        ),
+        memory_top=args.memory,
+        metrics=args.metrics,
+        profile_dir=args.profile,
+        repeat=args.bench_repeat if args.bench else 1,
+        sample_dir=args.sample,
+        sample_interval=args.sample_interval,
+        switch_interval=args.switch_interval,
+        trace=args.trace,
+        trace_format=args.trace_format,
+        warmup=args.bench_warmup if args.bench else 0,
+        workers=args.workers if args.workers > 0 else os.cpu_count() or 1,
+    )
+
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    if args.matrix:
+        return run_matrix(args=args, parts=parts)
+    elif args.parity:
+        if not aoc2024.backend.has_numpy():
+            parser.error("--parity needs numpy installed")
+        return run_parity(args=args, parts=parts, jobs=jobs, options=options)
+    elif args.speedup:
+        return run_speedup(args=args, parts=parts, jobs=jobs, options=options)
+    elif args.inputs:
+        return run_inputs(
+            parser=parser,
+            args=args,
+            days=day_to_module_name,
+            jobs=jobs,
+            options=options,
+        )
+    elif args.scale:
+        return run_scale(args=args, parts=parts, jobs=jobs, options=options)
+
+    # Outcomes known without running anything
+    ready: list[aoc2024.runner.Outcome] = []
+    if args.schedule or args.target_seconds is not None:
+        schedule = get_schedule(args=args, parts=parts, jobs=jobs)
+        print(
+            f"> Schedule makespan={schedule.makespan:.3f}s"
+            f" skipped={len(schedule.skipped):d}"
+        )
+        parts = schedule.parts
+        ready = [
+            aoc2024.runner.Outcome(part=part, skipped=True) for part in schedule.skipped
+        ]
+
+    # Stored answers stand in for parts whose source and input are unchanged,
+    # unless the run is about measuring them
+    store = None
+    if not (
+        args.no_cache
+        or args.backend is not None
+        or args.bench
+        or args.profile
+        or args.sample
+        or args.memory is not None
+        or args.max_rss_mb is not None
+        or args.metrics
+        or args.workers != 1
+        or args.trace is not None
+        or args.gc is not None
+        or args.switch_interval is not None
+    ):
+        store = aoc2024.results.Store.from_path_to_store(
+            path_to_store=args.results,
+            slow=os.environ.get(aoc2024.DO_SLOW_TASKS_ENVVAR) == "1",
+        )
+        part_to_hit = {
+            part: hit
+            for part in parts
+            if (hit := store.get_outcome(part=part)) is not None
+        }
+        parts = [part for part in parts if part not in part_to_hit]
+        ready = sorted(
+            [*ready, *part_to_hit.values()], key=lambda outcome: outcome.part
+        )
+
+    if args.server:
+        iter_outcome = iter_served(address=args.server, parts=parts, options=options)
+    else:
+        iter_outcome = aoc2024.runner.iter_outcome(
+            parts=parts, executor=args.executor, jobs=jobs, options=options
+        )
+    if store is not None:
+        iter_outcome = store.iter_record(outcomes=iter_outcome)
+    outcomes = heapq.merge(
+        iter_outcome,
+        ready,
+        key=lambda outcome: outcome.part,
+    )
+    if args.json:
+        failures, timeouts = print_records(outcomes=outcomes, f=sys.stdout)
+    else:
+        failures, timeouts = print_outcomes(outcomes=outcomes, reporters=reporters)
+
+    if store is not None:
+        store.save()
+    if args.bench:
+        bench.save()
+        if bench.regressions:
+            print(f"! Regressions: {', '.join(bench.regressions):s}")
+            failures += len(bench.regressions)
+    return get_exit_status(failures=failures, timeouts=timeouts)
 
 
 if __name__ == "__main__":
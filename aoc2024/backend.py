@@ -0,0 +1,46 @@
+import functools
+import importlib
+import importlib.util
+import os
+import pathlib
+
+
+BACKEND_ENVVAR = "AOC2024_BACKEND"
+BACKENDS = ("python", "numpy")
+
+
+@functools.cache
+def has_numpy() -> bool:
+    return importlib.util.find_spec("numpy") is not None
+
+
+def get_backend() -> str:
+    # Read on every call, so one process can switch backends between parts
+    if os.environ.get(BACKEND_ENVVAR) == "numpy" and has_numpy():
+        return "numpy"
+    else:
+        return "python"
+
+
+def get_vectorized_days() -> set[int]:
+    # File names only, like day discovery
+    return {
+        int(path.stem.removeprefix("day"))
+        for path in (pathlib.Path(__file__).parent / "vectorized").glob("day*.py")
+    }
+
+
+def kernel(f):
+    # The pure-Python body stays the fallback; the numpy backend swaps in the
+    # same-named function from aoc2024.vectorized.<day>
+    _, _, name = f.__module__.rpartition(".")
+
+    @functools.wraps(f)
+    def inner(*args, **kwargs):
+        if get_backend() == "numpy":
+            module = importlib.import_module(f"aoc2024.vectorized.{name:s}")
+            return getattr(module, f.__name__)(*args, **kwargs)
+        else:
+            return f(*args, **kwargs)
+
+    return inner
@@ -0,0 +1,48 @@
+import collections.abc
+import pathlib
+import re
+import typing
+
+import aoc2024.runner
+
+
+# Either named like the canonical inputs (input07.txt, input07.x2.txt) or
+# filed directly under a per-day directory (day07/anything.txt). Any other
+# file only runs for the days given with --day, so pointing at a source tree
+# does not pick up day07.py on its own
+DAY = re.compile(r"(?:^|/)(?:input(\d{2})[^/]*\.txt|day(\d{2})/[^/]+)$")
+
+
+def get_parts(
+    directory: str,
+    days: collections.abc.Collection[int],
+    default_days: collections.abc.Collection[int],
+) -> list[aoc2024.runner.Part]:
+    # Files whose path names no day are inputs for each of the default days
+    parts: list[aoc2024.runner.Part] = []
+    for path in sorted(pathlib.Path(directory).rglob("*")):
+        relative = path.relative_to(directory).as_posix()
+        if not path.is_file() or relative.startswith(".") or "/." in relative:
+            continue
+        elif match := DAY.search(relative):
+            path_days = [day] if (day := int(match[1] or match[2])) in days else []
+        else:
+            path_days = sorted(default_days)
+        parts.extend(
+            aoc2024.runner.Part(day=day, name=name, path=str(path))
+            for day in path_days
+            for name in aoc2024.runner.PART_NAMES
+        )
+    return parts
+
+
+def get_record(outcome: aoc2024.runner.Outcome) -> dict[str, typing.Any]:
+    return {
+        "day": outcome.part.day,
+        "part": outcome.part.name,
+        "input": outcome.part.path,
+        "answer": outcome.answer,
+        "error": outcome.error,
+        "seconds": min(outcome.timings) if outcome.timings else None,
+        "timed_out": outcome.timed_out,
+    }
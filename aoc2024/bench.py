@@ -0,0 +1,115 @@
+from __future__ import annotations
+import collections.abc
+import dataclasses
+import json
+import pathlib
+import time
+
+import aoc2024.runner
+
+
+# The baseline is the median of this many recent runs, so one noisy run
+# neither raises a regression nor hides the next one
+WINDOW = 5
+
+
+def get_quantile(timings: collections.abc.Sequence[float], quantile: float) -> float:
+    # Linear interpolation between closest ranks; avoids importing statistics
+    ordered = sorted(timings)
+    position = quantile * (len(ordered) - 1)
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (position - low) * (ordered[high] - ordered[low])
+
+
+@dataclasses.dataclass(frozen=True)
+class Summary:
+    minimum: float
+    median: float
+    p95: float
+
+    @classmethod
+    def from_timings(cls, timings: collections.abc.Sequence[float]) -> Summary:
+        return cls(
+            minimum=min(timings),
+            median=get_quantile(timings=timings, quantile=0.5),
+            p95=get_quantile(timings=timings, quantile=0.95),
+        )
+
+    def __str__(self) -> str:
+        return " ".join(
+            f"{name:s}={1e3 * seconds:.3f}ms"
+            for name, seconds in (
+                ("min", self.minimum),
+                ("median", self.median),
+                ("p95", self.p95),
+            )
+        )
+
+
+@dataclasses.dataclass
+class Bench:
+    path_to_history: pathlib.Path
+    threshold: float
+    min_seconds: float
+    # Whether slow parts really run, as in aoc2024.results.Store
+    slow: bool
+    history: dict[str, list[dict[str, float]]]
+    regressions: list[str] = dataclasses.field(default_factory=list)
+
+    @classmethod
+    def from_path_to_history(
+        cls, path_to_history: str, threshold: float, min_seconds: float, slow: bool
+    ) -> Bench:
+        path = pathlib.Path(path_to_history)
+        return cls(
+            path_to_history=path,
+            threshold=threshold,
+            min_seconds=min_seconds,
+            slow=slow,
+            history=json.loads(path.read_text()) if path.exists() else {},
+        )
+
+    def get_baseline(self, key: str) -> float | None:
+        # Only runs made with slow tasks set the same way are comparable
+        medians = [
+            run["median"]
+            for run in self.history.get(key, [])
+            if run.get("slow") == self.slow
+        ]
+        if not medians:
+            return None
+        else:
+            return get_quantile(timings=medians[-WINDOW:], quantile=0.5)
+
+    def __call__(
+        self, outcome: aoc2024.runner.Outcome
+    ) -> collections.abc.Iterator[str]:
+        if outcome.error is not None or not outcome.timings:
+            return
+        if outcome.stubbed:
+            # skip_slow answered without solving, so there is nothing to time
+            yield f"  {outcome.part.name:s} skipped (slow)"
+            return
+        key = outcome.part.key
+        summary = Summary.from_timings(timings=outcome.timings)
+        line = f"  {outcome.part.name:s} {summary}"
+        if (baseline := self.get_baseline(key=key)) is not None:
+            change = summary.median / baseline - 1
+            line += f" ({100 * change:+.1f}% vs baseline)"
+            if change > self.threshold and summary.median - baseline > self.min_seconds:
+                self.regressions.append(key)
+                line += " REGRESSION"
+        yield line
+        self.history.setdefault(key, []).append(
+            {
+                **dataclasses.asdict(summary),
+                "repeat": len(outcome.timings),
+                "slow": self.slow,
+                "timestamp": time.time(),
+            }
+        )
+
+    def save(self) -> None:
+        self.path_to_history.parent.mkdir(parents=True, exist_ok=True)
+        self.path_to_history.write_text(json.dumps(self.history, indent=2))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+import collections.abc
+import dataclasses
+
+
+@dataclasses.dataclass(eq=False)
+class Bitset:
+    # Members are flat grid indices (or any small non-negative ints), one byte
+    # each rather than one bit: indexing a bytearray is the cheapest
+    # test-and-set Python has, while counting, scanning and unions run in C
+    flags: bytearray
+
+    @classmethod
+    def empty(cls, size: int) -> Bitset:
+        return cls(flags=bytearray(size))
+
+    @classmethod
+    def from_indices(cls, size: int, indices: collections.abc.Iterable[int]) -> Bitset:
+        bitset = cls.empty(size=size)
+        for index in indices:
+            bitset.flags[index] = 1
+        return bitset
+
+    def __contains__(self, index: int) -> bool:
+        return self.flags[index] == 1
+
+    def __len__(self) -> int:
+        return self.popcount()
+
+    def __iter__(self) -> collections.abc.Iterator[int]:
+        # In index order; find skips the unset stretches in C
+        index = self.flags.find(1)
+        while index >= 0:
+            yield index
+            index = self.flags.find(1, index + 1)
+
+    def __ior__(self, other: Bitset) -> Bitset:
+        # The bytes are ORed as one int, so they must line up
+        if len(self.flags) != len(other.flags):
+            raise ValueError(
+                f"sizes differ: {len(self.flags):d} != {len(other.flags):d}"
+            )
+        self.flags[:] = (
+            int.from_bytes(self.flags) | int.from_bytes(other.flags)
+        ).to_bytes(len(self.flags))
+        return self
+
+    def __or__(self, other: Bitset) -> Bitset:
+        union = Bitset(flags=self.flags.copy())
+        union |= other
+        return union
+
+    def add(self, index: int) -> None:
+        self.flags[index] = 1
+
+    def discard(self, index: int) -> None:
+        self.flags[index] = 0
+
+    def test_and_add(self, index: int) -> bool:
+        # Whether it was already a member; either way it is one now
+        if self.flags[index]:
+            return True
+        self.flags[index] = 1
+        return False
+
+    def popcount(self) -> int:
+        return len(self.flags) - self.flags.count(0)
+
+    def clear(self) -> None:
+        self.flags[:] = bytes(len(self.flags))
@@ -0,0 +1,184 @@
+from __future__ import annotations
+import collections.abc
+import dataclasses
+import functools
+import typing
+import weakref
+
+
+POLICIES = ("lru", "lfu")
+MISSING = object()
+
+
+@dataclasses.dataclass
+class Info:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    maxsize: int | None = None
+
+
+@dataclasses.dataclass(eq=False)
+class Store:
+    # eq=False keeps identity hashing, so stores can sit in a WeakSet
+    maxsize: int | None
+    policy: str
+    info: Info
+    entries: dict[typing.Hashable, typing.Any] = dataclasses.field(default_factory=dict)
+    # Least frequently used: each key's use count, and the keys of each count
+    # in the order they reached it, so ties go to the oldest
+    counts: dict[typing.Hashable, int] = dataclasses.field(default_factory=dict)
+    buckets: dict[int, dict[typing.Hashable, None]] = dataclasses.field(
+        default_factory=dict
+    )
+    minimum: int = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def touch(self, key: typing.Hashable) -> None:
+        count = self.counts[key]
+        bucket = self.buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[count]
+            if self.minimum == count:
+                self.minimum += 1
+        self.counts[key] = count + 1
+        self.buckets.setdefault(count + 1, {})[key] = None
+
+    def get(self, key: typing.Hashable) -> typing.Any:
+        if self.maxsize is None:
+            return self.entries.get(key, MISSING)
+        elif self.policy == "lru":
+            # Re-inserting moves the key to the young end of the dict
+            if (value := self.entries.pop(key, MISSING)) is not MISSING:
+                self.entries[key] = value
+            return value
+        elif (value := self.entries.get(key, MISSING)) is not MISSING:
+            self.touch(key=key)
+        return value
+
+    def evict(self) -> None:
+        if self.policy == "lru":
+            del self.entries[next(iter(self.entries))]
+        else:
+            bucket = self.buckets[self.minimum]
+            key = next(iter(bucket))
+            del bucket[key]
+            if not bucket:
+                del self.buckets[self.minimum]
+            del self.counts[key]
+            del self.entries[key]
+        self.info.evictions += 1
+
+    def put(self, key: typing.Hashable, value: typing.Any) -> None:
+        if self.maxsize is not None:
+            # A recursive call may have stored the key already
+            if key in self.entries:
+                return
+            if len(self.entries) >= self.maxsize:
+                self.evict()
+            if self.policy == "lfu":
+                self.counts[key] = 1
+                self.buckets.setdefault(1, {})[key] = None
+                self.minimum = 1
+        self.entries[key] = value
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.counts.clear()
+        self.buckets.clear()
+        self.minimum = 0
+
+
+CACHES: weakref.WeakSet[collections.abc.Callable] = weakref.WeakSet()
+
+
+def get_lru_cache(
+    f: collections.abc.Callable, maxsize: int | None
+) -> collections.abc.Callable:
+    # The C implementation is several times faster on hot recursions; it only
+    # lacks an eviction count, which every miss beyond the current size is
+    cached = functools.lru_cache(maxsize=maxsize)(f)
+    lru_cache_info = cached.cache_info
+
+    def cache_info() -> Info:
+        hits, misses, _, size = lru_cache_info()
+        return Info(
+            hits=hits,
+            misses=misses,
+            evictions=misses - size,
+            size=size,
+            maxsize=maxsize,
+        )
+
+    cached.cache_info = cache_info  # type: ignore[method-assign, assignment]
+    CACHES.add(cached)
+    return cached
+
+
+def memoize(
+    maxsize: int | None = None, policy: str = "lru", per_instance: bool = False
+) -> collections.abc.Callable[[collections.abc.Callable], collections.abc.Callable]:
+    if policy not in POLICIES:
+        raise ValueError(f"{policy=!r} is not one of {POLICIES!r}")
+
+    def decorator(f: collections.abc.Callable) -> collections.abc.Callable:
+        if policy == "lru" and not per_instance:
+            return get_lru_cache(f=f, maxsize=maxsize)
+        info = Info(maxsize=maxsize)
+        shared = Store(maxsize=maxsize, policy=policy, info=info)
+        # Per-instance stores live on their instances and die with them; this
+        # only lets cache_clear reach them
+        stores: weakref.WeakSet[Store] = weakref.WeakSet([shared])
+        attribute = f"_cache_{f.__name__:s}"
+
+        def get_store(instance: typing.Any) -> Store:
+            # Kept in the instance's __dict__, so the instance is never hashed
+            if (store := instance.__dict__.get(attribute)) is None:
+                store = Store(maxsize=maxsize, policy=policy, info=info)
+                instance.__dict__[attribute] = store
+                stores.add(store)
+            return store
+
+        # A plain function rather than a callable object, so calls stay cheap
+        # and methods bind as usual
+        @functools.wraps(f)
+        def inner(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            if per_instance:
+                store = get_store(instance=args[0])
+                key: typing.Hashable = (args[1:], *kwargs.items())
+            else:
+                store = shared
+                key = (args, *kwargs.items())
+            if (value := store.get(key=key)) is not MISSING:
+                info.hits += 1
+                return value
+            info.misses += 1
+            value = f(*args, **kwargs)
+            store.put(key=key, value=value)
+            return value
+
+        def cache_info() -> Info:
+            return dataclasses.replace(info, size=sum(map(len, stores)))
+
+        def cache_clear() -> None:
+            # Counts too, as lru_cache's cache_clear does
+            for store in stores:
+                store.clear()
+            info.hits = info.misses = info.evictions = 0
+
+        inner.cache_info = cache_info  # type: ignore[attr-defined]
+        inner.cache_clear = cache_clear  # type: ignore[attr-defined]
+        CACHES.add(inner)
+        return inner
+
+    return decorator
+
+
+def clear() -> None:
+    # Between calls, so no call is timed on another's warm cache
+    for memoized in list(CACHES):
+        memoized.cache_clear()  # type: ignore[attr-defined]
@@ -0,0 +1,31 @@
+# A coordinate packs a row and a column into one int, row above column, so
+# hashing, equality and ordering (row-major) are the int's own, and moving is
+# plain addition of a packed delta. Columns must stay within +/- 2**15. There
+# is nothing to intern: equal coordinates are equal ints, and sets and dicts
+# compare them by value
+SHIFT = 16
+HALF = 1 << (SHIFT - 1)
+MASK = (1 << SHIFT) - 1
+
+
+Coordinate = int
+
+
+def pack(idx: int, jdx: int) -> Coordinate:
+    return (idx << SHIFT) + jdx
+
+
+def unpack(coordinate: Coordinate) -> tuple[int, int]:
+    # A negative column borrows from the row, which the half offset undoes
+    biased = coordinate + HALF
+    return biased >> SHIFT, (biased & MASK) - HALF
+
+
+def manhattan(coordinate: Coordinate) -> int:
+    idx, jdx = unpack(coordinate=coordinate)
+    return abs(idx) + abs(jdx)
+
+
+# Unit deltas, ordered like aoc2024.grid.DIRECTIONS
+NORTH, EAST, SOUTH, WEST = pack(-1, 0), pack(0, +1), pack(+1, 0), pack(0, -1)
+DELTAS = (NORTH, EAST, SOUTH, WEST)
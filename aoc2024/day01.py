@@ -1,28 +1,47 @@
+import array
 import collections
-
-import more_itertools
+import collections.abc
 
 import aoc2024
+import aoc2024.backend
+import aoc2024.io
+
+
+def read_column_ints(path_to_input: str) -> tuple[array.array, array.array]:
+    values = aoc2024.io.read_ints(path_to_input=path_to_input)
+    return values[0::2], values[1::2]
+
+
+@aoc2024.backend.kernel
+def get_total_distance(
+    lefts: collections.abc.Iterable[int], rights: collections.abc.Iterable[int]
+) -> int:
+    distances = (
+        abs(left - right)
+        for left, right in zip(sorted(lefts), sorted(rights), strict=True)
+    )
+    return sum(distances)
 
 
-def read_column_ints(path_to_input: str) -> tuple[list[int], ...]:
-    with open(file=path_to_input) as f:
-        rows = (tuple(map(int, line.split())) for line in f)
-        columns = more_itertools.unzip(rows)
-        return tuple(map(list, columns))
+@aoc2024.backend.kernel
+def get_similarity_score(
+    lefts: collections.abc.Iterable[int], rights: collections.abc.Iterable[int]
+) -> int:
+    left_to_count, right_to_count = map(collections.Counter, (lefts, rights))
+    scores = (
+        left * count * right_to_count.get(left, 0)
+        for left, count in left_to_count.items()
+    )
+    return sum(scores)
 
 
 @aoc2024.expects(2086478)
 def part_one(path_to_input: str) -> int:
-    lefts, rights = map(sorted, read_column_ints(path_to_input=path_to_input))
-    distances = (abs(left - right) for left, right in zip(lefts, rights, strict=True))
-    return sum(distances)
+    lefts, rights = read_column_ints(path_to_input=path_to_input)
+    return get_total_distance(lefts=lefts, rights=rights)
 
 
 @aoc2024.expects(24941624)
 def part_two(path_to_input: str) -> int:
-    lefts, rights = map(
-        collections.Counter, read_column_ints(path_to_input=path_to_input)
-    )
-    scores = (left * count * rights.get(left, 0) for left, count in lefts.items())
-    return sum(scores)
+    lefts, rights = read_column_ints(path_to_input=path_to_input)
+    return get_similarity_score(lefts=lefts, rights=rights)
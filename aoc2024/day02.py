@@ -3,12 +3,13 @@ import typing
 import more_itertools
 
 import aoc2024
+import aoc2024.backend
+import aoc2024.io
 
 
 def iter_row(path_to_input: str) -> typing.Iterator[tuple[int, ...]]:
-    with open(file=path_to_input) as f:
-        for line in f:
-            yield tuple(map(int, line.split()))
+    for line in aoc2024.io.iter_lines(path_to_input=path_to_input):
+        yield tuple(map(int, line.split()))
 
 
 def is_safe(it: typing.Iterable[int]) -> bool:
@@ -20,19 +21,26 @@ def iter_diff(it: typing.Iterable[int]) -> typing.Iterator[int]:
         yield left - right
 
 
-@aoc2024.expects(252)
-def part_one(path_to_input: str) -> int:
+@aoc2024.backend.kernel
+def count_safe(rows: list[tuple[int, ...]], dampen: bool) -> int:
+    # With the dampener, a row is also safe if dropping one level makes it so
     safe = 0
-    for row in iter_row(path_to_input=path_to_input):
-        safe += is_safe(iter_diff(row))
+    for row in rows:
+        safe += is_safe(iter_diff(row)) or (
+            dampen
+            and any(
+                is_safe(iter_diff((*row[:idx], *row[idx + 1 :])))
+                for idx in range(len(row))
+            )
+        )
     return safe
 
 
+@aoc2024.expects(252)
+def part_one(path_to_input: str) -> int:
+    return count_safe(rows=list(iter_row(path_to_input=path_to_input)), dampen=False)
+
+
 @aoc2024.expects(324)
 def part_two(path_to_input: str) -> int:
-    safe = 0
-    for row in iter_row(path_to_input=path_to_input):
-        safe += is_safe(iter_diff(row)) or any(
-            is_safe(iter_diff((*row[:idx], *row[idx + 1 :]))) for idx in range(len(row))
-        )
-    return safe
+    return count_safe(rows=list(iter_row(path_to_input=path_to_input)), dampen=True)
@@ -4,14 +4,16 @@ import re
 import typing
 
 import aoc2024
+import aoc2024.io
 
 
-PATTERN = re.compile(r"mul\((\d+),(\d+)\)")
+PATTERN = re.compile(rb"mul\((\d+),(\d+)\)")
+CONDITIONAL_PATTERN = re.compile(rb"mul\((\d+),(\d+)\)|(do)\(\)|(don't)\(\)")
 
 
 def iter_multiples(path_to_input: str) -> typing.Iterator[tuple[int, ...]]:
-    with open(file=path_to_input) as f:
-        for match in PATTERN.finditer(string=f.read()):
+    with aoc2024.io.mapped(path_to_input=path_to_input) as buffer:
+        for match in PATTERN.finditer(buffer):
             yield tuple(map(int, match.groups()))
 
 
@@ -25,12 +27,16 @@ def part_one(path_to_input: str) -> int:
 
 
 def iter_conditional_multiples(path_to_input: str) -> typing.Iterator[tuple[int, ...]]:
-    with open(file=path_to_input) as f:
-        payload = f.read()
-    for dos in payload.split("do()"):
-        without_dont, _, _ = dos.partition("don't()")
-        for match in PATTERN.finditer(string=without_dont):
-            yield tuple(map(int, match.groups()))
+    enabled = True
+    with aoc2024.io.mapped(path_to_input=path_to_input) as buffer:
+        for match in CONDITIONAL_PATTERN.finditer(buffer):
+            left, right, do, dont = match.groups()
+            if do is not None:
+                enabled = True
+            elif dont is not None:
+                enabled = False
+            elif enabled:
+                yield int(left), int(right)
 
 
 @aoc2024.expects(88802350)
@@ -1,92 +1,58 @@
-from __future__ import annotations
-import dataclasses
-import functools
-import itertools
-import re
-import typing
+import collections.abc
 
 import aoc2024
-
-
-@dataclasses.dataclass
-class Input:
-    payload: str
-    width: int
-
-    @classmethod
-    def from_path_to_input(cls, path_to_input: str) -> Input:
-        with open(file=path_to_input) as f:
-            payload = f.read()
-        return cls(
-            payload=payload,
-            width=len(next(iter(payload.splitlines()))),
-        )
-
-
-def iter_pattern_one(width: int) -> typing.Iterator[str]:
-    for delimeter in (
-        # HORIZONTAL
-        "",
-        # RIGHT
-        f".{{{2 * width:d}}}",
-        # EVEN
-        f".{{{2 * width - 1:d}}}",
-        # LEFT
-        f".{{{2 * width - 2:d}}}",
-    ):
-        yield delimeter.join("XMAS")
-        yield delimeter.join("SAMX")
-
-
-def iter_re_overlapping(
-    pattern: str,
-    string: str,
-) -> typing.Iterator[str]:
-    pat = re.compile(pattern=pattern)
-    idx = 0
-    while True:
-        if (match := pat.search(string=string[idx:])) is None:
-            return
-        else:
-            idx += match.start() + 1
-            yield match.group()
+import aoc2024.grid
+
+
+DELTAS = tuple(
+    (delta_idx, delta_jdx)
+    for delta_idx in (-1, 0, +1)
+    for delta_jdx in (-1, 0, +1)
+    if delta_idx or delta_jdx
+)
+
+
+def iter_word(
+    grid: aoc2024.grid.Grid, word: bytes
+) -> collections.abc.Iterator[tuple[int, int]]:
+    last = len(word) - 1
+    for index in grid.iter_index(char=word[:1]):
+        idx, jdx = grid.coordinates(index=index)
+        for delta_idx, delta_jdx in DELTAS:
+            if not grid.in_bounds(
+                idx=idx + last * delta_idx, jdx=jdx + last * delta_jdx
+            ):
+                continue
+            stride = delta_idx * grid.width + delta_jdx
+            if all(
+                grid[index + position * stride] == char
+                for position, char in enumerate(word)
+            ):
+                yield index, stride
 
 
 @aoc2024.expects(2557)
 def part_one(path_to_input: str) -> int:
-    inp = Input.from_path_to_input(path_to_input=path_to_input)
+    grid = aoc2024.grid.Grid.from_path_to_input(path_to_input=path_to_input)
+    return aoc2024.count(iter_word(grid=grid, word=b"XMAS"))
 
-    finditer = functools.partial(
-        iter_re_overlapping,
-        string=(" " * inp.width).join(inp.payload.splitlines()),
-    )
-    return aoc2024.count(
-        itertools.chain(*map(finditer, iter_pattern_one(width=inp.width)))
-    )
 
+MS = frozenset(b"MS")
 
-def iter_pattern_two(width: int) -> typing.Iterator[str]:
-    middle = f"{{{2 * width - 2:d}}}A.{{{2 * width - 3:d}}}"
-    for a, b, c, d in (
-        # RIGHT
-        ("M", "S", "M", "S"),
-        # DOWN
-        ("M", "M", "S", "S"),
-        # LEFT
-        ("S", "M", "S", "M"),
-        # UP
-        ("S", "S", "M", "M"),
-    ):
-        yield ".".join((a, b, middle, c, d))
+
+def is_cross(grid: aoc2024.grid.Grid, index: int) -> bool:
+    idx, jdx = grid.coordinates(index=index)
+    if not (0 < idx < grid.height - 1 and 0 < jdx < grid.width - 1):
+        return False
+    else:
+        width = grid.width
+        return (
+            frozenset((grid[index - width - 1], grid[index + width + 1])) == MS
+            and frozenset((grid[index - width + 1], grid[index + width - 1])) == MS
+        )
 
 
 @aoc2024.expects(1854)
 def part_two(path_to_input: str) -> int:
-    inp = Input.from_path_to_input(path_to_input=path_to_input)
-    finditer = functools.partial(
-        iter_re_overlapping,
-        string=(" " * inp.width).join(inp.payload.splitlines()),
-    )
-    return aoc2024.count(
-        itertools.chain(*map(finditer, iter_pattern_two(width=inp.width)))
-    )
+    grid = aoc2024.grid.Grid.from_path_to_input(path_to_input=path_to_input)
+    return sum(is_cross(grid=grid, index=index) for index in grid.iter_index(char=b"A"))
@@ -4,6 +4,8 @@ import itertools
 import typing
 
 import aoc2024
+import aoc2024.inputcache
+import aoc2024.io
 
 
 @dataclasses.dataclass
@@ -12,18 +14,18 @@ class OrdersAndUpdates:
     updates: list[list[int]]
 
 
+@aoc2024.inputcache.cached(version=1)
 def get_orders_and_updates(path_to_input: str) -> OrdersAndUpdates:
     orders = collections.defaultdict(set)
     updates = []
-    with open(file=path_to_input) as f:
-        iter_line = map(str.strip, f.readlines())
-        for line in iter_line:
-            if not line:
-                break
-            before, after = map(int, line.split("|"))
-            orders[before].add(after)
-        for line in iter_line:
-            updates.append(list(map(int, line.split(","))))
+    iter_line = map(bytes.strip, aoc2024.io.iter_lines(path_to_input=path_to_input))
+    for line in iter_line:
+        if not line:
+            break
+        before, after = map(int, line.split(b"|"))
+        orders[before].add(after)
+    for line in iter_line:
+        updates.append(list(map(int, line.split(b","))))
     return OrdersAndUpdates(
         orders=dict(orders),
         updates=updates,
@@ -1,162 +1,135 @@
 from __future__ import annotations
+import collections.abc
 import dataclasses
-import itertools
-import os
-import time
-import typing
+import functools
+
 import aoc2024
+import aoc2024.bitset
+import aoc2024.grid
+import aoc2024.inputcache
+import aoc2024.metrics
+import aoc2024.parallel
+import aoc2024.trace
 
 
-@dataclasses.dataclass(order=True, unsafe_hash=True)
-class Coordinate:
-    idx: int
-    jdx: int
+BLOCK = ord("#")
 
 
 @dataclasses.dataclass
 class State:
-    blocks: tuple[tuple[bool, ...], ...]
-    direction: Coordinate
-    position: Coordinate
+    grid: aoc2024.grid.Grid
+    direction: int
+    position: int
 
     @classmethod
+    @aoc2024.inputcache.cached(version=1)
     def from_path_to_input(cls, path_to_input: str) -> State:
-        with open(file=path_to_input) as f:
-            blocks_lines, position_lines = itertools.tee(f, 2)
-
-            return cls(
-                blocks=tuple(
-                    tuple(char == "#" for char in line.strip()) for line in blocks_lines
-                ),
-                direction=Coordinate(-1, 0),
-                position=next(
-                    Coordinate(idx=idx, jdx=jdx)
-                    for idx, row in enumerate(position_lines)
-                    for jdx, char in enumerate(row)
-                    if char == "^"
-                ),
-            )
-
-    def __next__(self) -> State:
-        return dataclasses.replace(
-            self,
-            position=dataclasses.replace(
-                self.position,
-                idx=self.position.idx + self.direction.idx,
-                jdx=self.position.jdx + self.direction.jdx,
-            ),
-        )
-
-    def __len__(self) -> int:
-        return len(self.blocks)
-
-    @property
-    def is_escaped(self) -> bool:
-        return (
-            self.position.idx < 0
-            or self.position.idx >= len(self)
-            or self.position.jdx < 0
-            or self.position.jdx >= len(self)
+        grid = aoc2024.grid.Grid.from_path_to_input(path_to_input=path_to_input)
+        return cls(
+            grid=grid,
+            direction=aoc2024.grid.NORTH,
+            position=grid.find(char=b"^"),
         )
 
-    @property
-    def is_blocked(self) -> bool:
-        return self.blocks[self.position.idx][self.position.jdx]
-
-    DIRECTION_ROTATION_MAP = {
-        (+1, 0): (0, -1),
-        (0, -1): (-1, 0),
-        (-1, 0): (0, +1),
-        (0, +1): (+1, 0),
+    DIRECTION_STR_MAP = {
+        aoc2024.grid.NORTH: "^",
+        aoc2024.grid.EAST: ">",
+        aoc2024.grid.SOUTH: "v",
+        aoc2024.grid.WEST: "<",
     }
 
-    def rotate(self) -> None:
-        idx, jdx = self.DIRECTION_ROTATION_MAP[(self.direction.idx, self.direction.jdx)]
-        self.direction = dataclasses.replace(self.direction, idx=idx, jdx=jdx)
+    def trace_grid(self, obstacle: int) -> None:
+        # The starting frame; each step then only traces the cells it changes
+        cells = ["#" if cell == BLOCK else " " for cell in self.grid.cells]
+        cells[self.position] = self.DIRECTION_STR_MAP[self.direction]
+        if obstacle >= 0:
+            cells[obstacle] = "O"
+        aoc2024.trace.emit("grid", self.grid.width, "".join(cells))
+
+    def iter_step(
+        self, obstacle: int = -1
+    ) -> collections.abc.Iterator[tuple[int, int]]:
+        # The extra obstacle is checked rather than written into the grid, so
+        # one grid can be walked by many workers at once
+        position, direction = self.position, self.direction
+        steps = 0
+        if aoc2024.trace.ENABLED:
+            self.trace_grid(obstacle=obstacle)
+        try:
+            yield position, direction
+            while (step := self.grid.step(index=position, direction=direction)) >= 0:
+                steps += 1
+                if step == obstacle or self.grid[step] == BLOCK:
+                    direction = aoc2024.grid.turn_right(direction=direction)
+                else:
+                    if aoc2024.trace.ENABLED:
+                        aoc2024.trace.emit("put", position, "X")
+                    position = step
+                if aoc2024.trace.ENABLED:
+                    aoc2024.trace.emit(
+                        "put", position, self.DIRECTION_STR_MAP[direction]
+                    )
+                yield position, direction
+        finally:
+            # Also when the caller stops early, on finding a loop
+            aoc2024.metrics.add(name="day06.steps", count=steps)
+
+    def iter_coordinates(self) -> collections.abc.Iterator[int]:
+        seen = aoc2024.bitset.Bitset.empty(size=len(self.grid))
+        for position, _ in self.iter_step():
+            seen.add(position)
+            if aoc2024.trace.ENABLED:
+                aoc2024.trace.emit("show")
+        yield from seen
+
+
+def is_loop(state: State, obstacle: int) -> bool:
+    # One bit per direction for every cell
+    seen = bytearray(len(state.grid))
+    try:
+        for position, direction in state.iter_step(obstacle=obstacle):
+            if seen[position] & (bit := 1 << direction):
+                return True
+            seen[position] |= bit
+        return False
+    finally:
+        # Only the finished walk, not every step of every candidate
+        if aoc2024.trace.ENABLED:
+            aoc2024.trace.emit("note", f"{state.grid.coordinates(index=obstacle)}")
+            aoc2024.trace.emit("show")
 
-    DIRECTION_STR_MAP = {
-        (-1, 0): "^",
-        (0, +1): ">",
-        (+1, 0): "v",
-        (0, -1): "<",
-    }
 
-    def __str__(self) -> str:
-        basemap = [["#" if blocked else " " for blocked in row] for row in self.blocks]
-        basemap[self.position.idx][self.position.jdx] = self.DIRECTION_STR_MAP[
-            (self.direction.idx, self.direction.jdx)
-        ]
-        return "\n" + "\n".join(" ".join(row) for row in basemap)
-
-    def iter_coordinates(self, debug: bool) -> typing.Iterator[Coordinate]:
-        seen = {self.position}
-        while True:
-            if (step := next(self)).is_escaped:
-                break
-            elif step.is_blocked:
-                self.rotate()
-            else:
-                self = step
-            seen.add(self.position)
-            if debug:
-                print(self)
-                time.sleep(DELAY_SECONDS)
-        yield from sorted(seen)
-
-    def with_obstacle(self, obstacle: Coordinate) -> State:
-        return dataclasses.replace(
-            self,
-            blocks=tuple(
-                tuple(
-                    True if jdx == obstacle.jdx else blocked
-                    for jdx, blocked in enumerate(row)
-                )
-                if idx == obstacle.idx
-                else row
-                for idx, row in enumerate(self.blocks)
-            ),
-        )
+@dataclasses.dataclass
+class Parsed:
+    unobstructed: State
 
+    @functools.cached_property
+    def coordinates(self) -> list[int]:
+        # The guard's path, which part two only needs to block
+        return list(self.unobstructed.iter_coordinates())
 
-def get_debug() -> bool:
-    return os.environ.get("DEBUG", "0") == "1"
 
+def parse(path_to_input: str) -> Parsed:
+    return Parsed(unobstructed=State.from_path_to_input(path_to_input=path_to_input))
 
-DELAY_SECONDS = 0.005
+
+def solve(parsed: Parsed, part: str) -> int:
+    if part == "part_one":
+        return len(parsed.coordinates)
+    else:
+        return sum(
+            aoc2024.parallel.pmap(
+                functools.partial(is_loop, parsed.unobstructed), parsed.coordinates
+            )
+        )
 
 
 @aoc2024.expects(5318)
 def part_one(path_to_input: str) -> int:
-    return aoc2024.count(
-        State.from_path_to_input(path_to_input=path_to_input).iter_coordinates(
-            debug=get_debug()
-        )
-    )
+    return solve(parsed=parse(path_to_input=path_to_input), part="part_one")
 
 
 @aoc2024.skip_slow
 @aoc2024.expects(1831)
 def part_two(path_to_input: str) -> int:
-    debug = get_debug()
-    unobstructed = State.from_path_to_input(path_to_input=path_to_input)
-    loops = 0
-    for obstacle in unobstructed.iter_coordinates(debug=debug):
-        if debug:
-            print(obstacle)
-        obstructed = unobstructed.with_obstacle(obstacle=obstacle)
-        seen = {(obstructed.position, obstructed.direction)}
-        while True:
-            if (step := next(obstructed)).is_escaped:
-                break
-            elif step.is_blocked:
-                obstructed.rotate()
-            elif (step.position, step.direction) in seen:
-                loops += 1
-                break
-            else:
-                obstructed = step
-            seen.add((obstructed.position, obstructed.direction))
-            if debug:
-                print(obstructed)
-                time.sleep(DELAY_SECONDS)
-    return loops
+    return solve(parsed=parse(path_to_input=path_to_input), part="part_two")
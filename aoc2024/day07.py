@@ -1,10 +1,14 @@
 from __future__ import annotations
 import dataclasses
+import functools
 import itertools
 import math
 import operator
 import typing
 import aoc2024
+import aoc2024.inputcache
+import aoc2024.io
+import aoc2024.parallel
 
 
 @dataclasses.dataclass
@@ -13,8 +17,8 @@ class Equation:
     operands: tuple[int, ...]
 
     @classmethod
-    def from_line(cls, line: str) -> Equation:
-        answer_str, _, values_str = line.partition(":")
+    def from_line(cls, line: bytes) -> Equation:
+        answer_str, _, values_str = line.partition(b":")
         return cls(
             expected=int(answer_str),
             operands=tuple(map(int, values_str.split())),
@@ -39,18 +43,24 @@ class Equation:
         return hash((self.expected, self.operands))
 
 
+@aoc2024.inputcache.cached(version=1)
 def get_equations(path_to_input: str) -> list[Equation]:
-    with open(file=path_to_input) as f:
-        return list(map(Equation.from_line, f))
+    return list(
+        map(Equation.from_line, aoc2024.io.iter_lines(path_to_input=path_to_input))
+    )
 
 
 @aoc2024.expects(12553187650171)
 def part_one(path_to_input: str) -> int:
     equations = get_equations(path_to_input=path_to_input)
+    matches = aoc2024.parallel.pmap(
+        functools.partial(Equation.has_match, operators=(operator.add, operator.mul)),
+        equations,
+    )
     return sum(
         equation.expected
-        for equation in equations
-        if equation.has_match(operators=(operator.add, operator.mul))
+        for equation, match in zip(equations, matches, strict=True)
+        if match
     )
 
 
@@ -63,10 +73,14 @@ def concat(a: int, b: int) -> int:
 @aoc2024.expects(96779702119491)
 def part_two(path_to_input: str) -> int:
     equations = get_equations(path_to_input=path_to_input)
+    matches = aoc2024.parallel.pmap(
+        functools.partial(
+            Equation.has_match, operators=(operator.add, operator.mul, concat)
+        ),
+        equations,
+    )
     return sum(
         equation.expected
-        for equation in equations
-        if equation.has_match(
-            operators=(operator.add, operator.mul, concat),
-        )
+        for equation, match in zip(equations, matches, strict=True)
+        if match
     )
@@ -1,90 +1,75 @@
 from __future__ import annotations
 import collections
+import collections.abc
 import dataclasses
 import itertools
-import typing
-import aoc2024
-
-
-@dataclasses.dataclass(order=True)
-class Coordinate:
-    idx: int
-    jdx: int
-
-    def harmonic(self, multiple: int, other: Coordinate) -> Coordinate:
-        delta_idx, delta_jdx = (other.idx - self.idx), (other.jdx - self.jdx)
-        return dataclasses.replace(
-            self,
-            idx=other.idx + multiple * delta_idx,
-            jdx=other.jdx + multiple * delta_jdx,
-        )
-
-    def in_bounds(self, size: int) -> bool:
-        return 0 <= self.idx < size and 0 <= self.jdx < size
 
-    def __hash__(self) -> int:
-        return hash((self.idx, self.jdx))
+import aoc2024
+import aoc2024.coordinate
+import aoc2024.grid
 
 
 @dataclasses.dataclass
 class AntennaGrid:
-    coordinates: set[Coordinate]
-    size: int
-
-    @classmethod
-    def from_tuples(cls, size: int, tuples: set[tuple[int, int]]) -> AntennaGrid:
-        return cls(
-            coordinates={Coordinate(idx=idx, jdx=jdx) for idx, jdx in tuples},
-            size=size,
-        )
+    grid: aoc2024.grid.Grid
+    coordinates: list[aoc2024.coordinate.Coordinate]
 
     def iter_antinodes(
-        self, multiples: typing.Iterable[int]
-    ) -> typing.Iterator[Coordinate]:
+        self, multiples: collections.abc.Iterable[int]
+    ) -> collections.abc.Iterator[int]:
         for left, right in itertools.permutations(self.coordinates, r=2):
+            # Packing is linear, so deltas scale like plain ints
+            delta = right - left
             for multiple in multiples:
                 if (
-                    harmonic := left.harmonic(multiple=multiple, other=right)
-                ).in_bounds(size=self.size):
-                    yield harmonic
+                    index := self.grid.get_index(coordinate=right + multiple * delta)
+                ) < 0:
+                    # Multiples only grow, so the rest are off the grid too
+                    break
+                yield index
+
+
+def get_antenna_grids(
+    path_to_input: str,
+) -> tuple[aoc2024.grid.Grid, list[AntennaGrid]]:
+    grid = aoc2024.grid.Grid.from_path_to_input(path_to_input=path_to_input)
+    freq_to_coordinates = collections.defaultdict(list)
+    for index, char in enumerate(grid.cells):
+        if char not in b".#":
+            freq_to_coordinates[char].append(grid.to_coordinate(index=index))
+    return grid, [
+        AntennaGrid(grid=grid, coordinates=coordinates)
+        for coordinates in freq_to_coordinates.values()
+    ]
 
 
-def get_freq_to_antenna_grid(path_to_input: str) -> dict[str, AntennaGrid]:
-    freq_to_coords = collections.defaultdict(set)
-    with open(file=path_to_input) as f:
-        for idx, line in enumerate(map(str.strip, f)):
-            size = len(line)
-            for jdx, char in enumerate(line):
-                if char not in ".#":
-                    freq_to_coords[char].add((idx, jdx))
-    return {
-        freq: AntennaGrid.from_tuples(
-            size=size,
-            tuples=coords,
-        )
-        for freq, coords in freq_to_coords.items()
-    }
+def count_antinodes(
+    grid: aoc2024.grid.Grid,
+    antenna_grids: list[AntennaGrid],
+    multiples: range,
+) -> int:
+    antinodes = bytearray(len(grid))
+    for antenna_grid in antenna_grids:
+        for antinode in antenna_grid.iter_antinodes(multiples=multiples):
+            antinodes[antinode] = 1
+    return sum(antinodes)
 
 
 @aoc2024.expects(222)
 def part_one(path_to_input: str) -> int:
-    freq_to_antenna_grid = get_freq_to_antenna_grid(path_to_input=path_to_input)
-    antinodes = {
-        antinode
-        for antenna_grid in freq_to_antenna_grid.values()
-        for antinode in antenna_grid.iter_antinodes(multiples=(1,))
-    }
-    return aoc2024.count(antinodes)
+    grid, antenna_grids = get_antenna_grids(path_to_input=path_to_input)
+    return count_antinodes(
+        grid=grid,
+        antenna_grids=antenna_grids,
+        multiples=range(1, 2),
+    )
 
 
 @aoc2024.expects(884)
 def part_two(path_to_input: str) -> int:
-    freq_to_antenna_grid = get_freq_to_antenna_grid(path_to_input=path_to_input)
-    antinodes = {
-        antinode
-        for antenna_grid in freq_to_antenna_grid.values()
-        for antinode in antenna_grid.iter_antinodes(
-            multiples=range(0, antenna_grid.size)
-        )
-    }
-    return aoc2024.count(antinodes)
+    grid, antenna_grids = get_antenna_grids(path_to_input=path_to_input)
+    return count_antinodes(
+        grid=grid,
+        antenna_grids=antenna_grids,
+        multiples=range(0, max(grid.height, grid.width)),
+    )
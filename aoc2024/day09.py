@@ -3,6 +3,10 @@ import dataclasses
 import typing
 
 import aoc2024
+import aoc2024.io
+
+
+ZERO = ord("0")
 
 
 @dataclasses.dataclass
@@ -62,10 +66,17 @@ def compress(head: Node, tail: Node) -> None:
     return None
 
 
+def get_widths(path_to_input: str) -> list[int]:
+    return [
+        char - ZERO
+        for line in aoc2024.io.iter_lines(path_to_input=path_to_input)
+        for char in line.strip()
+    ]
+
+
 @aoc2024.expects(6378826667552)
 def part_one(path_to_input: str) -> int:
-    with open(file=path_to_input) as f:
-        widths = list(map(int, f.read().strip()))
+    widths = get_widths(path_to_input=path_to_input)
 
     head = tail = None
     for idx, width in enumerate(widths, start=1):
@@ -91,8 +102,7 @@ def part_one(path_to_input: str) -> int:
 @aoc2024.skip_slow
 @aoc2024.expects(6413328569890)
 def part_two(path_to_input: str) -> int:
-    with open(file=path_to_input) as f:
-        widths = list(map(int, f.read().strip()))
+    widths = get_widths(path_to_input=path_to_input)
 
     head = tail = None
     for idx, width in enumerate(widths, start=1):
@@ -1,9 +1,11 @@
-import functools
 import math
 import aoc2024
+import aoc2024.cache
+import aoc2024.io
+import aoc2024.metrics
 
 
-@functools.lru_cache(maxsize=None)
+@aoc2024.cache.memoize(maxsize=1 << 18)
 def blink(depth: int, value: int) -> int:
     if depth == 0:
         return 1
@@ -20,13 +22,13 @@ def blink(depth: int, value: int) -> int:
 
 @aoc2024.expects(229043)
 def part_one(path_to_input: str) -> int:
-    with open(file=path_to_input) as f:
-        stones = map(int, f.readline().split())
-    return sum(blink(depth=25, value=value) for value in stones)
+    stones = aoc2024.io.iter_ints(path_to_input=path_to_input)
+    with aoc2024.metrics.cache_hits(name="day11.blink", f=blink):
+        return sum(blink(depth=25, value=value) for value in stones)
 
 
 @aoc2024.expects(272673043446478)
 def part_two(path_to_input: str) -> int:
-    with open(file=path_to_input) as f:
-        stones = map(int, f.readline().split())
-    return sum(blink(depth=75, value=value) for value in stones)
+    stones = aoc2024.io.iter_ints(path_to_input=path_to_input)
+    with aoc2024.metrics.cache_hits(name="day11.blink", f=blink):
+        return sum(blink(depth=75, value=value) for value in stones)
@@ -1,10 +1,10 @@
 from __future__ import annotations
 import dataclasses
-import itertools
-import typing
 import more_itertools
 
 import aoc2024
+import aoc2024.inputcache
+import aoc2024.io
 
 
 class NoSolutionException(Exception): ...
@@ -20,16 +20,9 @@ class Machine:
     py: int
 
     @classmethod
-    def from_lines(cls, *lines: list[str]) -> Machine:
-        (_, _, ax, ay), (_, _, bx, by), (_, px, py) = map(str.split, lines)  # type: ignore
-        return cls(
-            ax=int(ax[2:-1]),
-            ay=int(ay[2:]),
-            bx=int(bx[2:-1]),
-            by=int(by[2:]),
-            px=int(px[2:-1]),
-            py=int(py[2:]),
-        )
+    def from_record(cls, record: bytes) -> Machine:
+        ax, ay, bx, by, px, py = aoc2024.io.parse_ints(buffer=record)
+        return cls(ax=ax, ay=ay, bx=bx, by=by, px=px, py=py)
 
     def get_pushes(self, offset: int) -> tuple[int, int]:
         if self.ax * self.by - self.ay * self.bx == 0:
@@ -54,10 +47,11 @@ class Machine:
             return x0, x1
 
 
-def get_machines(path_to_input: str) -> typing.Iterable[Machine]:
-    with open(file=path_to_input) as f:
-        lines = filter(bool, map(str.strip, f.readlines()))
-    return itertools.starmap(Machine.from_lines, more_itertools.chunked(lines, n=3))
+@aoc2024.inputcache.cached(version=1)
+def get_machines(path_to_input: str) -> list[Machine]:
+    return list(
+        map(Machine.from_record, aoc2024.io.iter_records(path_to_input=path_to_input))
+    )
 
 
 @aoc2024.expects(29517)
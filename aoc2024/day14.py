@@ -5,6 +5,10 @@ import functools
 import operator
 import typing
 import aoc2024
+import aoc2024.backend
+import aoc2024.inputcache
+import aoc2024.io
+import aoc2024.trace
 
 
 @dataclasses.dataclass
@@ -14,34 +18,24 @@ class Robot:
     vx: int
     vy: int
 
-    @classmethod
-    def from_line(cls, line: str) -> Robot:
-        p, v = line.split()
-        return cls(
-            *map(int, p[2:].split(",")),
-            *map(int, v[2:].split(",")),
-        )
-
     def step(self, height: int, width: int) -> Robot:
         self.px = (self.px + self.vx) % width
         self.py = (self.py + self.vy) % height
         return self
 
 
+@aoc2024.inputcache.cached(version=1)
 def get_robots(path_to_input: str) -> list[Robot]:
-    with open(file=path_to_input) as f:
-        return list(map(Robot.from_line, f))
+    values = aoc2024.io.read_ints(path_to_input=path_to_input)
+    return [Robot(*values[idx : idx + 4]) for idx in range(0, len(values), 4)]
 
 
-def show_robots(height: int, robots: list[Robot], width: int) -> str:
-    positions = collections.Counter((robot.py, robot.px) for robot in robots)
-    return "\n".join(
-        "".join(
-            str(positions[(idx, jdx)]) if (idx, jdx) in positions else "."
-            for jdx in range(width)
-        )
-        for idx in range(height)
+def trace_robots(height: int, robots: list[Robot], width: int) -> None:
+    # The consumer counts robots per cell and draws the frame
+    aoc2024.trace.emit(
+        "points", height, width, tuple(robot.py * width + robot.px for robot in robots)
     )
+    aoc2024.trace.emit("show")
 
 
 def get_safety_factor(height: int, robots: list[Robot], width: int) -> int:
@@ -61,9 +55,25 @@ def get_safety_factor(height: int, robots: list[Robot], width: int) -> int:
     )
 
 
-def is_easter_egg(robots: list[Robot]) -> bool:
-    positions = collections.Counter((robot.py, robot.px) for robot in robots)
-    return max(positions.values()) == 1
+def is_easter_egg(robots: list[Robot], width: int) -> bool:
+    # No two robots share a cell. Flat indices, like the grid's, since this runs
+    # every second and they are the cheapest ints to build
+    return len({robot.py * width + robot.px for robot in robots}) == len(robots)
+
+
+@aoc2024.backend.kernel
+def advance(height: int, robots: list[Robot], seconds: int, width: int) -> None:
+    for _ in range(seconds):
+        [robot.step(height=height, width=width) for robot in robots]
+
+
+@aoc2024.backend.kernel
+def count_seconds_to_easter_egg(height: int, robots: list[Robot], width: int) -> int:
+    steps = 0
+    while not is_easter_egg(robots=robots, width=width):
+        [robot.step(height=height, width=width) for robot in robots]
+        steps += 1
+    return steps
 
 
 @aoc2024.expects(221655456)
@@ -71,8 +81,9 @@ def part_one(path_to_input: str) -> int:
     robots = get_robots(path_to_input=path_to_input)
     height = max(robot.py for robot in robots) + 1
     width = max(robot.px for robot in robots) + 1
-    for _ in range(100):
-        [robot.step(height=height, width=width) for robot in robots]
+    advance(height=height, robots=robots, seconds=100, width=width)
+    if aoc2024.trace.ENABLED:
+        trace_robots(height=height, robots=robots, width=width)
     return get_safety_factor(height=height, robots=robots, width=width)
 
 
@@ -81,9 +92,10 @@ def part_two(path_to_input: str) -> int:
     robots = get_robots(path_to_input=path_to_input)
     height = max(robot.py for robot in robots) + 1
     width = max(robot.px for robot in robots) + 1
-
-    steps = 0
-    while not is_easter_egg(robots=robots):
-        [robot.step(height=height, width=width) for robot in robots]
-        steps += 1
-    return steps
+    # Kernels may or may not move the robots they are given
+    start = list(map(dataclasses.replace, robots)) if aoc2024.trace.ENABLED else []
+    seconds = count_seconds_to_easter_egg(height=height, robots=robots, width=width)
+    if aoc2024.trace.ENABLED:
+        advance(height=height, robots=start, seconds=seconds, width=width)
+        trace_robots(height=height, robots=start, width=width)
+    return seconds
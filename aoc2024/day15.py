@@ -1,174 +1,105 @@
 from __future__ import annotations
-import collections
 import dataclasses
-import aoc2024
-
-
-@dataclasses.dataclass
-class Coordinate:
-    idx: int
-    jdx: int
 
-    def __hash__(self) -> int:
-        return hash((self.idx, self.jdx))
+import aoc2024
+import aoc2024.grid
+import aoc2024.inputcache
+import aoc2024.io
+import aoc2024.trace
 
-    def __add__(self, other: Coordinate) -> Coordinate:
-        return dataclasses.replace(
-            self,
-            idx=self.idx + other.idx,
-            jdx=self.jdx + other.jdx,
-        )
 
-    def __sub__(self, other: Coordinate) -> Coordinate:
-        return dataclasses.replace(
-            self,
-            idx=self.idx - other.idx,
-            jdx=self.jdx - other.jdx,
-        )
+BOX, LEFT, RIGHT, SPACE, WALL = map(ord, "O[].#")
+WIDEN = {
+    ord("#"): b"##",
+    ord("O"): b"[]",
+    ord("."): b"..",
+    ord("@"): b"@.",
+}
 
 
 @dataclasses.dataclass
 class State:
-    boxes: set[Coordinate]
+    grid: aoc2024.grid.Grid
     moves: list[str]
-    robot: Coordinate
-    size: int
-    walls: set[Coordinate]
-    widen: bool
+    robot: int
 
     @classmethod
+    @aoc2024.inputcache.cached(version=1)
     def from_path_to_input(cls, path_to_input: str, widen: bool) -> State:
-        grid = collections.defaultdict(set)
-        with open(file=path_to_input) as f:
-            idx = 0
-            for jdx, char in enumerate(f.readline().strip()):
-                grid[char].add(Coordinate(idx=idx, jdx=jdx))
-            size = jdx + 1
-            for idx in range(1, size):
-                for jdx, char in enumerate(f.readline().strip()):
-                    grid[char].add(Coordinate(idx=idx, jdx=jdx))
-            f.readline()
-            moves = [char for line in f.readlines() for char in line.strip()]
-        robot = grid["@"].pop()
+        grid_chunk, moves_chunk = aoc2024.io.iter_records(path_to_input=path_to_input)
+        lines = grid_chunk.splitlines()
         if widen:
-            boxes = {dataclasses.replace(box, jdx=box.jdx * 2) for box in grid["O"]}
-            robot = dataclasses.replace(robot, jdx=robot.jdx * 2)
-            walls = {
-                coordinate
-                for wall in grid["#"]
-                for coordinate in (
-                    Coordinate(idx=wall.idx, jdx=wall.jdx * 2),
-                    Coordinate(idx=wall.idx, jdx=wall.jdx * 2 + 1),
-                )
-            }
-        else:
-            boxes = grid["O"]
-            walls = grid["#"]
-
+            lines = [b"".join(WIDEN[char] for char in line) for line in lines]
+        grid = aoc2024.grid.Grid.from_lines(lines=lines)
         return cls(
-            boxes=boxes,
-            moves=moves,
-            robot=robot,
-            size=size,
-            walls=walls,
-            widen=widen,
+            grid=grid,
+            moves=[
+                char for char in moves_chunk.decode() if char in cls.MOVE_TO_DIRECTION
+            ],
+            robot=grid.find(char=b"@"),
         )
 
     def __str__(self) -> str:
-        return "\n".join(
-            "".join(
-                "#"
-                if (c := Coordinate(idx=idx, jdx=jdx)) in self.walls
-                else "["
-                if c in self.boxes
-                else "@"
-                if c == self.robot
-                else "]"
-                if c + self.MOVE_TO_DIRECTION["<"] in self.boxes
-                else "."
-                for jdx in range(self.size * 2 if self.widen else self.size)
-            )
-            for idx in range(self.size)
-        )
+        return str(self.grid)
+
+    def trace_moved(self, to_move: list[int], offset: int) -> None:
+        # Only the cells this move changed; the consumer keeps the frame
+        for index in to_move:
+            aoc2024.trace.emit("put", index, ".")
+        for index in to_move:
+            aoc2024.trace.emit("put", index + offset, chr(self.grid[index + offset]))
+        aoc2024.trace.emit("show")
 
     MOVE_TO_DIRECTION = {
-        "^": Coordinate(-1, 0),
-        ">": Coordinate(0, +1),
-        "v": Coordinate(+1, 0),
-        "<": Coordinate(0, -1),
+        "^": aoc2024.grid.NORTH,
+        ">": aoc2024.grid.EAST,
+        "v": aoc2024.grid.SOUTH,
+        "<": aoc2024.grid.WEST,
     }
 
     def move(self, move: str) -> State:
-        step = self.robot + (direction := self.MOVE_TO_DIRECTION[move])
-        if step in self.walls:
-            # robot hits the wall
-            ...
-        elif not self.widen and step in self.boxes:
-            boxes = {step}
-            while boxes:
-                if (behind := boxes.pop() + direction) in self.walls:
-                    # boxes are compacted against walls
-                    break
-                elif behind in self.boxes:
-                    boxes.add(behind)
-                else:
-                    continue
-            else:
-                # robot pushes the boxes
-                self.robot = step
-                self.boxes.remove(step)
-                self.boxes.add(behind)
-        elif self.widen and (
-            step in self.boxes
-            or (left := step + self.MOVE_TO_DIRECTION["<"]) in self.boxes
-        ):
-            boxes = {step}
-            if step in self.boxes:
+        offset = self.grid.offsets[self.MOVE_TO_DIRECTION[move]]
+        vertical = move in "^v"
+        # Breadth-first over everything the robot would push; the list grows
+        # while we walk it
+        to_move, queued = [self.robot], {self.robot}
+        for index in to_move:
+            behind = index + offset
+            if (cell := self.grid[behind]) == WALL:
+                # the robot, or a box it pushes, hits a wall
+                return self
+            elif cell == BOX or (cell in (LEFT, RIGHT) and not vertical):
+                pushed: tuple[int, ...] = (behind,)
+            elif cell == LEFT:
                 # The other half of the box is to its right
-                boxes.add(step + self.MOVE_TO_DIRECTION[">"])
-                to_move = {step}
-            else:
+                pushed = (behind, behind + 1)
+            elif cell == RIGHT:
                 # The other half of the box is to its left
-                boxes.add(left)
-                to_move = {left}
-            while boxes:
-                if (behind := boxes.pop() + direction) in self.walls:
-                    break
-                elif (
-                    behind in self.boxes
-                    and behind + self.MOVE_TO_DIRECTION[">"] in self.walls
-                ):
-                    # boxes are compacted against walls
-                    break
-                elif (
-                    behind in self.boxes
-                    and (right := behind + self.MOVE_TO_DIRECTION[">"])
-                    not in self.boxes
-                ):
-                    boxes.add(behind)
-                    to_move.add(behind)
-                    if move in "^v":
-                        boxes.add(right)
-                elif (
-                    behind not in self.boxes
-                    and (left := behind + self.MOVE_TO_DIRECTION["<"]) in self.boxes
-                ):
-                    boxes.add(behind)
-                    if move not in "<>":
-                        boxes.add(left)
-                    to_move.add(left)
-                else:
-                    ...
+                pushed = (behind, behind - 1)
             else:
-                # robot pushes the boxes
-                self.robot = step
-                self.boxes -= to_move
-                self.boxes.update({coordinate + direction for coordinate in to_move})
-        else:
-            # robot moves into open space
-            self.robot = step
+                continue
+            for push in pushed:
+                if push not in queued:
+                    queued.add(push)
+                    to_move.append(push)
+        cells = [self.grid[index] for index in to_move]
+        for index in to_move:
+            self.grid[index] = SPACE
+        for index, cell in zip(to_move, cells, strict=True):
+            self.grid[index + offset] = cell
+        self.robot += offset
+        if aoc2024.trace.ENABLED:
+            self.trace_moved(to_move=to_move, offset=offset)
         return self
 
+    @property
+    def gps(self) -> int:
+        return sum(
+            100 * idx + jdx
+            for char in (b"O", b"[")
+            for idx, jdx in map(self.grid.coordinates, self.grid.iter_index(char=char))
+        )
+
 
 @aoc2024.expects(1398947)
 def part_one(path_to_input: str) -> int:
@@ -176,8 +107,10 @@ def part_one(path_to_input: str) -> int:
         path_to_input=path_to_input,
         widen=False,
     )
+    if aoc2024.trace.ENABLED:
+        aoc2024.trace.emit("grid", m.grid.width, m.grid.cells.decode())
     list(map(m.move, m.moves))
-    return sum(100 * box.idx + box.jdx for box in m.boxes)
+    return m.gps
 
 
 @aoc2024.expects(1397393)
@@ -186,5 +119,7 @@ def part_two(path_to_input: str) -> int:
         path_to_input=path_to_input,
         widen=True,
     )
+    if aoc2024.trace.ENABLED:
+        aoc2024.trace.emit("grid", m.grid.width, m.grid.cells.decode())
     list(map(m.move, m.moves))
-    return sum(100 * box.idx + box.jdx for box in m.boxes)
+    return m.gps
@@ -1,107 +1,83 @@
 from __future__ import annotations
-import collections
+import collections.abc
 import dataclasses
-import heapq
-import typing
+import functools
+
 import aoc2024
+import aoc2024.bitset
+import aoc2024.grid
+import aoc2024.search
+import aoc2024.trace
 
 
-@dataclasses.dataclass
-class Coordinate:
-    idx: int
-    jdx: int
-
-    def __hash__(self) -> int:
-        return hash((self.idx, self.jdx))
-
-    def __add__(self, other: Coordinate) -> Coordinate:
-        return dataclasses.replace(
-            self,
-            idx=self.idx + other.idx,
-            jdx=self.jdx + other.jdx,
-        )
+WALL = ord("#")
+STEP_COST = 1
+TURN_COST = 1000
 
-    def __lt__(self, other: Coordinate) -> bool:
-        return self.idx < other.idx or self.jdx > other.idx
 
+@dataclasses.dataclass
+class Maze:
+    end: int
+    grid: aoc2024.grid.Grid
+    start: int
+
+    @classmethod
+    def from_path_to_input(cls, path_to_input: str) -> Maze:
+        grid = aoc2024.grid.Grid.from_path_to_input(path_to_input=path_to_input)
+        return cls(
+            end=grid.find(char=b"E"),
+            grid=grid,
+            start=grid.find(char=b"S"),
+        )
 
-NORTH = Coordinate(idx=-1, jdx=0)
-EAST = Coordinate(idx=0, jdx=+1)
-SOUTH = Coordinate(idx=+1, jdx=0)
-WEST = Coordinate(idx=0, jdx=-1)
+    # Search nodes pack a cell and a heading as index * 4 + direction
+    def iter_neighbor(self, node: int) -> collections.abc.Iterator[tuple[int, int]]:
+        index, direction = divmod(node, 4)
+        if (step := self.grid.step(index=index, direction=direction)) >= 0 and (
+            self.grid[step] != WALL
+        ):
+            yield step * 4 + direction, STEP_COST
+        yield index * 4 + aoc2024.grid.turn_left(direction=direction), TURN_COST
+        yield index * 4 + aoc2024.grid.turn_right(direction=direction), TURN_COST
+
+    def is_end(self, node: int) -> bool:
+        return node // 4 == self.end
+
+    # Both parts read the same search, so it runs once per maze
+    @functools.cached_property
+    def result(self) -> aoc2024.search.Result:
+        return aoc2024.search.dijkstra(
+            starts=(self.start * 4 + aoc2024.grid.EAST,),
+            iter_neighbor=self.iter_neighbor,
+            is_goal=self.is_end,
+        )
 
 
-LEFT_TURN = {
-    NORTH: WEST,
-    WEST: SOUTH,
-    SOUTH: EAST,
-    EAST: NORTH,
-}
-RIGHT_TURN = {v: k for k, v in LEFT_TURN.items()}
-DIR_TO_STR = {
-    NORTH: "^",
-    WEST: "<",
-    SOUTH: "v",
-    EAST: ">",
-}
+def parse(path_to_input: str) -> Maze:
+    return Maze.from_path_to_input(path_to_input=path_to_input)
 
 
-def show(coords: set[Coordinate]) -> str:
-    size = max(max(_.idx, _.jdx) for _ in coords) + 1
-    return "\n".join(
-        "".join("o" if Coordinate(idx, jdx) in coords else " " for jdx in range(size))
-        for idx in range(size)
+def solve(parsed: Maze, part: str) -> int:
+    if part == "part_one":
+        return parsed.result.distance
+    nodes = parsed.result.get_nodes_on_shortest_paths(nodes=parsed.result.goals)
+    # Tiles rather than nodes, which also count the heading
+    tiles = aoc2024.bitset.Bitset.from_indices(
+        size=len(parsed.grid), indices=(node // 4 for node in nodes)
     )
+    if aoc2024.trace.ENABLED:
+        aoc2024.trace.emit("grid", parsed.grid.width, parsed.grid.cells.decode())
+        for index in tiles:
+            aoc2024.trace.emit("put", index, "O")
+        aoc2024.trace.emit("show")
+    return tiles.popcount()
 
 
-def iter_score_path(
-    path_to_input: str,
-) -> typing.Iterator[tuple[int, list[Coordinate]]]:
-    with open(file=path_to_input) as f:
-        char_to_coords = collections.defaultdict(set)
-        for idx, line in enumerate(f.readlines()):
-            for jdx, char in enumerate(line.strip()):
-                char_to_coords[char].add(Coordinate(idx=idx, jdx=jdx))
-    heap = [(0, [char_to_coords["S"].pop()], EAST)]
-    paths = char_to_coords["."]
-    tail = char_to_coords["E"].pop()
-    seen = set()
-    while True:
-        try:
-            score, path, dir = heapq.heappop(heap)
-        except IndexError:
-            return
-        node = path[-1]
-        if node == tail:
-            yield score, path
-        else:
-            for turn, margin in (
-                (dir, 1),
-                (LEFT_TURN[dir], 1001),
-                (RIGHT_TURN[dir], 1001),
-            ):
-                if ((step := node + turn), turn) not in seen and (
-                    step == tail or step in paths
-                ):
-                    heapq.heappush(heap, (score + margin, path + [step], turn))
-        seen.add((node, dir))
-
-
-@aoc2024.skip_slow
 @aoc2024.expects(102488)
 def part_one(path_to_input: str) -> int:
-    score, _ = next(iter_score_path(path_to_input=path_to_input))
-    return score
+    return solve(parsed=parse(path_to_input=path_to_input), part="part_one")
 
 
-@aoc2024.skip_slow
 @aoc2024.expects(559)
 def part_two(path_to_input: str) -> int:
-    lowest_score = float("inf")
-    best_paths = set()
-    for score, path in iter_score_path(path_to_input=path_to_input):
-        if score <= lowest_score:
-            best_paths.update(path)
-        else:
-            break
-    return len(best_paths)
+    return solve(parsed=parse(path_to_input=path_to_input), part="part_two")
@@ -3,6 +3,8 @@ import dataclasses
 import itertools
 import typing
 import aoc2024
+import aoc2024.inputcache
+import aoc2024.io
 
 
 @dataclasses.dataclass
@@ -15,19 +17,11 @@ class State:
     idx: int = 0
 
     @classmethod
+    @aoc2024.inputcache.cached(version=1)
     def from_path_to_input(cls, path_to_input: str) -> State:
-        with open(file=path_to_input) as f:
-            _, _, a = f.readline().rpartition(" ")
-            _, _, b = f.readline().rpartition(" ")
-            _, _, c = f.readline().rpartition(" ")
-            f.readline()
-            _, _, program = f.readline().rpartition(" ")
-            return cls(
-                a=int(a),
-                b=int(b),
-                c=int(c),
-                program=list(map(int, program.split(","))),
-            )
+        # Registers are unbounded, too big for read_ints once inputs are scaled
+        a, b, c, *program = aoc2024.io.iter_ints(path_to_input=path_to_input)
+        return cls(a=a, b=b, c=c, program=program)
 
     @property
     def iter_instruction_operand(self) -> typing.Iterator[tuple[int, int]]:
@@ -1,81 +1,77 @@
 from __future__ import annotations
+import collections.abc
 import dataclasses
-import heapq
-import typing
-import aoc2024
-
-
-@dataclasses.dataclass
-class Coordinate:
-    idx: int
-    jdx: int
+import functools
 
-    def __hash__(self) -> int:
-        return hash((self.idx, self.jdx))
+import aoc2024
+import aoc2024.coordinate
+import aoc2024.grid
+import aoc2024.io
+import aoc2024.search
 
-    def __lt__(self, other: Coordinate) -> bool:
-        return self.idx > other.idx or self.jdx > other.jdx
 
-    def iter_neighbor(self, size: int) -> typing.Iterator[Coordinate]:
-        for idx, jdx in (
-            (-1, 0),
-            (0, +1),
-            (+1, 0),
-            (0, -1),
-        ):
-            if (0 <= self.idx + idx < size) and (0 <= self.jdx + jdx < size):
-                yield dataclasses.replace(self, idx=self.idx + idx, jdx=self.jdx + jdx)
+WALL = ord("#")
 
 
 @dataclasses.dataclass
 class State:
     size: int
-    walls: list[Coordinate]
+    walls: list[aoc2024.coordinate.Coordinate]
 
     @classmethod
     def from_path_to_input(cls, path_to_input: str) -> State:
-        with open(file=path_to_input) as f:
-            walls = [
-                Coordinate(*map(int, line.strip().split(","))) for line in f.readlines()
-            ]
-        size = max(max(coord.idx, coord.jdx) for coord in walls) + 1
+        values = aoc2024.io.read_ints(path_to_input=path_to_input)
         return cls(
-            size=size,
-            walls=walls,
+            size=max(values) + 1,
+            walls=[
+                aoc2024.coordinate.pack(idx=idx, jdx=jdx)
+                for idx, jdx in zip(values[0::2], values[1::2], strict=True)
+            ],
         )
 
-    def get_path(self, num_coords: int) -> list[Coordinate]:
-        heap: list[tuple[int, Coordinate, list[Coordinate]]] = [
-            (0, Coordinate(idx=0, jdx=0), [])
-        ]
-        goal = Coordinate(idx=self.size - 1, jdx=self.size - 1)
-        seen = set()
-        walls = set(self.walls[:num_coords])
-        while heap:
-            depth, step, path = heapq.heappop(heap)
-            if step == goal:
-                return path
-            elif step in seen:
-                continue
-            else:
-                for neighbor in step.iter_neighbor(size=self.size):
-                    if neighbor not in walls:
-                        heapq.heappush(heap, (depth + 1, neighbor, path + [step]))
-                seen.add(step)
-        else:
+    @functools.cached_property
+    def indices(self) -> list[int]:
+        # Where the walls fall, once rather than on every binary search step
+        grid = aoc2024.grid.Grid.filled(height=self.size, width=self.size)
+        return [grid.get_index(coordinate=wall) for wall in self.walls]
+
+    def get_grid(self, num_coords: int) -> aoc2024.grid.Grid:
+        grid = aoc2024.grid.Grid.filled(height=self.size, width=self.size)
+        for index in self.indices[:num_coords]:
+            grid[index] = WALL
+        return grid
+
+    def get_path(self, num_coords: int) -> list[int]:
+        grid = self.get_grid(num_coords=num_coords)
+        goal = len(grid) - 1
+
+        def iter_neighbor(index: int) -> collections.abc.Iterator[int]:
+            for neighbor in grid.iter_neighbor(index=index):
+                if grid[neighbor] != WALL:
+                    yield neighbor
+
+        result = aoc2024.search.bfs(
+            starts=(0,),
+            iter_neighbor=iter_neighbor,
+            is_goal=goal.__eq__,
+        )
+        if not result.goals:
             raise ValueError
+        else:
+            return result.get_path(node=goal)
 
 
 @aoc2024.expects(280)
 def part_one(path_to_input: str) -> int:
     state = State.from_path_to_input(path_to_input=path_to_input)
-    return len(state.get_path(num_coords=1024))
+    # Steps taken, so the start does not count
+    return len(state.get_path(num_coords=1024)) - 1
 
 
 @aoc2024.expects("28,56")
 def part_two(path_to_input: str) -> str:
     state = State.from_path_to_input(path_to_input=path_to_input)
-    low, high = 0, 4000
+    low, high = 0, len(state.walls)
     while high - low > 1:
         middle = (high + low) // 2
         try:
@@ -85,5 +81,5 @@ def part_two(path_to_input: str) -> str:
         else:
             low = middle
     else:
-        corrupting_wall = state.walls[high - 1]
-        return f"{corrupting_wall.idx:d},{corrupting_wall.jdx:d}"
+        idx, jdx = aoc2024.coordinate.unpack(coordinate=state.walls[high - 1])
+        return f"{idx:d},{jdx:d}"
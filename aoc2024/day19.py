@@ -3,6 +3,10 @@ import collections
 import dataclasses
 import functools
 import aoc2024
+import aoc2024.cache
+import aoc2024.inputcache
+import aoc2024.io
+import aoc2024.metrics
 
 
 @dataclasses.dataclass
@@ -10,15 +14,14 @@ class State:
     designs: tuple[str, ...]
     patterns: set[str]
 
-    def __hash__(self) -> int:
-        return hash((self.designs, tuple(sorted(self.patterns))))
-
     @classmethod
+    @aoc2024.inputcache.cached(version=1)
     def from_path_to_input(cls, path_to_input: str) -> State:
-        with open(file=path_to_input) as f:
-            patterns = set(f.readline().strip().split(", "))
-            f.readline()
-            designs = tuple(map(str.strip, f.readlines()))
+        patterns_record, designs_record = aoc2024.io.iter_records(
+            path_to_input=path_to_input
+        )
+        patterns = set(patterns_record.decode().split(", "))
+        designs = tuple(designs_record.decode().split())
         return cls(
             designs=designs,
             patterns=patterns,
@@ -54,7 +57,7 @@ class State:
         else:
             return False
 
-    @functools.cache
+    @aoc2024.cache.memoize(maxsize=1 << 16, per_instance=True)
     def num_matches(self, design: str) -> int:
         if not design:
             # A match has been completed
@@ -76,4 +79,5 @@ def part_one(path_to_input: str) -> int:
 @aoc2024.expects(848076019766013)
 def part_two(path_to_input: str) -> int:
     state = State.from_path_to_input(path_to_input=path_to_input)
-    return sum(map(state.num_matches, state.designs))
+    with aoc2024.metrics.cache_hits(name="day19.num_matches", f=State.num_matches):
+        return sum(map(state.num_matches, state.designs))
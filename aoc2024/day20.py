@@ -1,81 +1,91 @@
 from __future__ import annotations
+import array
 import collections
+import collections.abc
 import dataclasses
-import typing
-import aoc2024
 
+import aoc2024
+import aoc2024.backend
+import aoc2024.coordinate
+import aoc2024.grid
+import aoc2024.search
 
-@dataclasses.dataclass(frozen=True, slots=True)
-class Coordinate:
-    idx: int
-    jdx: int
 
-    def iter_neighbor(self, radius: int) -> typing.Iterator[tuple[int, Coordinate]]:
-        for idx in range(-radius, radius + 1):
-            for jdx in range(-radius, radius + 1):
-                if 0 < (cheat_cost := abs(idx) + abs(jdx)) <= radius:
-                    yield (
-                        cheat_cost,
-                        dataclasses.replace(
-                            self,
-                            idx=self.idx + idx,
-                            jdx=self.jdx + jdx,
-                        ),
-                    )
+WALL = ord("#")
 
 
 @dataclasses.dataclass
 class Track:
-    end: Coordinate
-    path: set[Coordinate]
-    start: Coordinate
-    walls: set[Coordinate]
+    end: int
+    grid: aoc2024.grid.Grid
+    start: int
 
     @classmethod
     def from_path_to_input(cls, path_input: str) -> Track:
-        chars = collections.defaultdict(set)
-        with open(file=path_input) as f:
-            for idx, line in enumerate(f.readlines()):
-                for jdx, char in enumerate(line.strip()):
-                    chars[char].add(Coordinate(idx=idx, jdx=jdx))
+        grid = aoc2024.grid.Grid.from_path_to_input(path_to_input=path_input)
         return cls(
-            end=chars["E"].pop(),
-            path=chars["."],
-            start=chars["S"].pop(),
-            walls=chars["#"],
+            end=grid.find(char=b"E"),
+            grid=grid,
+            start=grid.find(char=b"S"),
         )
 
-    def iter_savings(self, skip_distance: int) -> typing.Iterator[int]:
-        step, depth = self.start, 1
-        step_index = {step: depth}
-        while step != self.end:
-            # these are honest steps; work on them first so we populate
-            # the cache for them
-            (step,) = (
-                neighbor
-                for _, neighbor in step.iter_neighbor(radius=1)
-                if (neighbor in self.path or neighbor == self.end)
-                and neighbor not in step_index
-            )
-            depth += 1
-            step_index[step] = depth
+    def iter_neighbor(self, index: int) -> collections.abc.Iterator[int]:
+        for neighbor in self.grid.iter_neighbor(index=index):
+            if self.grid[neighbor] != WALL:
+                yield neighbor
+
+    def get_depths(self) -> array.array:
+        # Depth along the (single) honest path, -1 for cells off the path
+        depths = array.array("q", [-1]) * len(self.grid)
+        result = aoc2024.search.bfs(
+            starts=(self.start,),
+            iter_neighbor=self.iter_neighbor,
+            is_goal=self.end.__eq__,
+        )
+        for step, depth in result.distances.items():
+            depths[step] = depth
+        return depths
+
+    def iter_savings(self, skip_distance: int) -> collections.abc.Iterator[int]:
+        # Keyed by coordinate, so a cheat off the grid (or off the path) just
+        # misses, without bounds checks
+        coordinate_to_depth = {
+            self.grid.to_coordinate(index=step): depth
+            for step, depth in enumerate(self.get_depths())
+            if depth >= 0
+        }
+        cheats = [
+            (aoc2024.coordinate.pack(idx=delta_idx, jdx=delta_jdx), cheat_cost)
+            for delta_idx in range(-skip_distance, skip_distance + 1)
+            for delta_jdx in range(-skip_distance, skip_distance + 1)
+            if 0 < (cheat_cost := abs(delta_idx) + abs(delta_jdx)) <= skip_distance
+        ]
+        get = coordinate_to_depth.get
         yield 0
-        for step, depth in step_index.items():
-            for cheat_cost, neighbor in step.iter_neighbor(radius=skip_distance):
-                if neighbor in self.path or neighbor == self.end:
-                    if (savings := step_index[neighbor] - depth - cheat_cost) > 0:
-                        yield savings
+        for coordinate, depth in coordinate_to_depth.items():
+            for delta, cheat_cost in cheats:
+                # Misses count as a negative depth, so never save time
+                if (savings := get(coordinate + delta, -1) - depth - cheat_cost) > 0:
+                    yield savings
+
+
+@aoc2024.backend.kernel
+def count_cheats(track: Track, skip_distance: int, minimum: int) -> int:
+    savings_to_count = collections.Counter(
+        track.iter_savings(skip_distance=skip_distance)
+    )
+    return sum(
+        count for savings, count in savings_to_count.items() if savings >= minimum
+    )
 
 
 @aoc2024.expects(1286)
 def part_one(path_to_input: str) -> int:
     track = Track.from_path_to_input(path_input=path_to_input)
-    savings_to_count = collections.Counter(track.iter_savings(skip_distance=2))
-    return sum(count for savings, count in savings_to_count.items() if savings >= 100)
+    return count_cheats(track=track, skip_distance=2, minimum=100)
 
 
 @aoc2024.expects(989316)
 def part_two(path_to_input: str) -> int:
     track = Track.from_path_to_input(path_input=path_to_input)
-    savings_to_count = collections.Counter(track.iter_savings(skip_distance=20))
-    return sum(count for savings, count in savings_to_count.items() if savings >= 100)
+    return count_cheats(track=track, skip_distance=20, minimum=100)
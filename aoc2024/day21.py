@@ -5,28 +5,37 @@ import itertools
 import more_itertools
 
 import aoc2024
+import aoc2024.cache
+import aoc2024.coordinate
+import aoc2024.io
+import aoc2024.metrics
 
 
 def iter_code(path_to_input: str) -> collections.abc.Iterator[str]:
-    with open(file=path_to_input) as f:
-        yield from map(str.strip, f)
+    for line in aoc2024.io.iter_lines(path_to_input=path_to_input):
+        yield line.strip().decode()
 
 
-CHUNK_CACHE: dict[str, list[set[str]]] = {}
+DELTA_TO_ARROW = {
+    aoc2024.coordinate.NORTH: "^",
+    aoc2024.coordinate.EAST: ">",
+    aoc2024.coordinate.SOUTH: "v",
+    aoc2024.coordinate.WEST: "<",
+}
 
 
 class Pad:
-    COORDINATES: dict[str, tuple[int, int]]
+    COORDINATES: dict[str, aoc2024.coordinate.Coordinate]
 
     @classmethod
     def get_edges(cls) -> dict[str, dict[str, str]]:
         return {
             start: {
-                ("<" if x2 < x1 else ">" if x1 < x2 else "v" if y1 < y2 else "^"): end
-                for end, (x2, y2) in cls.COORDINATES.items()
-                if (x1 == x2 and abs(y2 - y1) == 1) or (abs(x2 - x1) == 1 and y1 == y2)
+                DELTA_TO_ARROW[end_coordinate - start_coordinate]: end
+                for end, end_coordinate in cls.COORDINATES.items()
+                if end_coordinate - start_coordinate in DELTA_TO_ARROW
             }
-            for start, (x1, y1) in cls.COORDINATES.items()
+            for start, start_coordinate in cls.COORDINATES.items()
         }
 
     @classmethod
@@ -58,13 +67,12 @@ class Pad:
         }
 
     @classmethod
+    @aoc2024.cache.memoize(maxsize=1 << 10, policy="lfu")
     def get_paths_for_chunk(cls, chunk: str) -> list[set[str]]:
-        if chunk not in CHUNK_CACHE:
-            CHUNK_CACHE[chunk] = [
-                cls.get_paths_for_pair(start=start, end=end)
-                for start, end in itertools.pairwise("A" + chunk)
-            ]
-        return CHUNK_CACHE[chunk]
+        return [
+            cls.get_paths_for_pair(start=start, end=end)
+            for start, end in itertools.pairwise("A" + chunk)
+        ]
 
     @classmethod
     def iter_paths_for_sequence(cls, seq: str) -> collections.abc.Iterator[str]:
@@ -80,27 +88,27 @@ class Pad:
 
 class NumberPad(Pad):
     COORDINATES = {
-        "7": (0, 0),
-        "8": (1, 0),
-        "9": (2, 0),
-        "4": (0, 1),
-        "5": (1, 1),
-        "6": (2, 1),
-        "1": (0, 2),
-        "2": (1, 2),
-        "3": (2, 2),
-        "0": (1, 3),
-        "A": (2, 3),
+        "7": aoc2024.coordinate.pack(idx=0, jdx=0),
+        "8": aoc2024.coordinate.pack(idx=0, jdx=1),
+        "9": aoc2024.coordinate.pack(idx=0, jdx=2),
+        "4": aoc2024.coordinate.pack(idx=1, jdx=0),
+        "5": aoc2024.coordinate.pack(idx=1, jdx=1),
+        "6": aoc2024.coordinate.pack(idx=1, jdx=2),
+        "1": aoc2024.coordinate.pack(idx=2, jdx=0),
+        "2": aoc2024.coordinate.pack(idx=2, jdx=1),
+        "3": aoc2024.coordinate.pack(idx=2, jdx=2),
+        "0": aoc2024.coordinate.pack(idx=3, jdx=1),
+        "A": aoc2024.coordinate.pack(idx=3, jdx=2),
     }
 
 
 class ArrowPad(Pad):
     COORDINATES = {
-        "^": (1, 0),
-        "<": (0, 1),
-        ">": (2, 1),
-        "A": (2, 0),
-        "v": (1, 1),
+        "^": aoc2024.coordinate.pack(idx=0, jdx=1),
+        "<": aoc2024.coordinate.pack(idx=1, jdx=0),
+        ">": aoc2024.coordinate.pack(idx=1, jdx=2),
+        "A": aoc2024.coordinate.pack(idx=0, jdx=2),
+        "v": aoc2024.coordinate.pack(idx=1, jdx=1),
     }
 
 
@@ -135,20 +143,26 @@ def item_to_complexity(code: str, sequence: str) -> int:
 
 @aoc2024.expects(213536)
 def part_one(path_to_input: str) -> int:
-    return sum(
-        item_to_complexity(
-            code=code, sequence=get_shortest_sequence(code=code, depth=2)
+    with aoc2024.metrics.cache_hits(
+        name="day21.chunk_cache", f=Pad.get_paths_for_chunk
+    ):
+        return sum(
+            item_to_complexity(
+                code=code, sequence=get_shortest_sequence(code=code, depth=2)
+            )
+            for code in iter_code(path_to_input=path_to_input)
         )
-        for code in iter_code(path_to_input=path_to_input)
-    )
 
 
 @aoc2024.skip_slow
 @aoc2024.expects(258369757013802)
 def part_two(path_to_input: str) -> int:
-    return sum(
-        item_to_complexity(
-            code=code, sequence=get_shortest_sequence(code=code, depth=26)
+    with aoc2024.metrics.cache_hits(
+        name="day21.chunk_cache", f=Pad.get_paths_for_chunk
+    ):
+        return sum(
+            item_to_complexity(
+                code=code, sequence=get_shortest_sequence(code=code, depth=26)
+            )
+            for code in iter_code(path_to_input=path_to_input)
         )
-        for code in iter_code(path_to_input=path_to_input)
-    )
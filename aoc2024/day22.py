@@ -1,9 +1,15 @@
+from __future__ import annotations
+import array
 import collections
 import collections.abc
 import dataclasses
+import functools
 import itertools
 
 import aoc2024
+import aoc2024.backend
+import aoc2024.io
+import aoc2024.parallel
 
 
 @dataclasses.dataclass
@@ -37,28 +43,63 @@ class RNG:
         return self
 
 
-def iter_rng(path_to_input: str) -> collections.abc.Iterator[RNG]:
-    with open(file=path_to_input) as f:
-        for secret in map(int, f):
-            yield RNG(secret=secret)
+ROUNDS = 2000
 
 
-@aoc2024.expects(16039090236)
-def part_one(path_to_input: str) -> int:
-    ret = 0
-    for rng in iter_rng(path_to_input=path_to_input):
-        aoc2024.exhaust(itertools.islice(rng, 2000))
-        ret += rng.secret
-    return ret
+def run(secret: int, rounds: int) -> RNG:
+    rng = RNG(secret=secret)
+    aoc2024.exhaust(itertools.islice(rng, rounds))
+    return rng
 
 
-@aoc2024.expects(1808)
-def part_two(path_to_input: str) -> int:
+@dataclasses.dataclass
+class Buyers:
+    secrets: array.array
+    rounds: int
+
+    @functools.cached_property
+    def rngs(self) -> list[RNG]:
+        # Every buyer's run serves both parts. Buyers are independent, so
+        # each can run on its own worker
+        return aoc2024.parallel.pmap(
+            functools.partial(run, rounds=self.rounds), self.secrets
+        )
+
+
+@aoc2024.backend.kernel
+def get_secret_total(buyers: Buyers) -> int:
+    return sum(rng.secret for rng in buyers.rngs)
+
+
+@aoc2024.backend.kernel
+def get_best_price_total(buyers: Buyers) -> int:
     changes_to_total: dict[tuple[int, int, int, int], int] = collections.defaultdict(
         int
     )
-    for rng in iter_rng(path_to_input=path_to_input):
-        aoc2024.exhaust(itertools.islice(rng, 2000))
+    for rng in buyers.rngs:
         for changes, price in rng.changes_to_price.items():
             changes_to_total[changes] += price
     return max(changes_to_total.values())
+
+
+def parse(path_to_input: str) -> Buyers:
+    return Buyers(
+        secrets=aoc2024.io.read_ints(path_to_input=path_to_input), rounds=ROUNDS
+    )
+
+
+def solve(parsed: Buyers, part: str) -> int:
+    if part == "part_one":
+        return get_secret_total(buyers=parsed)
+    else:
+        return get_best_price_total(buyers=parsed)
+
+
+@aoc2024.expects(16039090236)
+def part_one(path_to_input: str) -> int:
+    return solve(parsed=parse(path_to_input=path_to_input), part="part_one")
+
+
+@aoc2024.expects(1808)
+def part_two(path_to_input: str) -> int:
+    return solve(parsed=parse(path_to_input=path_to_input), part="part_two")
@@ -5,6 +5,8 @@ import itertools
 import typing
 
 import aoc2024
+import aoc2024.inputcache
+import aoc2024.io
 
 
 @dataclasses.dataclass
@@ -12,12 +14,12 @@ class Graph:
     edges: list[tuple[str, str]]
 
     @classmethod
+    @aoc2024.inputcache.cached(version=1)
     def from_path_to_input(cls, path_to_input: str) -> typing.Self:
         edges = []
-        with open(file=path_to_input) as f:
-            for line in map(str.strip, f):
-                left, _, right = line.partition("-")
-                edges.append((min(left, right), max(left, right)))
+        for line in aoc2024.io.iter_lines(path_to_input=path_to_input):
+            left, _, right = line.strip().decode().partition("-")
+            edges.append((min(left, right), max(left, right)))
         return cls(edges=edges)
 
     @functools.cached_property
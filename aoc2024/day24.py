@@ -4,6 +4,9 @@ import operator
 import typing
 
 import aoc2024
+import aoc2024.inputcache
+import aoc2024.io
+import aoc2024.metrics
 
 
 class OP(enum.Enum):
@@ -26,36 +29,37 @@ class Puzzle:
     swapped: set[str] = dataclasses.field(default_factory=set)
 
     @classmethod
+    @aoc2024.inputcache.cached(version=1)
     def from_path_to_input(cls, path_to_input: str) -> typing.Self:
         nodes: dict[str, bool | None] = {}
         gates: dict[str, Gate] = {}
-        with open(file=path_to_input) as f:
-            for line in map(str.strip, f):
-                if line:
-                    id, _, value = line.partition(": ")
-                    nodes[id] = bool(int(value))
-                else:
-                    break
-            for line in map(str.strip, f):
-                parent_op_parent, _, child = line.partition(" -> ")
-                parent1, op, parent2 = parent_op_parent.split()
-                for id in (child, parent1, parent2):
-                    if id not in nodes:
-                        nodes[id] = None
-                gates[child] = Gate(
-                    child=child,
-                    op=OP[op],
-                    parents=(
-                        parent1,
-                        parent2,
-                    ),
-                )
+        values_record, gates_record = aoc2024.io.iter_records(
+            path_to_input=path_to_input
+        )
+        for line in values_record.decode().splitlines():
+            id, _, value = line.strip().partition(": ")
+            nodes[id] = bool(int(value))
+        for line in gates_record.decode().splitlines():
+            parent_op_parent, _, child = line.strip().partition(" -> ")
+            parent1, op, parent2 = parent_op_parent.split()
+            for id in (child, parent1, parent2):
+                if id not in nodes:
+                    nodes[id] = None
+            gates[child] = Gate(
+                child=child,
+                op=OP[op],
+                parents=(
+                    parent1,
+                    parent2,
+                ),
+            )
         return cls(
             gates=gates,
             nodes=nodes,
         )
 
     def __next__(self) -> None:
+        evaluations = 0
         while any(value is None for value in self.nodes.values()):
             for child, gate in self.gates.items():
                 if self.nodes[child] is None:
@@ -63,6 +67,8 @@ class Puzzle:
                         self.nodes[child] = gate.op.value(
                             *(self.nodes[parent] for parent in gate.parents)
                         )
+                        evaluations += 1
+        aoc2024.metrics.add(name="day24.gate_evaluations", count=evaluations)
         raise StopIteration
 
     def __iter__(self) -> typing.Self:
@@ -1,7 +1,14 @@
 import dataclasses
+import functools
 import typing
 
 import aoc2024
+import aoc2024.inputcache
+import aoc2024.io
+import aoc2024.parallel
+
+
+HASH = ord("#")
 
 
 HeightType = tuple[int, ...]
@@ -13,34 +20,39 @@ class Puzzle:
     locks: list[HeightType]
 
     @classmethod
+    @aoc2024.inputcache.cached(version=1)
     def from_path_to_input(cls, path_to_input: str) -> typing.Self:
         keys: list[HeightType] = []
         locks: list[HeightType] = []
 
-        def count_hashes(chars: list[str]) -> int:
-            return sum(char == "#" for char in chars)
+        def count_hashes(chars: tuple[int, ...]) -> int:
+            return sum(char == HASH for char in chars)
 
-        with open(file=path_to_input) as f:
-            for chunk in f.read().split("\n\n"):
-                if chunk[:5] == "#" * 5:
-                    collection = locks
-                else:
-                    collection = keys
-                heights = tuple(map(count_hashes, zip(*chunk.splitlines()[1:-1])))  # type: ignore
-                collection.append(heights)
+        for chunk in aoc2024.io.iter_records(path_to_input=path_to_input):
+            if chunk[:5] == b"#" * 5:
+                collection = locks
+            else:
+                collection = keys
+            heights = tuple(map(count_hashes, zip(*chunk.splitlines()[1:-1])))
+            collection.append(heights)
 
         return cls(keys=keys, locks=locks)
 
 
+def count_fits(keys: list[HeightType], lock: HeightType) -> int:
+    return aoc2024.count(
+        True
+        for key in keys
+        if all(l + k <= 5 for l, k in zip(lock, key))  # noqa
+    )
+
+
 # @aoc2024.expects(3)
 @aoc2024.expects(3466)
 def part_one(path_to_input: str) -> int:
     puzzle = Puzzle.from_path_to_input(path_to_input=path_to_input)
-    return aoc2024.count(
-        True
-        for lock in puzzle.locks
-        for key in puzzle.keys
-        if all(l + k <= 5 for l, k in zip(lock, key))  # noqa
+    return sum(
+        aoc2024.parallel.pmap(functools.partial(count_fits, puzzle.keys), puzzle.locks)
     )
 
 
@@ -0,0 +1,126 @@
+from __future__ import annotations
+import collections.abc
+import dataclasses
+
+import aoc2024.coordinate
+import aoc2024.io
+
+
+NORTH, EAST, SOUTH, WEST = range(4)
+DIRECTIONS = (NORTH, EAST, SOUTH, WEST)
+
+
+def turn_right(direction: int) -> int:
+    return (direction + 1) % 4
+
+
+def turn_left(direction: int) -> int:
+    return (direction - 1) % 4
+
+
+@dataclasses.dataclass
+class Grid:
+    cells: bytearray
+    height: int
+    width: int
+    offsets: tuple[int, int, int, int] = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        # Flat index deltas, ordered like DIRECTIONS
+        self.offsets = (-self.width, +1, +self.width, -1)
+
+    @classmethod
+    def from_lines(cls, lines: collections.abc.Iterable[bytes]) -> Grid:
+        rows = [line for line in map(bytes.rstrip, lines) if line]
+        return cls(
+            cells=bytearray().join(rows),
+            height=len(rows),
+            width=len(rows[0]),
+        )
+
+    @classmethod
+    def from_path_to_input(cls, path_to_input: str) -> Grid:
+        cells, width = aoc2024.io.read_grid(path_to_input=path_to_input)
+        return cls(cells=cells, height=len(cells) // width, width=width)
+
+    @classmethod
+    def filled(cls, height: int, width: int, value: bytes = b".") -> Grid:
+        return cls(
+            cells=bytearray(value * (height * width)),
+            height=height,
+            width=width,
+        )
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def __str__(self) -> str:
+        return "\n".join(
+            self.cells[start : start + self.width].decode()
+            for start in range(0, len(self.cells), self.width)
+        )
+
+    def copy(self) -> Grid:
+        return dataclasses.replace(self, cells=self.cells.copy())
+
+    def index(self, idx: int, jdx: int) -> int:
+        return idx * self.width + jdx
+
+    def coordinates(self, index: int) -> tuple[int, int]:
+        return divmod(index, self.width)
+
+    def in_bounds(self, idx: int, jdx: int) -> bool:
+        return 0 <= idx < self.height and 0 <= jdx < self.width
+
+    def to_coordinate(self, index: int) -> aoc2024.coordinate.Coordinate:
+        idx, jdx = divmod(index, self.width)
+        return aoc2024.coordinate.pack(idx=idx, jdx=jdx)
+
+    def get_index(self, coordinate: aoc2024.coordinate.Coordinate) -> int:
+        # Negative off the grid, like step. Unpacked inline, since this sits in
+        # the hot loops of its callers
+        biased = coordinate + aoc2024.coordinate.HALF
+        idx = biased >> aoc2024.coordinate.SHIFT
+        jdx = (biased & aoc2024.coordinate.MASK) - aoc2024.coordinate.HALF
+        if 0 <= idx < self.height and 0 <= jdx < self.width:
+            return idx * self.width + jdx
+        else:
+            return -1
+
+    def find(self, char: bytes) -> int:
+        return self.cells.index(char)
+
+    def iter_index(self, char: bytes) -> collections.abc.Iterator[int]:
+        index = self.cells.find(char)
+        while index >= 0:
+            yield index
+            index = self.cells.find(char, index + 1)
+
+    def step(self, index: int, direction: int) -> int:
+        # Negative when stepping off the grid, so callers can test with `< 0`
+        jdx = index % self.width
+        if direction == NORTH:
+            return index - self.width
+        elif direction == EAST:
+            return index + 1 if jdx < self.width - 1 else -1
+        elif direction == SOUTH:
+            return index + self.width if index + self.width < len(self.cells) else -1
+        else:
+            return index - 1 if jdx else -1
+
+    def iter_neighbor(self, index: int) -> collections.abc.Iterator[int]:
+        jdx = index % self.width
+        if index >= self.width:
+            yield index - self.width
+        if jdx < self.width - 1:
+            yield index + 1
+        if index + self.width < len(self.cells):
+            yield index + self.width
+        if jdx:
+            yield index - 1
@@ -0,0 +1,104 @@
+import collections
+import collections.abc
+import contextlib
+import functools
+import hashlib
+import os
+import pathlib
+import pickle
+import typing
+
+
+INPUT_CACHE_ENVVAR = "AOC2024_INPUT_CACHE"
+INPUT_CACHE_MAX_BYTES_ENVVAR = "AOC2024_INPUT_CACHE_MAX_BYTES"
+DEFAULT_DIRECTORY = ".aoc2024/inputs"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+STATS: collections.Counter[str] = collections.Counter()
+
+
+def get_key(
+    name: str, version: int, path_to_input: str, kwargs: dict[str, typing.Any]
+) -> str:
+    digest = hashlib.sha256()
+    with open(file=path_to_input, mode="rb") as f:
+        digest.update(f.read())
+    digest.update(repr((name, version, sorted(kwargs.items()))).encode())
+    return digest.hexdigest()
+
+
+def iter_path_stat(
+    directory: pathlib.Path,
+) -> collections.abc.Iterator[tuple[pathlib.Path, os.stat_result]]:
+    for path in directory.glob("*.pickle"):
+        try:
+            yield path, path.stat()
+        except FileNotFoundError:
+            # Another worker evicted it since the listing
+            continue
+
+
+def evict(directory: pathlib.Path, max_bytes: int) -> None:
+    # Least recently used first; hits refresh the modification time
+    path_stats = sorted(
+        iter_path_stat(directory=directory), key=lambda path_stat: path_stat[1].st_mtime
+    )
+    total = sum(stat.st_size for _, stat in path_stats)
+    for path, stat in path_stats:
+        if total <= max_bytes:
+            break
+        total -= stat.st_size
+        path.unlink(missing_ok=True)
+        STATS["input_cache.evictions"] += 1
+
+
+def cached(version: int):
+    # Bump the version whenever the parser's output changes shape
+    def decorator(f):
+        name = f"{f.__module__:s}.{f.__qualname__:s}"
+
+        @functools.wraps(f)
+        def inner(*args, path_to_input: str, **kwargs):
+            if not (directory := os.environ.get(INPUT_CACHE_ENVVAR)):
+                return f(*args, path_to_input=path_to_input, **kwargs)
+
+            path = pathlib.Path(directory) / (
+                get_key(
+                    name=name,
+                    version=version,
+                    path_to_input=path_to_input,
+                    kwargs=kwargs,
+                )
+                + ".pickle"
+            )
+            try:
+                with path.open(mode="rb") as f_cache:
+                    ret = pickle.load(f_cache)
+            except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+                STATS["input_cache.misses"] += 1
+            else:
+                STATS["input_cache.hits"] += 1
+                # Not touch(), which would recreate the file had another
+                # worker evicted it in the meantime
+                with contextlib.suppress(FileNotFoundError):
+                    os.utime(path)
+                return ret
+
+            ret = f(*args, path_to_input=path_to_input, **kwargs)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent workers never read half a file
+            partial = path.with_suffix(f".{os.getpid():d}.tmp")
+            partial.write_bytes(pickle.dumps(ret, protocol=pickle.HIGHEST_PROTOCOL))
+            partial.replace(path)
+            evict(
+                directory=path.parent,
+                max_bytes=int(
+                    os.environ.get(INPUT_CACHE_MAX_BYTES_ENVVAR, DEFAULT_MAX_BYTES)
+                ),
+            )
+            return ret
+
+        return inner
+
+    return decorator
@@ -0,0 +1,85 @@
+import array
+import collections.abc
+import contextlib
+import functools
+import hashlib
+import mmap
+import re
+
+
+INTEGER = re.compile(rb"-?\d+")
+BLANK_LINE = re.compile(rb"\n[ \t\r]*\n")
+
+
+Buffer = bytes | mmap.mmap
+
+
+@contextlib.contextmanager
+def mapped(path_to_input: str) -> collections.abc.Iterator[Buffer]:
+    # The page cache backs the mapping, so nothing is copied until sliced
+    with open(file=path_to_input, mode="rb") as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), length=0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            yield b""
+        else:
+            with buffer:
+                yield buffer
+
+
+@functools.cache
+def get_digest(path_to_input: str) -> str:
+    digest = hashlib.sha256()
+    with mapped(path_to_input=path_to_input) as buffer:
+        digest.update(buffer)
+    return digest.hexdigest()
+
+
+def parse_ints(buffer: Buffer) -> array.array:
+    return array.array("q", map(int, INTEGER.findall(buffer)))
+
+
+def iter_ints(path_to_input: str) -> collections.abc.Iterator[int]:
+    with mapped(path_to_input=path_to_input) as buffer:
+        for match in INTEGER.finditer(buffer):
+            yield int(match[0])
+
+
+def read_ints(path_to_input: str) -> array.array:
+    # Packed as 64-bit signed ints, so larger values raise OverflowError; use
+    # iter_ints for inputs that are not bounded
+    return array.array("q", iter_ints(path_to_input=path_to_input))
+
+
+def iter_lines(path_to_input: str) -> collections.abc.Iterator[bytes]:
+    # Without their line endings; a trailing newline does not add an empty line
+    with mapped(path_to_input=path_to_input) as buffer:
+        start, size = 0, len(buffer)
+        while start < size:
+            if (end := buffer.find(b"\n", start)) < 0:
+                end = size
+            yield buffer[start:end].rstrip(b"\r")
+            start = end + 1
+
+
+def iter_records(path_to_input: str) -> collections.abc.Iterator[bytes]:
+    # Blank-line separated, stripped, and never empty
+    with mapped(path_to_input=path_to_input) as buffer:
+        start = 0
+        for match in BLANK_LINE.finditer(buffer):
+            if record := buffer[start : match.start()].strip():
+                yield record
+            start = match.end()
+        if record := buffer[start:].strip():
+            yield record
+
+
+def read_grid(path_to_input: str) -> tuple[bytearray, int]:
+    # Rows are concatenated into one buffer; returns it with the row width
+    cells, width = bytearray(), 0
+    for line in iter_lines(path_to_input=path_to_input):
+        if line:
+            width = width or len(line)
+            cells += line
+    return cells, width
@@ -0,0 +1,158 @@
+from __future__ import annotations
+import collections
+import collections.abc
+import dataclasses
+import json
+import os
+import pathlib
+import sys
+import typing
+
+
+JIT_ENVVAR = "PYTHON_JIT"
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    name: str
+    executable: str = sys.executable
+    env: tuple[tuple[str, str], ...] = ()
+    args: tuple[str, ...] = ()
+
+
+def has_jit() -> bool:
+    # Only builds configured with the JIT have it to switch on; from 3.14
+    jit = getattr(sys, "_jit", None)
+    return jit is not None and jit.is_available()
+
+
+def get_free_threaded_executable() -> str | None:
+    # Installed side by side as e.g. python3.14t; None when this interpreter
+    # already is one, since then it is the default
+    if not getattr(sys, "_is_gil_enabled", lambda: True)():
+        return None
+    else:
+        import shutil
+
+        return shutil.which(f"python{sys.version_info[0]:d}.{sys.version_info[1]:d}t")
+
+
+def get_configs(switch_intervals: collections.abc.Iterable[float]) -> list[Config]:
+    # The first is the baseline the others are compared to
+    configs = [
+        Config(name="default"),
+        Config(name="gc-disable", args=("--gc", "disable")),
+        Config(name="gc-freeze", args=("--gc", "freeze")),
+        *(
+            Config(
+                name=f"switch={interval:g}", args=("--switch-interval", f"{interval:g}")
+            )
+            for interval in switch_intervals
+        ),
+    ]
+    if has_jit():
+        configs.append(Config(name="jit", env=((JIT_ENVVAR, "1"),)))
+    if (executable := get_free_threaded_executable()) is not None:
+        configs.append(Config(name="free-threaded", executable=executable))
+    return configs
+
+
+def iter_record(
+    config: Config,
+    days: collections.abc.Iterable[int],
+    repeat: int,
+    budget: float | None,
+) -> collections.abc.Iterator[dict[str, typing.Any]]:
+    # A fresh interpreter per run, so nothing carries over between configs.
+    # Slow parts really run, or skip_slow would time its stub; a budget
+    # keeps the slowest of them in check
+    command = [
+        config.executable,
+        "-m",
+        "aoc2024",
+        "--no-cache",
+        "--json",
+        "--do-slow-tasks",
+        *(("--budget", f"{budget:g}") if budget is not None else ()),
+        *config.args,
+        *(arg for day in days for arg in ("--day", f"{day:d}")),
+    ]
+    # Only --matrix spawns anything, so the CLI does not pay for subprocess
+    import subprocess
+
+    for _ in range(repeat):
+        completed = subprocess.run(
+            command,
+            capture_output=True,
+            cwd=pathlib.Path(__file__).parent.parent,
+            env={**os.environ, **dict(config.env)},
+            text=True,
+        )
+        if not completed.stdout and completed.returncode:
+            # Not a failing part: the interpreter could not run the package
+            _, _, error = completed.stderr.strip().rpartition("\n")
+            raise RuntimeError(error)
+        yield from map(json.loads, completed.stdout.splitlines())
+
+
+@dataclasses.dataclass
+class Matrix:
+    # The first config is the baseline the others are compared to
+    configs: list[Config]
+    # Each part's best time per config, or why it has none
+    key_to_name_to_seconds: dict[tuple[int, str], dict[str, float | str]] = (
+        dataclasses.field(default_factory=lambda: collections.defaultdict(dict))
+    )
+    name_to_error: dict[str, str] = dataclasses.field(default_factory=dict)
+
+    def run(
+        self, days: collections.abc.Iterable[int], repeat: int, budget: float | None
+    ) -> None:
+        days = list(days)
+        for config in self.configs:
+            try:
+                for record in iter_record(
+                    config=config, days=days, repeat=repeat, budget=budget
+                ):
+                    self.add(name=config.name, record=record)
+            except RuntimeError as e:
+                self.name_to_error[config.name] = str(e)
+
+    def add(self, name: str, record: dict[str, typing.Any]) -> None:
+        name_to_seconds = self.key_to_name_to_seconds[record["day"], record["part"]]
+        previous = name_to_seconds.get(name)
+        if record["error"] is not None or record["seconds"] is None:
+            name_to_seconds[name] = record["error"] or "timed out"
+        elif previous is None:
+            name_to_seconds[name] = record["seconds"]
+        elif isinstance(previous, float):
+            name_to_seconds[name] = min(previous, record["seconds"])
+
+    def iter_report(self) -> collections.abc.Iterator[str]:
+        yield "> Matrix " + " ".join(config.name for config in self.configs)
+        for name, error in self.name_to_error.items():
+            yield f"! {name:s} {error:s}"
+        baseline, day = self.configs[0].name, None
+        for (day_, part), name_to_seconds in sorted(
+            self.key_to_name_to_seconds.items()
+        ):
+            if day_ != day:
+                day = day_
+                yield f"> Day {day:d}"
+            cells = []
+            for config in self.configs:
+                if config.name in self.name_to_error:
+                    continue
+                elif isinstance(seconds := name_to_seconds.get(config.name), str):
+                    cells.append(f"{config.name:s}=!")
+                elif seconds is None:
+                    cells.append(f"{config.name:s}=?")
+                elif config.name == baseline or not isinstance(
+                    base := name_to_seconds.get(baseline), float
+                ):
+                    cells.append(f"{config.name:s}={seconds:.3f}s")
+                else:
+                    cells.append(
+                        f"{config.name:s}={seconds:.3f}s({base / seconds:.2f}x)"
+                    )
+            yield f"  {part:s} " + " ".join(cells)
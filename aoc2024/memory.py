@@ -0,0 +1,182 @@
+from __future__ import annotations
+import collections.abc
+import contextlib
+import dataclasses
+import linecache
+import pathlib
+import resource
+import sys
+import threading
+import tracemalloc
+import types
+
+
+POLL_SECONDS = 0.05
+
+
+def reset_peak_rss() -> None:
+    # Linux >= 4.0 resets VmHWM when "5" is written here; elsewhere the peak
+    # stays the process-wide high-water mark
+    try:
+        with open(file="/proc/self/clear_refs", mode="w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def get_status_bytes(name: str) -> int | None:
+    # Linux only: one of the Vm* sizes in /proc/self/status
+    try:
+        with open(file="/proc/self/status") as f:
+            for line in f:
+                if line.startswith(f"{name:s}:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def get_peak_rss() -> int:
+    if (peak := get_status_bytes(name="VmHWM")) is not None:
+        return peak
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kibibytes
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def format_bytes(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f}MiB"
+
+
+@contextlib.contextmanager
+def capped(max_bytes: int | None) -> collections.abc.Iterator[None]:
+    # Lets the process map at most max_bytes more than it already has, so a
+    # runaway part fails with MemoryError as it goes instead of being killed
+    # for it; address space rather than RSS, as that is what a limit can cap
+    size = get_status_bytes(name="VmSize")
+    if max_bytes is None or size is None:
+        yield
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = size + max_bytes
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    try:
+        yield
+    finally:
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+@dataclasses.dataclass
+class Site:
+    location: str
+    size: int
+    count: int
+
+    def __str__(self) -> str:
+        return (
+            f"{format_bytes(self.size):>10s} {self.count:9d} blocks {self.location:s}"
+        )
+
+
+@dataclasses.dataclass
+class Report:
+    peak_rss: int
+    # What the process already held when the part started
+    start_rss: int = 0
+    # Only known when tracemalloc was tracing
+    net: int | None = None
+    peak: int | None = None
+    sites: list[Site] = dataclasses.field(default_factory=list)
+
+    def __str__(self) -> str:
+        traced = (
+            f"peak={format_bytes(self.peak):s} net={format_bytes(self.net):s} "
+            if self.peak is not None and self.net is not None
+            else ""
+        )
+        return f"{traced:s}rss={format_bytes(self.peak_rss):s}"
+
+
+@dataclasses.dataclass
+class Tracker:
+    top: int | None
+    report: Report | None = None
+    start_rss: int = 0
+    baseline: tracemalloc.Snapshot | None = None
+    baseline_size: int = 0
+    peak_snapshot: tracemalloc.Snapshot | None = None
+    peak_snapshot_size: int = 0
+    stop: threading.Event = dataclasses.field(default_factory=threading.Event)
+    thread: threading.Thread | None = None
+
+    def poll(self) -> None:
+        # Snapshot whenever traced memory reaches a new high, so the sites
+        # reflect what was live at the peak rather than what survived it
+        while not self.stop.wait(timeout=POLL_SECONDS):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.peak_snapshot_size:
+                self.peak_snapshot_size = current
+                self.peak_snapshot = tracemalloc.take_snapshot()
+
+    def __enter__(self) -> Tracker:
+        reset_peak_rss()
+        self.start_rss = get_status_bytes(name="VmRSS") or 0
+        if self.top is not None:
+            tracemalloc.start()
+            self.baseline = tracemalloc.take_snapshot()
+            self.baseline_size, _ = tracemalloc.get_traced_memory()
+            self.peak_snapshot_size = self.baseline_size
+            tracemalloc.reset_peak()
+            self.thread = threading.Thread(target=self.poll, daemon=True)
+            self.thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: types.TracebackType | None,
+    ) -> None:
+        if self.top is None or self.baseline is None or self.thread is None:
+            self.report = Report(peak_rss=get_peak_rss(), start_rss=self.start_rss)
+            return
+        self.stop.set()
+        self.thread.join()
+        current, peak = tracemalloc.get_traced_memory()
+        final = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        snapshot = (
+            self.peak_snapshot
+            if self.peak_snapshot is not None and self.peak_snapshot_size > current
+            else final
+        )
+        # Hide the tracker's own bookkeeping
+        filters = [
+            tracemalloc.Filter(inclusive=False, filename_pattern=filename)
+            for filename in (__file__, threading.__file__, tracemalloc.__file__)
+        ]
+        differences = snapshot.filter_traces(filters).compare_to(
+            self.baseline.filter_traces(filters), key_type="lineno"
+        )
+        self.report = Report(
+            net=current - self.baseline_size,
+            peak=peak - self.baseline_size,
+            peak_rss=get_peak_rss(),
+            start_rss=self.start_rss,
+            sites=[
+                Site(
+                    location=get_location(frame=difference.traceback[0]),
+                    size=difference.size_diff,
+                    count=difference.count_diff,
+                )
+                for difference in differences
+                if difference.size_diff > 0
+            ][: self.top],
+        )
+
+
+def get_location(frame: tracemalloc.Frame) -> str:
+    line = linecache.getline(frame.filename, frame.lineno).strip()
+    return f"{pathlib.Path(frame.filename).name:s}:{frame.lineno:d} {line:s}"
@@ -0,0 +1,33 @@
+import collections
+import collections.abc
+import contextlib
+import typing
+
+
+# Set by the runner for parts run with --metrics. Python cannot strip code, so
+# hot sites guard on this flag (one attribute lookup when off) or tally in a
+# local and publish once per call
+ENABLED = False
+COUNTERS: collections.Counter[str] = collections.Counter()
+
+
+def add(name: str, count: int = 1) -> None:
+    if ENABLED:
+        COUNTERS[name] += count
+
+
+@contextlib.contextmanager
+def cache_hits(name: str, f: typing.Any) -> collections.abc.Iterator[None]:
+    # Memoized functions already tally their hits, and may survive between
+    # parts, so only the difference over the block counts
+    if not ENABLED:
+        yield
+        return
+    before = f.cache_info()
+    try:
+        yield
+    finally:
+        after = f.cache_info()
+        COUNTERS[f"{name:s}.hits"] += after.hits - before.hits
+        COUNTERS[f"{name:s}.misses"] += after.misses - before.misses
+        COUNTERS[f"{name:s}.evictions"] += after.evictions - before.evictions
@@ -0,0 +1,62 @@
+import collections.abc
+import math
+import os
+import pathlib
+import sys
+import typing
+
+
+WORKERS_ENVVAR = "AOC2024_WORKERS"
+# Below this many items the pool costs more than it saves
+MINIMUM_ITEMS = 64
+
+
+T = typing.TypeVar("T")
+U = typing.TypeVar("U")
+
+
+def is_free_threaded() -> bool:
+    # Only present from 3.13 onwards, and False on free-threaded builds
+    return not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def get_workers() -> int:
+    # Read on every call, like the backend, so the runner can set it per part
+    return int(os.environ.get(WORKERS_ENVVAR, "1"))
+
+
+def get_parallel_days() -> set[int]:
+    # Source text only, so nothing is imported to find them
+    return {
+        int(path.stem.removeprefix("day"))
+        for path in pathlib.Path(__file__).parent.glob("day*.py")
+        if "import aoc2024.parallel\n" in path.read_text()
+    }
+
+
+def pmap(
+    f: collections.abc.Callable[[T], U], items: collections.abc.Iterable[T]
+) -> list[U]:
+    # Threads when they can truly run at once; otherwise processes, with the
+    # items split into a few chunks per worker so pickling is paid per chunk.
+    # Either way, f and the items must be safe to share: no in-place mutation
+    items = list(items)
+    workers = get_workers()
+    if workers <= 1 or len(items) < MINIMUM_ITEMS:
+        return list(map(f, items))
+    # Only imported once there is a pool to run: the runner imports this
+    # module on every start
+    import concurrent.futures
+    import multiprocessing
+
+    if multiprocessing.current_process().daemon:
+        # Budgeted parts run in daemonic processes, which cannot have children
+        return list(map(f, items))
+    elif is_free_threaded():
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(f, items))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(f, items, chunksize=math.ceil(len(items) / (4 * workers)))
+            )
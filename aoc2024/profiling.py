@@ -0,0 +1,92 @@
+from __future__ import annotations
+import collections
+import collections.abc
+import pathlib
+import typing
+
+# Only --profile needs these, and pstats is slow to import
+if typing.TYPE_CHECKING:
+    import cProfile
+    import pstats
+
+
+Function = tuple[str, int, str]
+
+
+def get_label(function: Function) -> str:
+    filename, line, name = function
+    if filename == "~":
+        # Builtins have neither a file nor a line
+        return name
+    else:
+        return f"{pathlib.Path(filename).stem:s}:{name:s}:{line:d}"
+
+
+def get_paths(directory: str, key: str) -> tuple[pathlib.Path, pathlib.Path]:
+    path = pathlib.Path(directory)
+    return path / f"{key:s}.pstats", path / f"{key:s}.collapsed"
+
+
+def iter_collapsed(
+    stats: pstats.Stats,
+) -> collections.abc.Iterator[tuple[str, int]]:
+    # cProfile only keeps caller/callee pairs, so whole stacks are rebuilt by
+    # walking down from the roots and splitting each callee's time by the
+    # share it got from that caller
+    raw = stats.stats  # type: ignore[attr-defined]
+    callees: dict[Function, dict[Function, float]] = collections.defaultdict(dict)
+    for function, (*_, callers) in raw.items():
+        for caller, (*_, cumulative) in callers.items():
+            callees[caller][function] = cumulative
+
+    def walk(
+        function: Function, stack: tuple[str, ...], scale: float
+    ) -> collections.abc.Iterator[tuple[str, int]]:
+        _, _, total, cumulative, _ = raw[function]
+        stack = (*stack, get_label(function=function).replace(";", ","))
+        if (microseconds := int(1e6 * total * scale)) > 0:
+            yield ";".join(stack), microseconds
+        for callee, edge in callees[function].items():
+            if (
+                get_label(function=callee) not in stack
+                and (callee_cumulative := raw[callee][3]) > 0
+            ):
+                yield from walk(
+                    function=callee,
+                    stack=stack,
+                    scale=scale * edge / callee_cumulative,
+                )
+
+    for function, (*_, callers) in raw.items():
+        if not callers:
+            yield from walk(function=function, stack=(), scale=1.0)
+
+
+def save(profiler: cProfile.Profile, directory: str, key: str) -> None:
+    import pstats
+
+    path_to_pstats, path_to_collapsed = get_paths(directory=directory, key=key)
+    path_to_pstats.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(file=path_to_pstats)
+    stack_to_microseconds: collections.Counter[str] = collections.Counter()
+    for stack, microseconds in iter_collapsed(stats=pstats.Stats(profiler)):
+        stack_to_microseconds[stack] += microseconds
+    path_to_collapsed.write_text(
+        "".join(
+            f"{stack:s} {microseconds:d}\n"
+            for stack, microseconds in sorted(stack_to_microseconds.items())
+        )
+    )
+
+
+def iter_top(directory: str, key: str, top: int) -> collections.abc.Iterator[str]:
+    import pstats
+
+    path_to_pstats, _ = get_paths(directory=directory, key=key)
+    stats = pstats.Stats(str(path_to_pstats)).sort_stats(pstats.SortKey.CUMULATIVE)
+    for function in stats.fcn_list[:top]:  # type: ignore[attr-defined]
+        _, calls, total, cumulative, _ = stats.stats[function]  # type: ignore[attr-defined]
+        yield (
+            f"  {cumulative:9.3f}s cumulative {total:9.3f}s own {calls:9d} calls"
+            f" {get_label(function=function):s}"
+        )
@@ -0,0 +1,105 @@
+from __future__ import annotations
+import collections.abc
+import dataclasses
+import functools
+import hashlib
+import json
+import pathlib
+import re
+import typing
+
+import aoc2024.io
+import aoc2024.runner
+
+
+DEFAULT_PATH_TO_STORE = ".aoc2024/results.json"
+IMPORT = re.compile(r"^import (aoc2024(?:\.\w+)?)$", flags=re.MULTILINE)
+
+
+def get_path_to_module(module_name: str) -> pathlib.Path:
+    directory = pathlib.Path(__file__).parent
+    if module_name == "aoc2024":
+        return directory / "__init__.py"
+    else:
+        _, _, name = module_name.partition(".")
+        return directory / f"{name:s}.py"
+
+
+@functools.cache
+def get_source_digest(module_name: str) -> str:
+    # The day module and every aoc2024 module it (transitively) imports, so
+    # editing a shared helper like grid or search invalidates its users too
+    digest = hashlib.sha256()
+    seen, stack = {module_name}, [module_name]
+    while stack:
+        source = get_path_to_module(module_name=stack.pop()).read_text()
+        digest.update(source.encode())
+        for imported in IMPORT.findall(source):
+            if imported not in seen:
+                seen.add(imported)
+                stack.append(imported)
+    return digest.hexdigest()
+
+
+@dataclasses.dataclass
+class Store:
+    path_to_store: pathlib.Path
+    # Whether slow parts really run; otherwise skip_slow answers them for free
+    slow: bool
+    key_to_result: dict[str, dict[str, typing.Any]]
+
+    @classmethod
+    def from_path_to_store(cls, path_to_store: str, slow: bool) -> Store:
+        path = pathlib.Path(path_to_store)
+        return cls(
+            path_to_store=path,
+            slow=slow,
+            key_to_result=json.loads(path.read_text()) if path.exists() else {},
+        )
+
+    @staticmethod
+    def get_fingerprint(part: aoc2024.runner.Part) -> dict[str, str]:
+        return {
+            "source": get_source_digest(module_name=part.module_name),
+            "input": aoc2024.io.get_digest(path_to_input=part.path_to_input),
+        }
+
+    def get_outcome(self, part: aoc2024.runner.Part) -> aoc2024.runner.Outcome | None:
+        if (
+            (result := self.key_to_result.get(part.key)) is None
+            or any(
+                result[name] != value
+                for name, value in self.get_fingerprint(part=part).items()
+            )
+            # An answer skip_slow handed back was never computed
+            or (self.slow and not result["slow"])
+        ):
+            return None
+        else:
+            return aoc2024.runner.Outcome(
+                part=part,
+                answer=result["answer"],
+                timings=[result["seconds"]],
+                stats={"results.hits": 1},
+                stubbed=not result["slow"],
+            )
+
+    def iter_record(
+        self, outcomes: collections.abc.Iterable[aoc2024.runner.Outcome]
+    ) -> collections.abc.Iterator[aoc2024.runner.Outcome]:
+        for outcome in outcomes:
+            # Only answers that ran to completion (and passed expects)
+            if outcome.error is None and outcome.timings:
+                self.key_to_result[outcome.part.key] = {
+                    **self.get_fingerprint(part=outcome.part),
+                    "answer": outcome.answer,
+                    "seconds": min(outcome.timings),
+                    # From what ran rather than what this run asked for: a
+                    # server imported its modules with its own setting
+                    "slow": not outcome.stubbed,
+                }
+            yield outcome
+
+    def save(self) -> None:
+        self.path_to_store.parent.mkdir(parents=True, exist_ok=True)
+        self.path_to_store.write_text(json.dumps(self.key_to_result, indent=2))
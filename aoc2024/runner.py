@@ -0,0 +1,430 @@
+from __future__ import annotations
+import collections
+import collections.abc
+import contextlib
+import dataclasses
+import functools
+import gc
+import importlib
+import os
+import pathlib
+import sys
+import time
+import types
+import typing
+
+import aoc2024
+import aoc2024.backend
+import aoc2024.inputcache
+import aoc2024.metrics
+import aoc2024.parallel
+
+# Pools, pipes, the profiler and the other measuring modules are imported
+# where they are used: together they would add tens of milliseconds to every
+# run's startup
+if typing.TYPE_CHECKING:
+    import cProfile
+    import concurrent.futures
+    import multiprocessing.connection
+
+    import aoc2024.memory
+    import aoc2024.sampling
+
+
+PART_NAMES = ("part_one", "part_two")
+GC_MODES = ("disable", "freeze")
+# A stack walk costs tens of microseconds, so about 1% of the solver's time
+DEFAULT_SAMPLE_INTERVAL_SECONDS = 0.005
+
+
+@dataclasses.dataclass(frozen=True, order=True)
+class Part:
+    day: int
+    name: str
+    # Any other input than the canonical inputNN.txt
+    path: str | None = None
+
+    @property
+    def key(self) -> str:
+        return f"day{self.day:02d}.{self.name:s}"
+
+    @property
+    def module_name(self) -> str:
+        return f"aoc2024.day{self.day:02d}"
+
+    @property
+    def path_to_canonical_input(self) -> str:
+        return str(pathlib.Path(__file__).parent / f"input{self.day:02d}.txt")
+
+    @property
+    def path_to_input(self) -> str:
+        if self.path is not None:
+            return self.path
+        else:
+            return self.path_to_canonical_input
+
+    @property
+    def is_canonical(self) -> bool:
+        # The expected answers only hold for the canonical input, so other
+        # paths with the same content still get checked
+        if self.path is None:
+            return True
+        import aoc2024.io
+
+        return aoc2024.io.get_digest(path_to_input=self.path) == aoc2024.io.get_digest(
+            path_to_input=self.path_to_canonical_input
+        )
+
+
+@dataclasses.dataclass
+class Outcome:
+    part: Part
+    answer: int | str | None = None
+    error: str | None = None
+    timings: list[float] = dataclasses.field(default_factory=list)
+    import_seconds: float = 0.0
+    stats: dict[str, int] = dataclasses.field(default_factory=dict)
+    memory: aoc2024.memory.Report | None = None
+    metrics: dict[str, int] = dataclasses.field(default_factory=dict)
+    skipped: bool = False
+    timed_out: bool = False
+    # Answered by skip_slow, which hands back the expected answer unsolved
+    stubbed: bool = False
+
+
+@dataclasses.dataclass(frozen=True)
+class Options:
+    backend: str | None = None
+    budget: float | None = None
+    gc: str | None = None
+    # Otherwise memoized functions start every call (warmup or repeat) cold
+    keep_caches: bool = False
+    max_rss: int | None = None
+    memory_top: int | None = None
+    metrics: bool = False
+    profile_dir: str | None = None
+    repeat: int = 1
+    switch_interval: float | None = None
+    sample_dir: str | None = None
+    sample_interval: float = DEFAULT_SAMPLE_INTERVAL_SECONDS
+    trace: str | None = None
+    trace_format: str = "frames"
+    warmup: int = 0
+    workers: int = 1
+
+
+# The last input a module parsed, for its other part to pick up. Only one is
+# kept, and the module object and the file's stamp are part of the key, so a
+# reloaded module or an edited input parses afresh. So is the pass it was
+# parsed in: parsed objects cache what they solve, and a second pass over the
+# same parts (another repeat, or the other side of --speedup) must not time
+# those cache hits
+PARSED: dict[tuple[types.ModuleType, str, int, int, str], typing.Any] = {}
+
+
+def get_parsed(
+    module: types.ModuleType, path_to_input: str, token: str | None
+) -> typing.Any:
+    if token is None:
+        # Not part of a pass, so nothing to share with
+        return module.parse(path_to_input=path_to_input)
+    stat = os.stat(path_to_input)
+    key = (module, path_to_input, stat.st_mtime_ns, stat.st_size, token)
+    if key not in PARSED:
+        PARSED.clear()
+        PARSED[key] = module.parse(path_to_input=path_to_input)
+    return PARSED[key]
+
+
+def solve_part(
+    path_to_input: str,
+    expected: int | str | None,
+    module: types.ModuleType,
+    name: str,
+    token: str | None,
+) -> typing.Any:
+    # Modules may split parsing from solving: parse(path_to_input) builds one
+    # object, which can cache intermediate results, and solve(parsed, part)
+    # answers either part from it
+    answer = module.solve(
+        parsed=get_parsed(module=module, path_to_input=path_to_input, token=token),
+        part=name,
+    )
+    return answer if expected is None else aoc2024.check(ret=answer, expected=expected)
+
+
+@contextlib.contextmanager
+def tuned(options: Options) -> collections.abc.Iterator[None]:
+    # Interpreter settings around the solver only, restored afterwards
+    enabled, interval = gc.isenabled(), sys.getswitchinterval()
+    if options.switch_interval is not None:
+        sys.setswitchinterval(options.switch_interval)
+    if options.gc == "disable":
+        gc.disable()
+    elif options.gc == "freeze":
+        # Everything alive before the solver starts, like modules and an
+        # input the other part parsed, is never scanned again
+        gc.collect()
+        gc.freeze()
+    try:
+        yield
+    finally:
+        if options.gc == "freeze":
+            gc.unfreeze()
+        elif enabled:
+            gc.enable()
+        sys.setswitchinterval(interval)
+
+
+# Each measurement imports its module only for the runs that ask for it
+def capped(options: Options) -> contextlib.AbstractContextManager[None]:
+    if options.max_rss is None:
+        return contextlib.nullcontext()
+    import aoc2024.memory
+
+    return aoc2024.memory.capped(max_bytes=options.max_rss)
+
+
+def tracked(
+    options: Options,
+) -> contextlib.AbstractContextManager[aoc2024.memory.Tracker | None]:
+    if options.memory_top is None and options.max_rss is None:
+        return contextlib.nullcontext()
+    import aoc2024.memory
+
+    return aoc2024.memory.Tracker(top=options.memory_top)
+
+
+def traced(options: Options, title: str) -> contextlib.AbstractContextManager[None]:
+    if options.trace is None:
+        return contextlib.nullcontext()
+    import aoc2024.trace
+
+    return aoc2024.trace.tracing(
+        path=options.trace, format=options.trace_format, title=title
+    )
+
+
+def sampled(
+    options: Options, root: types.FrameType
+) -> contextlib.AbstractContextManager[aoc2024.sampling.Sampler | None]:
+    if options.sample_dir is None:
+        return contextlib.nullcontext()
+    import aoc2024.sampling
+
+    return aoc2024.sampling.Sampler(interval=options.sample_interval, root=root)
+
+
+def get_rss_error(
+    max_rss: int, report: aoc2024.memory.Report | None, ran_out: bool
+) -> str | None:
+    import aoc2024.memory
+
+    if ran_out:
+        return f"MemoryError: needs more than {aoc2024.memory.format_bytes(max_rss):s}"
+    elif (
+        report is not None and (growth := report.peak_rss - report.start_rss) > max_rss
+    ):
+        # The cap is on address space, so RSS can still overshoot it
+        return (
+            f"MemoryError: peak RSS grew by {aoc2024.memory.format_bytes(growth):s}"
+            f", over {aoc2024.memory.format_bytes(max_rss):s}"
+        )
+    else:
+        return None
+
+
+def save(
+    options: Options,
+    key: str,
+    profiler: cProfile.Profile | None,
+    sampler: aoc2024.sampling.Sampler | None,
+) -> None:
+    if options.profile_dir is not None and profiler is not None:
+        import aoc2024.profiling
+
+        aoc2024.profiling.save(
+            profiler=profiler, directory=options.profile_dir, key=key
+        )
+    if options.sample_dir is not None and sampler is not None:
+        import aoc2024.sampling
+
+        aoc2024.sampling.save(sampler=sampler, directory=options.sample_dir, key=key)
+
+
+def run_part(part: Part, options: Options, token: str | None = None) -> Outcome:
+    outcome = Outcome(part=part)
+    if options.backend is not None:
+        # Kernels check this on every call, in whichever process runs them
+        os.environ[aoc2024.backend.BACKEND_ENVVAR] = options.backend
+    # Likewise read by pmap on every call
+    os.environ[aoc2024.parallel.WORKERS_ENVVAR] = str(options.workers)
+    if part.module_name not in sys.modules:
+        start = time.perf_counter()
+        try:
+            importlib.import_module(name=part.module_name)
+        except Exception as e:
+            # A module that does not import fails its parts, not the run
+            outcome.error = f"{type(e).__name__:s}: {e}"
+            return outcome
+        outcome.import_seconds = time.perf_counter() - start
+    module = sys.modules[part.module_name]
+    task = getattr(module, part.name)
+    # Only the canonical input itself may be stubbed: any other path is there
+    # to be solved, even one whose content matches it
+    outcome.stubbed = part.path is None and aoc2024.is_skipped(task)
+    if hasattr(module, "solve") and not outcome.stubbed:
+        task = functools.partial(
+            solve_part,
+            expected=aoc2024.get_expected(task) if part.is_canonical else None,
+            module=module,
+            name=part.name,
+            token=token,
+        )
+    elif part.path is not None and (aoc2024.is_skipped(task) or not part.is_canonical):
+        import inspect
+
+        task = inspect.unwrap(task)
+    profiler: cProfile.Profile | None = None
+    if options.profile_dir is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        call = functools.partial(profiler.runcall, task)
+    else:
+        call = task
+    before = collections.Counter(aoc2024.inputcache.STATS)
+    aoc2024.metrics.ENABLED = options.metrics
+    aoc2024.metrics.COUNTERS.clear()
+
+    def reset(attempt: int) -> None:
+        # Every call starts cold, bar what the first may pick up from the
+        # other part's parse; warm memo caches are only kept when asked for
+        if attempt:
+            PARSED.clear()
+        # Only modules that memoize import the caches, so without them there
+        # is nothing to clear
+        if not options.keep_caches and (cache := sys.modules.get("aoc2024.cache")):
+            cache.clear()
+
+    # Bound up front, since a failing warmup never gets to enter them
+    tracker: aoc2024.memory.Tracker | None = None
+    sampler: aoc2024.sampling.Sampler | None = None
+    ran_out = False
+    try:
+        with capped(options=options):
+            for attempt in range(options.warmup):
+                reset(attempt=attempt)
+                task(path_to_input=part.path_to_input)
+            with (
+                tuned(options=options),
+                tracked(options=options) as tracker,
+                traced(options=options, title=part.key),
+                sampled(options=options, root=sys._getframe()) as sampler,
+            ):
+                for attempt in range(options.warmup, options.warmup + options.repeat):
+                    reset(attempt=attempt)
+                    start = time.perf_counter()
+                    outcome.answer = call(path_to_input=part.path_to_input)  # type: ignore[call-arg]
+                    outcome.timings.append(time.perf_counter() - start)
+    except MemoryError as e:
+        ran_out = True
+        outcome.error = f"MemoryError: {e}"
+    except Exception as e:
+        outcome.error = f"{type(e).__name__:s}: {e}"
+    outcome.memory = tracker.report if tracker is not None else None
+    if options.max_rss is not None and (
+        error := get_rss_error(
+            max_rss=options.max_rss, report=outcome.memory, ran_out=ran_out
+        )
+    ):
+        outcome.error = error
+    outcome.stats = dict(aoc2024.inputcache.STATS - before)
+    outcome.metrics = dict(aoc2024.metrics.COUNTERS)
+    save(options=options, key=part.key, profiler=profiler, sampler=sampler)
+    return outcome
+
+
+def send_part(
+    part: Part, options: Options, sender: multiprocessing.connection.Connection
+) -> None:
+    sender.send(run_part(part=part, options=options))
+
+
+def run_part_within_budget(part: Part, options: Options) -> Outcome:
+    # A dedicated process per part, since that is the only worker we can stop
+    # part-way through
+    import multiprocessing
+
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=send_part,
+        kwargs={"part": part, "options": options, "sender": sender},
+        daemon=True,
+    )
+    process.start()
+    sender.close()
+    try:
+        if receiver.poll(timeout=options.budget):
+            return receiver.recv()
+        else:
+            return Outcome(part=part, timed_out=True)
+    except EOFError:
+        process.join()
+        return Outcome(
+            part=part, error=f"ChildProcessError: exit code {process.exitcode}"
+        )
+    finally:
+        process.terminate()
+        process.join()
+        receiver.close()
+
+
+EXECUTORS = ("process", "interpreter")
+
+
+def get_executor(executor: str, jobs: int) -> concurrent.futures.Executor:
+    import concurrent.futures
+
+    if executor == "interpreter":
+        # Only available from 3.14 onwards
+        if (
+            cls := getattr(concurrent.futures, "InterpreterPoolExecutor", None)
+        ) is None:
+            raise RuntimeError(f"{executor=!r} is not supported by this interpreter")
+        return cls(max_workers=jobs)
+    else:
+        return concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+
+
+def iter_outcome(
+    parts: collections.abc.Iterable[Part],
+    executor: str,
+    jobs: int,
+    options: Options,
+) -> collections.abc.Iterator[Outcome]:
+    # Parts are started in the order given but always reported in day order.
+    # Each pass gets its own token, so parts only share parsed inputs with the
+    # other part of the same pass
+    token = os.urandom(8).hex()
+    if options.budget is not None:
+        # The parts already run in their own processes, so threads are enough
+        # to keep `jobs` of them going at once
+        import concurrent.futures
+
+        run = functools.partial(run_part_within_budget, options=options)
+        pool: concurrent.futures.Executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=jobs
+        )
+    elif jobs == 1:
+        yield from map(
+            functools.partial(run_part, options=options, token=token), sorted(parts)
+        )
+        return
+    else:
+        run = functools.partial(run_part, options=options, token=token)
+        pool = get_executor(executor=executor, jobs=jobs)
+    with pool:
+        futures = {part: pool.submit(run, part) for part in parts}
+        for part in sorted(futures):
+            yield futures[part].result()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+import collections
+import collections.abc
+import dataclasses
+import pathlib
+import sys
+import threading
+import types
+
+import aoc2024.profiling
+
+
+def get_path(directory: str, key: str) -> pathlib.Path:
+    return pathlib.Path(directory) / f"{key:s}.collapsed"
+
+
+@dataclasses.dataclass
+class Sampler:
+    interval: float
+    # Samples are cut off at this frame, so only the solver's calls show
+    root: types.FrameType
+    thread_id: int = dataclasses.field(default_factory=threading.get_ident)
+    stack_to_samples: collections.Counter[str] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+    stop: threading.Event = dataclasses.field(default_factory=threading.Event)
+    thread: threading.Thread | None = None
+
+    def sample(self) -> None:
+        frame = sys._current_frames().get(self.thread_id)
+        labels = []
+        while frame is not None and frame is not self.root:
+            code = frame.f_code
+            # By line rather than by function, so hot lines stand out
+            labels.append(
+                aoc2024.profiling.get_label(
+                    function=(code.co_filename, frame.f_lineno or 0, code.co_name)
+                ).replace(";", ",")
+            )
+            frame = frame.f_back
+        if labels:
+            self.stack_to_samples[";".join(reversed(labels))] += 1
+
+    def run(self) -> None:
+        while not self.stop.wait(timeout=self.interval):
+            self.sample()
+
+    def __enter__(self) -> Sampler:
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.stop.set()
+        if self.thread is not None:
+            self.thread.join()
+
+
+def save(sampler: Sampler, directory: str, key: str) -> None:
+    path = get_path(directory=directory, key=key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "".join(
+            f"{stack:s} {samples:d}\n"
+            for stack, samples in sorted(sampler.stack_to_samples.items())
+        )
+    )
+
+
+def iter_top(directory: str, key: str, top: int) -> collections.abc.Iterator[str]:
+    # The lines samples landed on, own time only
+    line_to_samples: collections.Counter[str] = collections.Counter()
+    for line in get_path(directory=directory, key=key).read_text().splitlines():
+        stack, _, count = line.rpartition(" ")
+        _, _, leaf = stack.rpartition(";")
+        line_to_samples[leaf] += int(count)
+    total = sum(line_to_samples.values())
+    for label, samples in line_to_samples.most_common(top):
+        yield f"  {100 * samples / total:6.2f}% {samples:9d} samples {label:s}"
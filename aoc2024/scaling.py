@@ -0,0 +1,73 @@
+import collections
+import collections.abc
+import math
+import pathlib
+
+import aoc2024.runner
+import aoc2024.synth
+
+
+def fit_exponent(
+    points: collections.abc.Sequence[tuple[float, float]],
+) -> float | None:
+    # Least-squares slope of log(seconds) against log(scale)
+    logs = [
+        (math.log(scale), math.log(seconds)) for scale, seconds in points if seconds > 0
+    ]
+    if len({x for x, _ in logs}) < 2:
+        return None
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in logs) / sum(
+        (x - mean_x) ** 2 for x, _ in logs
+    )
+
+
+def write_parts(
+    days: collections.abc.Iterable[int],
+    directory: pathlib.Path,
+    factors: collections.abc.Sequence[float],
+    seed: int,
+) -> dict[aoc2024.runner.Part, float]:
+    part_to_factor = {}
+    for day in days:
+        for factor in factors:
+            path = directory / f"input{day:02d}.x{factor:g}.txt"
+            path.write_text(aoc2024.synth.generate(day=day, scale=factor, seed=seed))
+            for name in aoc2024.synth.get_part_names(day=day):
+                part_to_factor[
+                    aoc2024.runner.Part(day=day, name=name, path=str(path))
+                ] = factor
+    return part_to_factor
+
+
+def iter_report(
+    outcomes: collections.abc.Iterable[aoc2024.runner.Outcome],
+    part_to_factor: dict[aoc2024.runner.Part, float],
+) -> collections.abc.Iterator[str]:
+    key_to_outcomes = collections.defaultdict(list)
+    for outcome in outcomes:
+        key_to_outcomes[outcome.part.day, outcome.part.name].append(outcome)
+    day = None
+    for (day_, name), grouped in sorted(key_to_outcomes.items()):
+        if day_ != day:
+            day = day_
+            yield f"> Day {day:d}"
+        points, cells, errors = [], [], []
+        for outcome in sorted(grouped, key=lambda o: part_to_factor[o.part]):
+            factor = part_to_factor[outcome.part]
+            if outcome.timed_out:
+                cells.append(f"x{factor:g}=timeout")
+            elif outcome.error is not None or not outcome.timings:
+                cells.append(f"x{factor:g}=error")
+                errors.append(f"    x{factor:g} {outcome.error}")
+            else:
+                seconds = min(outcome.timings)
+                points.append((factor, seconds))
+                cells.append(f"x{factor:g}={seconds:.4f}s")
+        exponent = fit_exponent(points=points)
+        yield (
+            f"  {name:s} {' '.join(cells):s}"
+            f" exponent={'n/a' if exponent is None else f'{exponent:.2f}':s}"
+        )
+        yield from errors
@@ -0,0 +1,71 @@
+from __future__ import annotations
+import collections.abc
+import dataclasses
+import heapq
+import json
+import pathlib
+
+import aoc2024.runner
+
+
+# What a part missing from the bench history is assumed to take
+DEFAULT_UNTIMED_SECONDS = 0.1
+
+
+def get_key_to_seconds(path_to_history: str) -> dict[str, float]:
+    # The most recent median of every part in the bench history. Runs from
+    # before bench noted whether slow tasks were on may have timed skip_slow's
+    # stubs, so they do not count; since then bench never records a stub
+    if not (path := pathlib.Path(path_to_history)).exists():
+        return {}
+    else:
+        return {
+            key: noted_runs[-1]["median"]
+            for key, runs in json.loads(path.read_text()).items()
+            if (noted_runs := [run for run in runs if "slow" in run])
+        }
+
+
+def get_makespan(costs: collections.abc.Iterable[float], jobs: int) -> float:
+    # Longest-processing-time-first: each part goes to the least loaded worker
+    loads = [0.0] * jobs
+    for cost in sorted(costs, reverse=True):
+        heapq.heapreplace(loads, loads[0] + cost)
+    return max(loads)
+
+
+@dataclasses.dataclass
+class Schedule:
+    parts: list[aoc2024.runner.Part]
+    skipped: list[aoc2024.runner.Part]
+    makespan: float
+
+    @classmethod
+    def from_key_to_seconds(
+        cls,
+        parts: collections.abc.Iterable[aoc2024.runner.Part],
+        key_to_seconds: dict[str, float],
+        jobs: int,
+        target: float | None,
+        untimed: float,
+    ) -> Schedule:
+        # Parts we have never timed are assumed to take `untimed`
+        def get_cost(part: aoc2024.runner.Part) -> float:
+            return key_to_seconds.get(part.key, untimed)
+
+        scheduled: list[aoc2024.runner.Part] = []
+        skipped: list[aoc2024.runner.Part] = []
+        # Cheapest first, so the target admits as many parts as possible
+        for part in sorted(parts, key=get_cost):
+            if target is None or (
+                get_makespan(costs=map(get_cost, (*scheduled, part)), jobs=jobs)
+                <= target
+            ):
+                scheduled.append(part)
+            else:
+                skipped.append(part)
+        return cls(
+            parts=sorted(scheduled, key=get_cost, reverse=True),
+            skipped=sorted(skipped),
+            makespan=get_makespan(costs=map(get_cost, scheduled), jobs=jobs),
+        )
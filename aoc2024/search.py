@@ -0,0 +1,149 @@
+from __future__ import annotations
+import collections
+import collections.abc
+import dataclasses
+import heapq
+import itertools
+
+import aoc2024.metrics
+
+
+# Nodes are plain ints (flat grid indices, or index * 4 + direction) so the
+# heap never has to compare anything richer
+Unweighted = collections.abc.Callable[[int], collections.abc.Iterable[int]]
+Weighted = collections.abc.Callable[[int], collections.abc.Iterable[tuple[int, int]]]
+Goal = collections.abc.Callable[[int], bool]
+Heuristic = collections.abc.Callable[[int], int]
+
+
+@dataclasses.dataclass
+class Result:
+    distances: dict[int, int]
+    # Every predecessor on some shortest path, in discovery order
+    predecessors: dict[int, list[int]]
+    goals: list[int]
+
+    @property
+    def distance(self) -> int:
+        # Distance to the nearest goal
+        return self.distances[self.goals[0]]
+
+    def get_path(self, node: int) -> list[int]:
+        # One shortest path from a start to node, both ends included
+        path = [node]
+        while predecessors := self.predecessors.get(path[-1]):
+            path.append(predecessors[0])
+        path.reverse()
+        return path
+
+    def get_nodes_on_shortest_paths(
+        self, nodes: collections.abc.Iterable[int]
+    ) -> set[int]:
+        seen = set(nodes)
+        stack = list(seen)
+        while stack:
+            for predecessor in self.predecessors.get(stack.pop(), ()):
+                if predecessor not in seen:
+                    seen.add(predecessor)
+                    stack.append(predecessor)
+        return seen
+
+
+def bfs(
+    starts: collections.abc.Iterable[int],
+    iter_neighbor: Unweighted,
+    is_goal: Goal | None = None,
+) -> Result:
+    distances = dict.fromkeys(starts, 0)
+    predecessors: dict[int, list[int]] = collections.defaultdict(list)
+    goals: list[int] = []
+    queue = collections.deque(distances)
+    pops = pushes = 0
+    while queue:
+        node = queue.popleft()
+        pops += 1
+        distance = distances[node]
+        if is_goal is not None:
+            if goals and distance > distances[goals[0]]:
+                break
+            elif is_goal(node):
+                goals.append(node)
+                continue
+        for neighbor in iter_neighbor(node):
+            if (known := distances.get(neighbor)) is None:
+                distances[neighbor] = distance + 1
+                predecessors[neighbor].append(node)
+                queue.append(neighbor)
+                pushes += 1
+            elif known == distance + 1:
+                predecessors[neighbor].append(node)
+    aoc2024.metrics.add(name="search.pops", count=pops)
+    aoc2024.metrics.add(name="search.pushes", count=pushes)
+    return Result(distances=distances, predecessors=predecessors, goals=goals)
+
+
+def astar(
+    starts: collections.abc.Iterable[int],
+    iter_neighbor: Weighted,
+    is_goal: Goal | None = None,
+    heuristic: Heuristic | None = None,
+) -> Result:
+    # The heuristic must be consistent; without one this is plain Dijkstra
+    distances: dict[int, int] = {}
+    predecessors: dict[int, list[int]] = collections.defaultdict(list)
+    goals: list[int] = []
+    done = set()
+    # The counter breaks ties first-in first-out and keeps nodes uncompared
+    counter = itertools.count()
+    heap = []
+    for start in starts:
+        distances[start] = 0
+        heap.append(
+            (0 if heuristic is None else heuristic(start), next(counter), start)
+        )
+    heapq.heapify(heap)
+    pops = pushes = 0
+    while heap:
+        priority, _, node = heapq.heappop(heap)
+        pops += 1
+        if node in done:
+            continue
+        distance = distances[node]
+        if is_goal is not None:
+            # Keep popping until the frontier passes the goal, so that every
+            # equally short route is recorded
+            if goals and priority > distances[goals[0]]:
+                break
+            elif is_goal(node):
+                goals.append(node)
+                done.add(node)
+                continue
+        done.add(node)
+        for neighbor, cost in iter_neighbor(node):
+            if (known := distances.get(neighbor)) is None or distance + cost < known:
+                distances[neighbor] = distance + cost
+                predecessors[neighbor] = [node]
+                heapq.heappush(
+                    heap,
+                    (
+                        distance
+                        + cost
+                        + (0 if heuristic is None else heuristic(neighbor)),
+                        next(counter),
+                        neighbor,
+                    ),
+                )
+                pushes += 1
+            elif distance + cost == known:
+                predecessors[neighbor].append(node)
+    aoc2024.metrics.add(name="search.pops", count=pops)
+    aoc2024.metrics.add(name="search.pushes", count=pushes)
+    return Result(distances=distances, predecessors=predecessors, goals=goals)
+
+
+def dijkstra(
+    starts: collections.abc.Iterable[int],
+    iter_neighbor: Weighted,
+    is_goal: Goal | None = None,
+) -> Result:
+    return astar(starts=starts, iter_neighbor=iter_neighbor, is_goal=is_goal)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+import collections.abc
+import dataclasses
+import os
+import pathlib
+import sys
+import typing
+
+import aoc2024
+import aoc2024.inputcache
+import aoc2024.runner
+
+# Imported where used: it pulls in much of multiprocessing
+if typing.TYPE_CHECKING:
+    import multiprocessing.connection
+
+
+# Taken from the server's own environment (slow tasks as early as modules
+# import), so clients must ask for the same or be refused
+SETTING_ENVVARS = (
+    aoc2024.DO_SLOW_TASKS_ENVVAR,
+    aoc2024.inputcache.INPUT_CACHE_ENVVAR,
+    aoc2024.inputcache.INPUT_CACHE_MAX_BYTES_ENVVAR,
+)
+
+
+Settings = dict[str, str | None]
+Request = tuple[list[aoc2024.runner.Part], aoc2024.runner.Options, Settings]
+
+
+def get_settings() -> Settings:
+    return {name: os.environ.get(name) for name in SETTING_ENVVARS}
+
+
+@dataclasses.dataclass
+class Server:
+    address: str
+    # Source file stamps of the day modules as they were imported
+    module_name_to_stamp: dict[str, tuple[int, int]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def forget_stale(
+        self, parts: collections.abc.Iterable[aoc2024.runner.Part]
+    ) -> None:
+        # Dropping a changed module makes run_part import (and time) it afresh,
+        # which also throws away its warm caches; unchanged modules keep theirs
+        for module_name in {part.module_name for part in parts}:
+            _, _, name = module_name.partition(".")
+            stat = (pathlib.Path(__file__).parent / f"{name:s}.py").stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if self.module_name_to_stamp.get(module_name, stamp) != stamp:
+                sys.modules.pop(module_name, None)
+            self.module_name_to_stamp[module_name] = stamp
+
+    def handle(self, connection: multiprocessing.connection.Connection) -> None:
+        parts, options, settings = connection.recv()
+        if settings != (own := get_settings()):
+            # Refused rather than run under settings the client did not ask for
+            error = "RuntimeError: server runs with " + ", ".join(
+                f"{name:s}={own[name]!r} (not {settings.get(name)!r})"
+                for name in SETTING_ENVVARS
+                if own[name] != settings.get(name)
+            )
+            for part in sorted(parts):
+                connection.send(aoc2024.runner.Outcome(part=part, error=error))
+            connection.send(None)
+            return
+        self.forget_stale(parts=parts)
+        for outcome in aoc2024.runner.iter_outcome(
+            parts=parts, executor="process", jobs=1, options=options
+        ):
+            connection.send(outcome)
+        connection.send(None)
+
+    def serve_forever(self) -> None:
+        import multiprocessing.connection
+
+        path = pathlib.Path(self.address)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A previous server that died leaves its socket behind
+        path.unlink(missing_ok=True)
+        with multiprocessing.connection.Listener(
+            address=self.address, family="AF_UNIX"
+        ) as listener:
+            print(f"> Serving on {self.address:s} (pid {os.getpid():d})")
+            while True:
+                with listener.accept() as connection:
+                    try:
+                        self.handle(connection=connection)
+                    except (EOFError, BrokenPipeError, ConnectionResetError):
+                        # The client went away mid-run
+                        pass
+                    except Exception as e:
+                        # Only this request fails; the server keeps its caches
+                        print(f"! {type(e).__name__:s}: {e}", file=sys.stderr)
+
+
+def iter_outcome(
+    address: str,
+    parts: collections.abc.Iterable[aoc2024.runner.Part],
+    options: aoc2024.runner.Options,
+) -> collections.abc.Iterator[aoc2024.runner.Outcome]:
+    import multiprocessing.connection
+
+    with multiprocessing.connection.Client(address=address, family="AF_UNIX") as client:
+        request: Request = (list(parts), options, get_settings())
+        client.send(request)
+        while (outcome := client.recv()) is not None:
+            yield outcome
@@ -0,0 +1,28 @@
+import importlib
+import math
+import random
+import types
+
+import aoc2024.runner
+
+
+def get_count(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def get_side(base: int, scale: float) -> int:
+    # Grids grow in area, so each side only grows with the square root
+    return max(3, round(base * math.sqrt(scale)))
+
+
+def get_module(day: int) -> types.ModuleType:
+    return importlib.import_module(name=f"aoc2024.synth.day{day:02d}")
+
+
+def get_part_names(day: int) -> tuple[str, ...]:
+    # Parts that only make sense for the canonical input opt out via PART_NAMES
+    return getattr(get_module(day=day), "PART_NAMES", aoc2024.runner.PART_NAMES)
+
+
+def generate(day: int, scale: float, seed: int) -> str:
+    return get_module(day=day).generate(rng=random.Random(seed), scale=scale)
@@ -0,0 +1,10 @@
+import random
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    return "".join(
+        f"{rng.randrange(10_000, 100_000):d}   {rng.randrange(10_000, 100_000):d}\n"
+        for _ in range(aoc2024.synth.get_count(base=1000, scale=scale))
+    )
@@ -0,0 +1,20 @@
+import random
+
+import aoc2024.synth
+
+
+def iter_report(rng: random.Random) -> list[int]:
+    sign = rng.choice((-1, +1))
+    report = [rng.randrange(10, 90)]
+    for _ in range(rng.randrange(4, 8)):
+        # Mostly safe steps, with the occasional bad one
+        step = rng.choice((1, 2, 3)) if rng.random() < 0.9 else rng.choice((0, 4, 5))
+        report.append(report[-1] + sign * step)
+    return report
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    return "".join(
+        " ".join(map(str, iter_report(rng=rng))) + "\n"
+        for _ in range(aoc2024.synth.get_count(base=1000, scale=scale))
+    )
@@ -0,0 +1,34 @@
+import collections.abc
+import random
+import string
+
+import aoc2024.synth
+
+
+JUNK = string.ascii_letters + string.punctuation + " "
+
+
+def iter_chunk(rng: random.Random) -> collections.abc.Iterator[str]:
+    while True:
+        if (roll := rng.random()) < 0.05:
+            yield "do()"
+        elif roll < 0.1:
+            yield "don't()"
+        elif roll < 0.3:
+            yield f"mul({rng.randrange(1, 1000):d},{rng.randrange(1, 1000):d})"
+        elif roll < 0.35:
+            # Corrupted instructions that must not match
+            yield f"mul({rng.randrange(1, 1000):d}, {rng.randrange(1, 1000):d})"
+        else:
+            yield "".join(rng.choices(JUNK, k=rng.randrange(1, 8)))
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    size = aoc2024.synth.get_count(base=19_000, scale=scale)
+    chunks, length = [], 0
+    for chunk in iter_chunk(rng=rng):
+        if length >= size:
+            break
+        chunks.append(chunk)
+        length += len(chunk)
+    return "".join(chunks) + "\n"
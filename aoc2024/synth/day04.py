@@ -0,0 +1,8 @@
+import random
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    side = aoc2024.synth.get_side(base=140, scale=scale)
+    return "".join("".join(rng.choices("XMAS", k=side)) + "\n" for _ in range(side))
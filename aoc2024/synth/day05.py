@@ -0,0 +1,20 @@
+import random
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # Like the puzzle, every page comes before the next half of a circle, so
+    # each page has rules both ways
+    pages = rng.sample(range(10, 100), k=49)
+    rules = [
+        f"{before:d}|{pages[(idx + offset) % len(pages)]:d}\n"
+        for idx, before in enumerate(pages)
+        for offset in range(1, len(pages) // 2 + 1)
+    ]
+    rng.shuffle(rules)
+    updates = [
+        ",".join(map(str, rng.sample(pages, k=rng.randrange(5, 24, 2)))) + "\n"
+        for _ in range(aoc2024.synth.get_count(base=200, scale=scale))
+    ]
+    return "".join(rules) + "\n" + "".join(updates)
@@ -0,0 +1,30 @@
+import random
+
+import aoc2024.synth
+
+
+def escapes(rows: list[list[str]], idx: int, jdx: int) -> bool:
+    side, (delta_idx, delta_jdx), seen = len(rows), (-1, 0), set()
+    while (idx, jdx, delta_idx, delta_jdx) not in seen:
+        seen.add((idx, jdx, delta_idx, delta_jdx))
+        if not (0 <= idx + delta_idx < side and 0 <= jdx + delta_jdx < side):
+            return True
+        elif rows[idx + delta_idx][jdx + delta_jdx] == "#":
+            delta_idx, delta_jdx = delta_jdx, -delta_idx
+        else:
+            idx, jdx = idx + delta_idx, jdx + delta_jdx
+    return False
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    side = aoc2024.synth.get_side(base=130, scale=scale)
+    while True:
+        rows = [
+            ["#" if rng.random() < 0.02 else "." for _ in range(side)]
+            for _ in range(side)
+        ]
+        idx, jdx = rng.randrange(side), rng.randrange(side)
+        rows[idx][jdx] = "^"
+        # Part one assumes the guard leaves the map
+        if escapes(rows=rows, idx=idx, jdx=jdx):
+            return "".join("".join(row) + "\n" for row in rows)
@@ -0,0 +1,22 @@
+import random
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    lines = []
+    for _ in range(aoc2024.synth.get_count(base=850, scale=scale)):
+        operands = [rng.randrange(1, 1000) for _ in range(rng.randrange(3, 13))]
+        expected = operands[0]
+        for operand in operands[1:]:
+            if (op := rng.randrange(3)) == 0:
+                expected += operand
+            elif op == 1:
+                expected *= operand
+            else:
+                expected = int(f"{expected:d}{operand:d}")
+        if rng.random() < 0.5:
+            # Not every equation can be satisfied
+            expected += 1
+        lines.append(f"{expected:d}: {' '.join(map(str, operands)):s}\n")
+    return "".join(lines)
@@ -0,0 +1,15 @@
+import random
+import string
+
+import aoc2024.synth
+
+
+FREQUENCIES = string.digits + string.ascii_letters
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    side = aoc2024.synth.get_side(base=50, scale=scale)
+    rows = [["."] * side for _ in range(side)]
+    for _ in range(aoc2024.synth.get_count(base=200, scale=scale)):
+        rows[rng.randrange(side)][rng.randrange(side)] = rng.choice(FREQUENCIES)
+    return "".join("".join(row) + "\n" for row in rows)
@@ -0,0 +1,14 @@
+import random
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # Files alternate with free space, and there is always one more file
+    length = aoc2024.synth.get_count(base=10_000, scale=scale)
+    return (
+        "".join(
+            f"{rng.randrange(1, 10):d}{rng.randrange(0, 10):d}" for _ in range(length)
+        )
+        + f"{rng.randrange(1, 10):d}\n"
+    )
@@ -0,0 +1,16 @@
+import random
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # Diagonal ramps, nudged here and there, give plenty of trails
+    side = aoc2024.synth.get_side(base=45, scale=scale)
+    return "".join(
+        "".join(
+            str((idx + jdx + (rng.choice((-1, +1)) if rng.random() < 0.1 else 0)) % 10)
+            for jdx in range(side)
+        )
+        + "\n"
+        for idx in range(side)
+    )
@@ -0,0 +1,11 @@
+import random
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    stones = (
+        rng.randrange(10 ** rng.randrange(1, 8))
+        for _ in range(aoc2024.synth.get_count(base=8, scale=scale))
+    )
+    return " ".join(map(str, stones)) + "\n"
@@ -0,0 +1,17 @@
+import random
+import string
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # Overlapping rectangles of plants make irregular regions
+    side = aoc2024.synth.get_side(base=140, scale=scale)
+    rows = [["A"] * side for _ in range(side)]
+    for _ in range(aoc2024.synth.get_count(base=600, scale=scale)):
+        plant = rng.choice(string.ascii_uppercase)
+        idx, jdx = rng.randrange(side), rng.randrange(side)
+        height, width = rng.randrange(1, 12), rng.randrange(1, 12)
+        for row in rows[idx : idx + height]:
+            row[jdx : jdx + width] = [plant] * len(row[jdx : jdx + width])
+    return "".join("".join(row) + "\n" for row in rows)
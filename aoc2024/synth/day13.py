@@ -0,0 +1,18 @@
+import random
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    machines = []
+    for _ in range(aoc2024.synth.get_count(base=320, scale=scale)):
+        ax, ay, bx, by = (rng.randrange(10, 100) for _ in range(4))
+        a, b = rng.randrange(100), rng.randrange(100)
+        # Roughly a third of the prizes cannot be reached
+        px, py = a * ax + b * bx + rng.choice((0, 0, 1)), a * ay + b * by
+        machines.append(
+            f"Button A: X+{ax:d}, Y+{ay:d}\n"
+            f"Button B: X+{bx:d}, Y+{by:d}\n"
+            f"Prize: X={px:d}, Y={py:d}\n"
+        )
+    return "\n".join(machines)
@@ -0,0 +1,29 @@
+import random
+
+import aoc2024.synth
+
+
+HEIGHT, WIDTH = 103, 101
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # Part two runs until no two robots overlap, so plant a step at which
+    # that happens; there is only room for so many robots
+    count = min(aoc2024.synth.get_count(base=500, scale=scale), HEIGHT * WIDTH // 2)
+    while True:
+        steps = rng.randrange(HEIGHT * WIDTH)
+        robots = []
+        for position in rng.sample(range(HEIGHT * WIDTH), k=count):
+            vx, vy = rng.randrange(-100, 101), rng.randrange(-100, 101)
+            py, px = divmod(position, WIDTH)
+            robots.append(
+                ((px - steps * vx) % WIDTH, (py - steps * vy) % HEIGHT, vx, vy)
+            )
+        # The solver infers the room's size from the robots
+        if (
+            max(px for px, _, _, _ in robots) == WIDTH - 1
+            and max(py for _, py, _, _ in robots) == HEIGHT - 1
+        ):
+            return "".join(
+                f"p={px:d},{py:d} v={vx:d},{vy:d}\n" for px, py, vx, vy in robots
+            )
@@ -0,0 +1,29 @@
+import random
+
+import aoc2024.synth
+
+
+def get_cell(rng: random.Random, side: int, idx: int, jdx: int) -> str:
+    if idx in (0, side - 1) or jdx in (0, side - 1) or (roll := rng.random()) < 0.05:
+        return "#"
+    elif roll < 0.3:
+        return "O"
+    else:
+        return "."
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    side = aoc2024.synth.get_side(base=50, scale=scale)
+    rows = [
+        [get_cell(rng=rng, side=side, idx=idx, jdx=jdx) for jdx in range(side)]
+        for idx in range(side)
+    ]
+    rows[rng.randrange(1, side - 1)][rng.randrange(1, side - 1)] = "@"
+    moves = "".join(
+        rng.choices("^>v<", k=aoc2024.synth.get_count(base=20_000, scale=scale))
+    )
+    return (
+        "".join("".join(row) + "\n" for row in rows)
+        + "\n"
+        + "".join(moves[idx : idx + 1000] + "\n" for idx in range(0, len(moves), 1000))
+    )
@@ -0,0 +1,32 @@
+import random
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # A depth-first maze on the odd cells, with some walls knocked out so
+    # there are several best paths
+    side = aoc2024.synth.get_side(base=141, scale=scale) | 1
+    rows = [["#"] * side for _ in range(side)]
+    stack = [(side - 2, 1)]
+    rows[side - 2][1] = "."
+    while stack:
+        idx, jdx = stack[-1]
+        neighbors = [
+            (idx + delta_idx, jdx + delta_jdx)
+            for delta_idx, delta_jdx in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < idx + delta_idx < side - 1
+            and 0 < jdx + delta_jdx < side - 1
+            and rows[idx + delta_idx][jdx + delta_jdx] == "#"
+        ]
+        if not neighbors:
+            stack.pop()
+            continue
+        next_idx, next_jdx = rng.choice(neighbors)
+        rows[(idx + next_idx) // 2][(jdx + next_jdx) // 2] = "."
+        rows[next_idx][next_jdx] = "."
+        stack.append((next_idx, next_jdx))
+    for _ in range(side * side // 50):
+        rows[rng.randrange(1, side - 1)][rng.randrange(1, side - 1)] = "."
+    rows[side - 2][1], rows[1][side - 2] = "S", "E"
+    return "".join("".join(row) + "\n" for row in rows)
@@ -0,0 +1,37 @@
+import random
+
+import aoc2024.synth
+
+
+# Part two searches for a quine, which only the puzzle's own program has
+PART_NAMES = ("part_one",)
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # The usual shape: shift A by three bits and print one digit per loop
+    bits = 3 * aoc2024.synth.get_count(base=16, scale=scale)
+    program = (
+        2,
+        4,
+        1,
+        rng.randrange(8),
+        7,
+        5,
+        1,
+        rng.randrange(8),
+        4,
+        0,
+        0,
+        3,
+        5,
+        5,
+        3,
+        0,
+    )
+    return (
+        f"Register A: {rng.getrandbits(bits) | (1 << (bits - 1)):d}\n"
+        "Register B: 0\n"
+        "Register C: 0\n"
+        "\n"
+        f"Program: {','.join(map(str, program)):s}\n"
+    )
@@ -0,0 +1,16 @@
+import random
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # Part two bisects the first 4000 bytes, so always write at least that many
+    side = max(aoc2024.synth.get_side(base=71, scale=scale), 64)
+    cells = [
+        (idx, jdx)
+        for idx in range(side)
+        for jdx in range(side)
+        if (idx, jdx) not in ((0, 0), (side - 1, side - 1))
+    ]
+    count = min(max(aoc2024.synth.get_count(base=3450, scale=scale), 4000), len(cells))
+    return "".join(f"{idx:d},{jdx:d}\n" for idx, jdx in rng.sample(cells, k=count))
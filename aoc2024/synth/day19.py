@@ -0,0 +1,23 @@
+import random
+
+import aoc2024.synth
+
+
+COLORS = "wubrg"
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    patterns = sorted(
+        {"".join(rng.choices(COLORS, k=rng.randrange(1, 9))) for _ in range(450)}
+    )
+    designs = []
+    for _ in range(aoc2024.synth.get_count(base=400, scale=scale)):
+        design = ""
+        while len(design) < 40:
+            design += rng.choice(patterns)
+        if rng.random() < 0.3:
+            # Splice in a stripe that may not be coverable
+            position = rng.randrange(len(design))
+            design = design[:position] + rng.choice(COLORS) * 3 + design[position:]
+        designs.append(design)
+    return ", ".join(patterns) + "\n\n" + "".join(f"{design:s}\n" for design in designs)
@@ -0,0 +1,20 @@
+import random
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # A serpentine single-lane track; the walls between lanes invite cheats.
+    # The solver needs exactly one path, so only the size varies
+    side = aoc2024.synth.get_side(base=141, scale=scale) | 1
+    rows = [["#"] * side for _ in range(side)]
+    lanes = range(1, side - 1, 2)
+    for lane, idx in enumerate(lanes):
+        rows[idx][1 : side - 1] = ["."] * (side - 2)
+        if idx + 2 < side - 1:
+            # Alternate the turns between the right and the left edge
+            rows[idx + 1][side - 2 if lane % 2 == 0 else 1] = "."
+    first, last = lanes[0], lanes[-1]
+    rows[first][1] = "S"
+    rows[last][side - 2 if len(lanes) % 2 else 1] = "E"
+    return "".join("".join(row) + "\n" for row in rows)
@@ -0,0 +1,30 @@
+import itertools
+import random
+
+import aoc2024.synth
+
+
+KEY_TO_POSITION = {
+    key: (x, y)
+    for y, row in enumerate(("789", "456", "123", " 0A"))
+    for x, key in enumerate(row)
+    if key != " "
+}
+
+
+def is_straight(code: str) -> bool:
+    # The solver enumerates every shortest path, which explodes on diagonal
+    # moves, so keep each press in line with the previous one
+    return all(
+        KEY_TO_POSITION[before][0] == KEY_TO_POSITION[after][0]
+        or KEY_TO_POSITION[before][1] == KEY_TO_POSITION[after][1]
+        for before, after in itertools.pairwise("A" + code)
+    )
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    codes: list[str] = []
+    while len(codes) < aoc2024.synth.get_count(base=5, scale=scale):
+        if is_straight(code := f"{rng.randrange(1, 1000):03d}A"):
+            codes.append(code)
+    return "".join(f"{code:s}\n" for code in codes)
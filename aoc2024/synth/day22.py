@@ -0,0 +1,10 @@
+import random
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    return "".join(
+        f"{rng.randrange(1, 1 << 24):d}\n"
+        for _ in range(aoc2024.synth.get_count(base=1881, scale=scale))
+    )
@@ -0,0 +1,28 @@
+import itertools
+import random
+import string
+
+import aoc2024.synth
+
+
+def get_name(index: int) -> str:
+    # Two letters like the puzzle while they last, then three
+    length = 2 if index < 26**2 else 3
+    return "".join(
+        string.ascii_lowercase[(index // 26**position) % 26]
+        for position in reversed(range(length))
+    )
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = aoc2024.synth.get_count(base=520, scale=scale)
+    names = [get_name(index=index) for index in range(count)]
+    edges = set()
+    for left in names:
+        for right in rng.sample(names, k=min(3, count)):
+            if left != right:
+                edges.add((left, right))
+    # Plant the party the second part looks for
+    for left, right in itertools.combinations(rng.sample(names, k=min(13, count)), r=2):
+        edges.add((left, right))
+    return "".join(f"{left:s}-{right:s}\n" for left, right in edges)
@@ -0,0 +1,43 @@
+import random
+
+import aoc2024.synth
+
+
+# Part two hard-codes the wires swapped in the puzzle's own circuit
+PART_NAMES = ("part_one",)
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # A ripple-carry adder with shuffled gates and random internal names
+    bits = aoc2024.synth.get_count(base=45, scale=scale)
+    # Internal wires must not start with x, y or z
+    names = iter(rng.sample(range(23 * 26**2), k=5 * bits))
+
+    def get_name() -> str:
+        index = next(names)
+        return "".join(chr(ord("a") + (index // 26**p) % 26) for p in (2, 1, 0))
+
+    inputs = [
+        f"{wire:s}{bit:02d}: {rng.randrange(2):d}\n"
+        for wire in "xy"
+        for bit in range(bits)
+    ]
+    gates, carry = [], None
+    for bit in range(bits):
+        x, y, z = f"x{bit:02d}", f"y{bit:02d}", f"z{bit:02d}"
+        if carry is None:
+            carry = get_name()
+            gates += [f"{x:s} XOR {y:s} -> {z:s}", f"{x:s} AND {y:s} -> {carry:s}"]
+            continue
+        half, both, through, next_carry = get_name(), get_name(), get_name(), get_name()
+        gates += [
+            f"{x:s} XOR {y:s} -> {half:s}",
+            f"{half:s} XOR {carry:s} -> {z:s}",
+            f"{x:s} AND {y:s} -> {both:s}",
+            f"{half:s} AND {carry:s} -> {through:s}",
+            f"{both:s} OR {through:s} -> {next_carry:s}",
+        ]
+        carry = next_carry
+    gates[-1] = gates[-1].replace(f"-> {carry:s}", f"-> z{bits:02d}")
+    rng.shuffle(gates)
+    return "".join(inputs) + "\n" + "".join(f"{gate:s}\n" for gate in gates)
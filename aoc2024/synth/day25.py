@@ -0,0 +1,19 @@
+import random
+
+import aoc2024.synth
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    schematics = []
+    for _ in range(aoc2024.synth.get_count(base=500, scale=scale)):
+        heights = [rng.randrange(6) for _ in range(5)]
+        rows = [
+            "".join("#" if height >= level else "." for height in heights)
+            for level in range(1, 6)
+        ]
+        if rng.random() < 0.5:
+            # Locks hang from the top, keys rise from the bottom
+            schematics.append("\n".join(("#####", *rows, ".....")))
+        else:
+            schematics.append("\n".join((".....", *reversed(rows), "#####")))
+    return "\n\n".join(schematics) + "\n"
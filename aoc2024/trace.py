@@ -0,0 +1,119 @@
+from __future__ import annotations
+import collections
+import collections.abc
+import contextlib
+import dataclasses
+import json
+import sys
+import threading
+import typing
+
+
+# How long the consumer sleeps between drains; events wait in the buffer
+INTERVAL_SECONDS = 0.05
+
+
+# Set by the runner for parts run with --trace. Like metrics, hot sites guard
+# on this flag, so with tracing off an event costs one attribute lookup and
+# its arguments are never even built
+ENABLED = False
+# Appending to and popping from a deque are atomic, so solvers and the
+# consumer share it without a lock
+EVENTS: collections.deque[tuple[str, tuple]] = collections.deque()
+
+
+def emit(kind: str, *args: typing.Any) -> None:
+    # Kinds the frames format understands:
+    #   grid (width, cells) starts a frame from a string of cells
+    #   points (height, width, indices) starts one from counts per cell
+    #   put (index, char) changes one cell of the frame
+    #   note (text) is written as is
+    #   show () writes the frame
+    if ENABLED:
+        EVENTS.append((kind, args))
+
+
+@dataclasses.dataclass
+class Canvas:
+    cells: list[str] = dataclasses.field(default_factory=list)
+    width: int = 1
+
+    def apply(self, kind: str, args: tuple) -> str | None:
+        if kind == "grid":
+            self.width, cells = args
+            self.cells = list(cells)
+        elif kind == "points":
+            height, self.width, indices = args
+            counts = collections.Counter(indices)
+            self.cells = [
+                str(counts[index]) if index in counts else "."
+                for index in range(height * self.width)
+            ]
+        elif kind == "put":
+            index, char = args
+            self.cells[index] = char
+        elif kind == "note":
+            return args[0]
+        elif kind == "show":
+            return "\n".join(
+                "".join(self.cells[start : start + self.width])
+                for start in range(0, len(self.cells), self.width)
+            )
+        return None
+
+
+@dataclasses.dataclass
+class Consumer:
+    f: typing.TextIO
+    format: str
+    title: str
+    canvas: Canvas = dataclasses.field(default_factory=Canvas)
+    stop: threading.Event = dataclasses.field(default_factory=threading.Event)
+
+    def write(self, events: list[tuple[str, tuple]]) -> None:
+        if self.format == "events":
+            lines = (
+                json.dumps({"part": self.title, "kind": kind, "args": args})
+                for kind, args in events
+            )
+        else:
+            lines = (
+                line
+                for kind, args in events
+                if (line := self.canvas.apply(kind=kind, args=args)) is not None
+            )
+        for line in lines:
+            print(line, file=self.f)
+
+    def drain(self) -> None:
+        # Only what is buffered now; anything emitted meanwhile waits a turn
+        events = [EVENTS.popleft() for _ in range(len(EVENTS))]
+        if events:
+            self.write(events=events)
+
+    def run(self) -> None:
+        while not self.stop.wait(timeout=INTERVAL_SECONDS):
+            self.drain()
+        self.drain()
+
+
+@contextlib.contextmanager
+def tracing(path: str, format: str, title: str) -> collections.abc.Iterator[None]:
+    # Parts running in other processes append to the same file
+    global ENABLED
+    with (
+        open(file=path, mode="a") if path != "-" else contextlib.nullcontext(sys.stderr)
+    ) as f:
+        if format == "frames":
+            print(f"> {title:s}", file=f)
+        consumer = Consumer(f=f, format=format, title=title)
+        thread = threading.Thread(target=consumer.run, daemon=True)
+        EVENTS.clear()
+        ENABLED = True
+        thread.start()
+        try:
+            yield
+        finally:
+            ENABLED = False
+            consumer.stop.set()
+            thread.join()
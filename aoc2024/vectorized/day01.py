@@ -0,0 +1,19 @@
+import collections.abc
+
+import numpy as np
+
+
+def get_total_distance(
+    lefts: collections.abc.Sequence[int], rights: collections.abc.Sequence[int]
+) -> int:
+    return int(np.abs(np.sort(lefts) - np.sort(rights)).sum())
+
+
+def get_similarity_score(
+    lefts: collections.abc.Sequence[int], rights: collections.abc.Sequence[int]
+) -> int:
+    left_values = np.asarray(lefts)
+    values, counts = np.unique(rights, return_counts=True)
+    indices = np.searchsorted(values, left_values).clip(max=len(values) - 1)
+    matches = values[indices] == left_values
+    return int((left_values * counts[indices] * matches).sum())
@@ -0,0 +1,29 @@
+import collections
+
+import numpy as np
+
+
+def get_safe(diffs: np.ndarray) -> np.ndarray:
+    # One verdict per row of level differences
+    return np.logical_or(
+        ((diffs >= 1) & (diffs <= 3)).all(axis=1),
+        ((diffs <= -1) & (diffs >= -3)).all(axis=1),
+    )
+
+
+def count_safe(rows: list[tuple[int, ...]], dampen: bool) -> int:
+    # Rows only stack into a matrix with others of the same length
+    length_to_rows = collections.defaultdict(list)
+    for row in rows:
+        length_to_rows[len(row)].append(row)
+    safe = 0
+    for length, grouped in length_to_rows.items():
+        levels = np.array(grouped)
+        is_safe = get_safe(diffs=np.diff(levels, axis=1))
+        if dampen:
+            for idx in range(length):
+                is_safe |= get_safe(
+                    diffs=np.diff(np.delete(levels, idx, axis=1), axis=1)
+                )
+        safe += int(is_safe.sum())
+    return safe
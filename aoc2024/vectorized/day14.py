@@ -0,0 +1,32 @@
+import numpy as np
+
+import aoc2024.day14
+
+
+def get_arrays(robots: list[aoc2024.day14.Robot]) -> tuple[np.ndarray, ...]:
+    return tuple(
+        np.array([getattr(robot, name) for robot in robots])
+        for name in ("px", "py", "vx", "vy")
+    )
+
+
+def advance(
+    height: int, robots: list[aoc2024.day14.Robot], seconds: int, width: int
+) -> None:
+    px, py, vx, vy = get_arrays(robots=robots)
+    px = (px + seconds * vx) % width
+    py = (py + seconds * vy) % height
+    for robot, x, y in zip(robots, px.tolist(), py.tolist(), strict=True):
+        robot.px, robot.py = x, y
+
+
+def count_seconds_to_easter_egg(
+    height: int, robots: list[aoc2024.day14.Robot], width: int
+) -> int:
+    px, py, vx, vy = get_arrays(robots=robots)
+    # Positions repeat after height * width seconds
+    for steps in range(height * width):
+        cells = ((py + steps * vy) % height) * width + (px + steps * vx) % width
+        if np.bincount(cells, minlength=height * width).max() == 1:
+            return steps
+    raise ValueError("The robots never spread out")
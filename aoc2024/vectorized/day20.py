@@ -0,0 +1,22 @@
+import numpy as np
+
+import aoc2024.day20
+
+
+def count_cheats(track: aoc2024.day20.Track, skip_distance: int, minimum: int) -> int:
+    depths = np.asarray(track.get_depths())
+    # Cells of the honest path in the order it visits them
+    (indices,) = np.nonzero(depths >= 0)
+    indices = indices[np.argsort(depths[indices])]
+    idxs, jdxs = np.divmod(indices, track.grid.width)
+    count = 0
+    # A cheat between two cells `ahead` steps apart along the path saves
+    # `ahead` less its Manhattan length, so check every pair at that gap at once
+    for ahead in range(minimum + 1, len(indices)):
+        distances = np.abs(idxs[ahead:] - idxs[:-ahead]) + np.abs(
+            jdxs[ahead:] - jdxs[:-ahead]
+        )
+        count += int(
+            ((distances <= skip_distance) & (ahead - distances >= minimum)).sum()
+        )
+    return count
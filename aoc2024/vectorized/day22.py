@@ -0,0 +1,51 @@
+import collections.abc
+
+import numpy as np
+
+import aoc2024.day22
+
+
+PRUNE = 16777216 - 1
+# Four price changes in -9..9 pack into one base-19 number
+KEYS = 19**4
+
+
+def iter_secrets(
+    secrets: collections.abc.Sequence[int], rounds: int
+) -> collections.abc.Iterator[np.ndarray]:
+    # Every buyer advances at once; the modulus is a power of two, so it masks
+    current = np.asarray(secrets, dtype=np.int64)
+    yield current
+    for _ in range(rounds):
+        current = (current ^ (current << 6)) & PRUNE
+        current = (current ^ (current >> 5)) & PRUNE
+        current = (current ^ (current << 11)) & PRUNE
+        yield current
+
+
+def get_secret_total(buyers: aoc2024.day22.Buyers) -> int:
+    *_, last = iter_secrets(secrets=buyers.secrets, rounds=buyers.rounds)
+    return int(last.sum())
+
+
+def get_best_price_total(buyers: aoc2024.day22.Buyers) -> int:
+    prices = (
+        np.stack(
+            list(iter_secrets(secrets=buyers.secrets, rounds=buyers.rounds)), axis=1
+        )
+        % 10
+    )
+    changes = np.diff(prices, axis=1) + 9
+    keys = (
+        changes[:, :-3] * 19**3
+        + changes[:, 1:-2] * 19**2
+        + changes[:, 2:-1] * 19
+        + changes[:, 3:]
+    )
+    # Only the first time a buyer sees a sequence counts
+    rows = np.arange(len(keys))[:, np.newaxis]
+    _, first = np.unique((rows * KEYS + keys).ravel(), return_index=True)
+    totals = np.bincount(
+        keys.ravel()[first], weights=prices[:, 4:].ravel()[first], minlength=KEYS
+    )
+    return int(totals.max())